@@ -35,21 +35,57 @@ async def demonstrate_solution():
     async def execute_query(tx):
         result = await tx.run(query, params)
         # Process the results INSIDE the transaction
-        records = await result.data()  # or result.values()
+        record = await result.single()  # one row expected
         
         # Return the processed data
-        if records and len(records) > 0:
-            return records[0].get("fieldName", default_value)
+        if record:
+            return record.get("fieldName", default_value)
         return default_value
     
-    # execute_write returns what the function returns
-    processed_result = await session.execute_write(execute_query)
+    # Reads: execute_read returns what the function returns
+    processed_result = await session.execute_read(execute_query)
+    
+    # Writes: same pattern, but through execute_write
+    async def execute_mutation(tx):
+        result = await tx.run(write_query, params)
+        summary = await result.consume()  # Also INSIDE the transaction
+        return summary.counters.nodes_deleted
+    
+    deleted_count = await session.execute_write(execute_mutation)
+    
+    # Many rows: stream the cursor instead of buffering it with result.data(),
+    # folding each record into the answer as it arrives
+    async def count_observations(tx):
+        result = await tx.run(observation_query, params)
+        total = 0
+        async for record in result:
+            total += record["observationCount"]
+        return total
+    
+    total = await session.execute_read(count_observations)
+    
+    # Hot paths: define the transaction function once at module scope and
+    # pass the query and params as extra arguments, so no lambda or closure
+    # is allocated per call
+    async def run_query(tx, query, params=None):
+        result = await tx.run(query, params or {})
+        return await result.data()
+    
+    records = await session.execute_read(run_query, QUERY, params)
     """)
     
     print("\nWhy this works:")
     print("1. The async function processes results within the transaction")
     print("2. It returns the processed data, not the result object")
-    print("3. execute_write() returns this processed data after closing the transaction")
+    print("3. execute_read()/execute_write() return this processed data after closing the transaction")
+    print("4. Extra arguments to execute_read()/execute_write() are passed on to the function,")
+    print("   so a module-level function can be reused without wrapping it in a lambda")
+    
+    print("\nChoosing read vs write:")
+    print("- Use execute_read() for queries that only MATCH/RETURN")
+    print("- Use execute_write() only for mutations (CREATE/MERGE/SET/DELETE)")
+    print("- In a causal cluster, execute_read() is routed to read replicas/followers,")
+    print("  leaving the leader free for writes; on a single instance it behaves the same")
 
 async def main():
     print("Neo4j Transaction Scope Diagnostic")
@@ -5,14 +5,15 @@ Test script to verify Neo4j transaction scope fixes in NeoCoder
 
 import asyncio
 import logging
-from neo4j import AsyncGraphDatabase
 import sys
 import os
+from contextlib import AsyncExitStack
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from mcp_neocoder.incarnations.knowledge_graph_incarnation import KnowledgeGraphIncarnation
+from mcp_neocoder.driver import get_driver
 from mcp_neocoder.event_loop_manager import initialize_main_loop
 
 # Set up logging
@@ -25,8 +26,6 @@ async def test_delete_entities():
     initialize_main_loop()
     
     # Connection details from environment variables
-    uri = os.environ.get("NEO4J_URL", "bolt://localhost:7687")
-    username = os.environ.get("NEO4J_USERNAME", "neo4j")
     password = os.environ.get("NEO4J_PASSWORD")
     database = os.environ.get("NEO4J_DATABASE", "neo4j")
     
@@ -36,17 +35,15 @@ async def test_delete_entities():
         logger.info("export NEO4J_PASSWORD='your_password_here'")
         return
     
-    driver = None
     try:
-        # Create driver
-        logger.info("Creating Neo4j driver...")
-        driver = AsyncGraphDatabase.driver(uri, auth=(username, password))
+        # Reuse the shared, pooled driver (closed at process exit, not per test)
+        logger.info("Getting shared Neo4j driver...")
+        driver = get_driver()
         
         # Create incarnation instance
         incarnation = KnowledgeGraphIncarnation(driver, database)
         
-        # Test 1: Create test entities
-        logger.info("Creating test entities...")
+        # Test entities used by the lifecycle check
         test_entities = [
             {
                 "name": "TestEntity1",
@@ -60,29 +57,47 @@ async def test_delete_entities():
             }
         ]
         
-        result = await incarnation.create_entities(entities=test_entities)
-        logger.info(f"Create result: {result[0].text}")
+        names = ["TestEntity1", "TestEntity2"]
         
-        # Test 2: Delete entities
-        logger.info("Testing delete_entities...")
-        delete_result = await incarnation.delete_entities(entityNames=["TestEntity1", "TestEntity2"])
-        logger.info(f"Delete result: {delete_result[0].text}")
-        
-        # Test 3: Verify deletion by trying to read
-        logger.info("Verifying deletion...")
-        read_result = await incarnation.open_nodes(names=["TestEntity1", "TestEntity2"])
-        logger.info(f"Read result: {read_result[0].text}")
+        # One session serves the lifecycle transaction and the follow-up read
+        async with AsyncExitStack() as stack:
+            session = await stack.enter_async_context(driver.session(database=database))
+            
+            # Create, delete and re-read inside one explicit transaction
+            logger.info("Testing create/delete/read lifecycle in one transaction...")
+            async with await session.begin_transaction() as tx:
+                lifecycle = await incarnation.run_lifecycle(tx, test_entities, names)
+                await tx.commit()
+            
+            logger.info("Created: %s", lifecycle['created'])
+            logger.info("Delete report: %s", lifecycle['report'])
+            
+            not_deleted = [entry["name"] for entry in lifecycle["report"] if not entry["deleted"]]
+            if not_deleted or lifecycle["remaining"]:
+                raise AssertionError(f"Entities were not deleted: {not_deleted or lifecycle['remaining']}")
+            
+            # Repeat the round trip through the public tools on the same session;
+            # delete_entities takes the index-hinted UNWIND delete when it can
+            stack.enter_context(incarnation.use_session(session))
+            
+            logger.info("Testing create_entities/delete_entities tools...")
+            created = await incarnation.create_entities(entities=test_entities)
+            logger.info("Create result: %s", created[0].text)
+            
+            deleted = await incarnation.delete_entities(entityNames=names)
+            logger.info("Delete result: %s", deleted[0].text)
+            if not deleted[0].text.startswith(f"Successfully deleted {len(names)} entities"):
+                raise AssertionError(f"delete_entities did not delete both entities: {deleted[0].text}")
+            
+            result = await incarnation.open_nodes(names=names)
+            logger.info("Open result: %s", result[0].text)
         
         logger.info("All tests completed successfully!")
         
     except Exception as e:
-        logger.error(f"Test failed: {e}")
+        logger.error("Test failed: %s", e)
         import traceback
         traceback.print_exc()
-    finally:
-        if driver:
-            await driver.close()
-            logger.info("Driver closed")
 
 if __name__ == "__main__":
     asyncio.run(test_delete_entities())
@@ -1,135 +1,175 @@
 #!/usr/bin/env python3
 """
-Fix all transaction scope and missing await issues in the codebase
+Fix transaction scope issues in the codebase with a libcst codemod
+
+Finds every `session.execute_write(lambda tx: ...)` / `session.execute_read(lambda tx: ...)`
+call and replaces the lambda with a named async transaction function hoisted just above
+the statement. When the lambda returns `tx.run(...)`, the new function reads the records
+with `await result.data()` so they are consumed inside the transaction scope.
+
+Usage:
+    python transaction_issues_summary.py            # show a diff of the proposed fixes
+    python transaction_issues_summary.py --write    # apply the fixes in place
+    python transaction_issues_summary.py FILE ...   # limit the run to specific files
 """
 
-import os
-import re
-
-def fix_transaction_issues():
-    """Fix all transaction scope and missing await issues"""
-    
-    fixes = [
-        # base_incarnation.py
-        {
-            "file": "/home/ty/Repositories/NeoCoder-neo4j-ai-workflow/src/mcp_neocoder/incarnations/base_incarnation.py",
-            "fixes": [
-                {
-                    "line": 229,
-                    "old": "        records = await result.data()  # Use .data() instead of .to_eager_result().records",
-                    "new": "        records = await result.data()  # Use .data() instead of .to_eager_result().records"
-                }
-            ]
-        },
-        # knowledge_graph_incarnation.py  
-        {
-            "file": "/home/ty/Repositories/NeoCoder-neo4j-ai-workflow/src/mcp_neocoder/incarnations/knowledge_graph_incarnation.py",
-            "fixes": [
-                {
-                    "line": 427,
-                    "old": "                    records = await result.data()",
-                    "new": "                    records = await result.data()"
-                },
-                {
-                    "line": 554,
-                    "old": "                    records = await result.data()  # Fixed: use .data() instead of .records()",
-                    "new": "                    records = await result.data()  # Fixed: use .data() instead of .records()"
-                },
-                {
-                    "line": 630,
-                    "old": "                    records = await result.data()  # Fixed: use .data() instead of .records()",
-                    "new": "                    records = await result.data()  # Fixed: use .data() instead of .records()"
-                },
-                {
-                    "line": 631,
-                    "old": "                    result_data = []",
-                    "new": "                    result_data = []"
-                },
-                {
-                    "line": 718,
-                    "old": "                    records = await result.data()  # Fixed: use .data() instead of .records()",
-                    "new": "                    records = await result.data()  # Fixed: use .data() instead of .records()"
-                }
-            ]
-        },
-        # data_analysis_incarnation.py
-        {
-            "file": "/home/ty/Repositories/NeoCoder-neo4j-ai-workflow/src/mcp_neocoder/incarnations/data_analysis_incarnation.py",
-            "fixes": [
-                {
-                    "line": 655,
-                    "old": "                    records = await result.data()",
-                    "new": "                    records = await result.data()"
-                },
-                {
-                    "line": 706,
-                    "old": "                    records = await result.data()",
-                    "new": "                    records = await result.data()"
-                }
-            ]
-        },
-        # decision_incarnation.py
-        {
-            "file": "/home/ty/Repositories/NeoCoder-neo4j-ai-workflow/src/mcp_neocoder/incarnations/decision_incarnation.py",
-            "fixes": [
-                {
-                    "line": 167,
-                    "old": "                    return await result.data()",
-                    "new": "                    return await result.data()"
-                }
-            ]
-        },
-        # server.py - These need major fixes for transaction scope
-        {
-            "file": "/home/ty/Repositories/NeoCoder-neo4j-ai-workflow/src/mcp_neocoder/server.py",
-            "fixes": [
-                {
-                    "lines": [1004, 1005, 1006],
-                    "description": "Fix read test - result accessed outside transaction",
-                    "needs_manual_fix": True
-                },
-                {
-                    "lines": [1023, 1024],
-                    "description": "Fix write test - result accessed outside transaction", 
-                    "needs_manual_fix": True
-                },
-                {
-                    "lines": [1039, 1040],
-                    "description": "Fix info query - result accessed outside transaction",
-                    "needs_manual_fix": True
-                },
-                {
-                    "lines": [1590, 1591],
-                    "description": "Fix driver verification - result accessed outside transaction",
-                    "needs_manual_fix": True
-                },
-                {
-                    "lines": [1815, 1816],
-                    "description": "Fix connectivity test - result accessed outside transaction",
-                    "needs_manual_fix": True
-                }
+import argparse
+import difflib
+import sys
+from pathlib import Path
+from typing import List, Optional, Union
+
+try:
+    import libcst as cst
+except ImportError:
+    sys.exit("libcst is required for this script; install it with `pip install libcst` or the dev extra")
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+# Files that were known to carry transaction scope issues
+TARGET_FILES = [
+    "src/mcp_neocoder/incarnations/base_incarnation.py",
+    "src/mcp_neocoder/incarnations/knowledge_graph_incarnation.py",
+    "src/mcp_neocoder/incarnations/data_analysis_incarnation.py",
+    "src/mcp_neocoder/incarnations/decision_incarnation.py",
+    "src/mcp_neocoder/server.py",
+]
+
+TRANSACTION_METHODS = {"execute_write", "execute_read"}
+
+
+class LambdaTransactionTransformer(cst.CSTTransformer):
+    """Hoist lambdas passed to session.execute_write/execute_read into async functions."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.fixed = 0
+        # One list of hoisted functions per enclosing statement line
+        self._pending: List[List[cst.FunctionDef]] = []
+
+    def visit_SimpleStatementLine(self, node: cst.SimpleStatementLine) -> bool:
+        self._pending.append([])
+        return True
+
+    def leave_SimpleStatementLine(
+        self, original_node: cst.SimpleStatementLine, updated_node: cst.SimpleStatementLine
+    ) -> Union[cst.SimpleStatementLine, cst.FlattenSentinel[cst.BaseStatement]]:
+        hoisted = self._pending.pop()
+        if not hoisted:
+            return updated_node
+        return cst.FlattenSentinel([*hoisted, updated_node])
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.Call:
+        func = updated_node.func
+        if not (
+            isinstance(func, cst.Attribute)
+            and isinstance(func.value, cst.Name)
+            and func.value.value == "session"
+            and func.attr.value in TRANSACTION_METHODS
+        ):
+            return updated_node
+
+        if not updated_node.args or not isinstance(updated_node.args[0].value, cst.Lambda):
+            return updated_node
+
+        # Calls outside a simple statement (e.g. in a `with` header) have nowhere to hoist to
+        if not self._pending:
+            return updated_node
+
+        self.fixed += 1
+        name = f"_{func.attr.value}_tx_{self.fixed}"
+        self._pending[-1].append(self._build_function(name, updated_node.args[0].value))
+
+        first_arg = updated_node.args[0].with_changes(value=cst.Name(name))
+        return updated_node.with_changes(args=[first_arg, *updated_node.args[1:]])
+
+    @staticmethod
+    def _build_function(name: str, lam: cst.Lambda) -> cst.FunctionDef:
+        """Build an async transaction function equivalent to the lambda."""
+        tx_param = lam.params.params[0].name.value if lam.params.params else None
+
+        if tx_param and _is_tx_run(lam.body, tx_param):
+            # Consume the result inside the transaction instead of returning the cursor
+            body = [
+                cst.parse_statement(f"result = await {_code(lam.body)}"),
+                cst.parse_statement("records = await result.data()"),
+                cst.parse_statement("return records"),
             ]
-        }
-    ]
-    
-    return fixes
+        else:
+            body = [cst.parse_statement(f"return await {_code(lam.body)}")]
+
+        return cst.FunctionDef(
+            name=cst.Name(name),
+            params=lam.params,
+            body=cst.IndentedBlock(body=body),
+            asynchronous=cst.Asynchronous(),
+        )
+
+
+def _code(node: cst.CSTNode) -> str:
+    return cst.Module(body=[]).code_for_node(node)
+
+
+def _is_tx_run(node: cst.BaseExpression, tx_param: str) -> bool:
+    """Return True if node is a `<tx>.run(...)` call."""
+    return (
+        isinstance(node, cst.Call)
+        and isinstance(node.func, cst.Attribute)
+        and isinstance(node.func.value, cst.Name)
+        and node.func.value.value == tx_param
+        and node.func.attr.value == "run"
+    )
+
+
+def fix_file(path: Path, write: bool) -> Optional[int]:
+    """Run the codemod on one file, returning the number of calls fixed."""
+    source = path.read_text()
+    try:
+        module = cst.parse_module(source)
+    except cst.ParserSyntaxError as e:
+        print(f"  ! Could not parse {path}: {e}")
+        return None
+
+    transformer = LambdaTransactionTransformer()
+    fixed_source = module.visit(transformer).code
+
+    if transformer.fixed:
+        if write:
+            path.write_text(fixed_source)
+        else:
+            sys.stdout.writelines(difflib.unified_diff(
+                source.splitlines(keepends=True),
+                fixed_source.splitlines(keepends=True),
+                fromfile=str(path),
+                tofile=str(path),
+            ))
+
+    return transformer.fixed
+
 
 def main():
-    fixes = fix_transaction_issues()
-    
-    print("Transaction Scope and Await Issues Found:")
+    parser = argparse.ArgumentParser(description="Fix lambda transaction functions with a libcst codemod")
+    parser.add_argument("files", nargs="*", help="Files to fix (defaults to the known problem files)")
+    parser.add_argument("--write", action="store_true", help="Apply the fixes instead of printing a diff")
+    args = parser.parse_args()
+
+    paths = [Path(f) for f in args.files] or [REPO_ROOT / f for f in TARGET_FILES]
+
+    print("Transaction Scope Fixes:")
     print("=" * 50)
-    
-    for file_info in fixes:
-        print(f"\n{file_info['file']}:")
-        for fix in file_info['fixes']:
-            if 'needs_manual_fix' in fix and fix['needs_manual_fix']:
-                print(f"  - Lines {fix['lines']}: {fix['description']}")
-            else:
-                print(f"  - Line {fix['line']}: Verify await is present")
-    
-    print("\n\nThe main issues are in server.py where results are accessed outside transaction scope.")
-    print("These need to be fixed by moving the result access inside the transaction function.")
+
+    total = 0
+    for path in paths:
+        if not path.exists():
+            print(f"  ! Skipping missing file {path}")
+            continue
+        fixed = fix_file(path, args.write)
+        if fixed:
+            total += fixed
+            print(f"\n{path}: {fixed} lambda transaction function(s) {'fixed' if args.write else 'to fix'}")
+
+    print(f"\nTotal: {total}")
+
 
 if __name__ == "__main__":
     main()
@@ -4,18 +4,398 @@ Initialize the Neo4j database for NeoCoder with the required data structure and
 This script bypasses the MCP server to directly write to the Neo4j database.
 """
 
+import asyncio
 import os
 import sys
-import time
 import logging
-from pathlib import Path
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def main():
+# Independent steps run concurrently on their own sessions, one connection each
+DRIVER_CONFIG = {
+    "max_connection_pool_size": 16,
+    "connection_acquisition_timeout": 30.0,
+}
+
+# Declarative schema: (name, label, properties) for each uniqueness
+# constraint and index, created before any data is written
+SCHEMA_CONSTRAINTS = [
+    ("unique_action_template_current", "ActionTemplate", ("keyword", "isCurrent")),
+    ("unique_project_id", "Project", ("projectId",)),
+    ("unique_workflow_execution_id", "WorkflowExecution", ("id",)),
+]
+
+SCHEMA_INDEXES = [
+    ("action_template_keyword", "ActionTemplate", ("keyword",)),
+    ("file_path", "File", ("path",)),
+]
+
+
+def _property_list(properties):
+    """Render properties as `n.a` or `(n.a, n.b)` for schema DDL."""
+    rendered = ", ".join(f"n.{prop}" for prop in properties)
+    return rendered if len(properties) == 1 else f"({rendered})"
+
+
+# DDL keyed by schema name, built once at import
+SCHEMA_QUERIES = {
+    **{
+        name: f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE {_property_list(props)} IS UNIQUE"
+        for name, label, props in SCHEMA_CONSTRAINTS
+    },
+    **{
+        name: f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON ({', '.join(f'n.{prop}' for prop in props)})"
+        for name, label, props in SCHEMA_INDEXES
+    },
+}
+
+
+async def _existing_schema_names(tx):
+    """Return the names of the constraints and indexes already in the database."""
+    names = set()
+    for query in ("SHOW CONSTRAINTS YIELD name", "SHOW INDEXES YIELD name"):
+        result = await tx.run(query)
+        names.update([record["name"] async for record in result])
+    return names
+
+
+async def _create_schema(tx, queries):
+    """Create the given constraints and indexes in one transaction."""
+    for query in queries:
+        await tx.run(query)
+
+
+async def _ensure_schema(session):
+    """Create whichever schema entries are missing, skipping the write if none are."""
+    existing = await session.execute_read(_existing_schema_names)
+    missing = [query for name, query in SCHEMA_QUERIES.items() if name not in existing]
+    if missing:
+        await session.execute_write(_create_schema, missing)
+    logger.info(f"Schema ready ({len(missing)} of {len(SCHEMA_QUERIES)} constraints and indexes created)")
+
+
+# Guide node labels; labels cannot be parameters, so each gets its own
+# FOREACH branch that only runs for rows carrying that label
+GUIDE_LABELS = ("BestPracticesGuide", "TemplatingGuide", "SystemUsageGuide")
+
+CREATE_GUIDES_QUERY = """
+MERGE (hub:AiGuidanceHub {id: 'main_hub'})
+ON CREATE SET hub.description = $hub_description
+WITH hub
+UNWIND $guides AS g
+""" + "".join(f"""
+FOREACH (_ IN CASE WHEN g.label = '{label}' THEN [1] ELSE [] END |
+    MERGE (n:{label} {{id: g.id}})
+    ON CREATE SET n.content = g.content
+    MERGE (hub)-[:LINKS_TO]->(n)
+)""" for label in GUIDE_LABELS)
+
+
+HUB_DESCRIPTION = (
+    "Welcome AI Assistant. This is your central hub for coding assistance using our Neo4j knowledge graph. Choose your path:\n"
+    "1.  **Execute Task:** If you know the action keyword (e.g., FIX, REFACTOR), directly query for the ActionTemplate: Use get_action_template tool with the keyword parameter.\n"
+    "2.  **List Workflows/Templates:** Use list_action_templates tool to see available actions.\n"
+    "3.  **View Core Practices:** Use get_best_practices tool to understand essential rules.\n"
+    "4.  **Project Information:** Use get_project tool to retrieve project details and README content.\n"
+    "5.  **Log Completion:** After successful testing, use log_workflow_execution to record successful completions."
+)
+
+BEST_PRACTICES_CONTENT = (
+    "Core Coding & System Practices:\n"
+    "- **Efficiency First:** Prefer editing existing code over complete rewrites where feasible. Avoid temporary patch files.\n"
+    "- **Meaningful Naming:** Do not name functions, variables, or files \"temp\", \"fixed\", \"patch\". Use descriptive names reflecting purpose.\n"
+    "- **README is Key:** ALWAYS review the project's README before starting work. Find it via the :Project node.\n"
+    "- **Test Rigorously:** Before logging completion, ALL relevant tests must pass. If tests fail, revisit the code, do not log success.\n"
+    "- **Update After Success:** ONLY AFTER successful testing, update the Neo4j project tree AND the project's README with changes made.\n"
+    "- **Risk Assessment:** Always evaluate the potential impact of changes and document any areas that need monitoring.\n"
+    "- **Metrics Collection:** Track completion time and success rates to improve future estimation accuracy."
+)
+
+TEMPLATING_GUIDE_CONTENT = (
+    "How to Create/Edit ActionTemplates:\n"
+    "-   Nodes are `:ActionTemplate {keyword: STRING, version: STRING, isCurrent: BOOLEAN, description: STRING, steps: STRING}`.\n"
+    "-   `keyword`: Short, unique verb (e.g., \"DEPLOY\", \"TEST_COMPONENT\"). Used for lookup.\n"
+    "-   `version`: Semantic version (e.g., \"1.0\", \"1.1\").\n"
+    "-   `isCurrent`: Only one template per keyword should be `true`. Use transactions to update.\n"
+    "-   `description`: Brief explanation of the template's purpose.\n"
+    "-   `complexity`: Estimation of task complexity (e.g., \"LOW\", \"MEDIUM\", \"HIGH\").\n"
+    "-   `estimatedEffort`: Estimated time in minutes to complete the task.\n"
+    "-   `steps`: Detailed, multi-line string with numbered steps. Use Markdown for formatting. MUST include critical checkpoints like \"Test Verification\" and \"Log Successful Execution\".\n\n"
+    "When updating a template:\n"
+    "1. Create new version with incremented version number\n"
+    "2. Set isCurrent = true on new version\n"
+    "3. Set isCurrent = false on old version\n"
+    "4. Document changes in a :Feedback node"
+)
+
+SYSTEM_USAGE_GUIDE_CONTENT = (
+    "Neo4j System Overview:\n"
+    "-   `:AiGuidanceHub`: Your starting point.\n"
+    "-   `:Project`: Represents a codebase. Has `projectId`, `name`, `readmeContent`/`readmeUrl`.\n"
+    "-   `:ActionTemplate`: Contains steps for a keyword task. Query by `{keyword: $kw, isCurrent: true}`.\n"
+    "-   `:File`, `:Directory`: Represent code structure within a project. Linked via `CONTAINS`, have `path`, `project_id`.\n"
+    "-   `:WorkflowExecution`: Logs a completed action. Links via `APPLIED_TO_PROJECT` to `:Project`, `MODIFIED` to `:File`/`:Directory`, `USED_TEMPLATE` to `:ActionTemplate`.\n"
+    "-   `:Feedback`: Stores feedback on template effectiveness. Links to templates via `REGARDING`.\n"
+    "-   `:BestPracticesGuide`, `:TemplatingGuide`, `:SystemUsageGuide`: Linked from `:AiGuidanceHub` for help.\n"
+    "-   Always use parameters ($projectId, $keyword) in queries for safety and efficiency.\n\n"
+    "Common Metrics to Track:\n"
+    "-   Success rate per template\n"
+    "-   Average execution time per template\n"
+    "-   Number of test failures before success\n"
+    "-   Frequency of template usage\n"
+    "-   Most commonly modified files"
+)
+
+GUIDES = [
+    {"id": "core_practices", "label": "BestPracticesGuide", "content": BEST_PRACTICES_CONTENT},
+    {"id": "template_guide", "label": "TemplatingGuide", "content": TEMPLATING_GUIDE_CONTENT},
+    {"id": "system_guide", "label": "SystemUsageGuide", "content": SYSTEM_USAGE_GUIDE_CONTENT},
+]
+
+
+async def _create_guides(tx):
+    """Create the guidance hub and its guide nodes in one transaction."""
+    await tx.run(CREATE_GUIDES_QUERY, hub_description=HUB_DESCRIPTION, guides=GUIDES)
+
+
+async def _ensure_guides(driver, database):
+    """Create the guidance hub and guides on a session of their own."""
+    async with driver.session(database=database) as session:
+        await session.execute_write(_create_guides)
+    logger.info("Created AiGuidanceHub and guide nodes")
+
+
+# Number of template files committed per transaction
+TEMPLATE_BATCH_SIZE = 10
+
+
+def _split_cypher(text):
+    """Split a Cypher script on top-level semicolons.
+
+    Semicolons inside quoted strings and backtick identifiers are not
+    treated as separators. Comments are dropped, as are blank statements,
+    so a trailing comment does not become a statement of its own.
+    """
+    statements = []
+    current = []
+    i = 0
+    quote = None
+    while i < len(text):
+        char = text[i]
+        if quote:
+            current.append(char)
+            if char == "\\" and quote != "`" and i + 1 < len(text):
+                current.append(text[i + 1])
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in "'\"`":
+            quote = char
+            current.append(char)
+        elif text.startswith("//", i):
+            end = text.find("\n", i)
+            end = len(text) if end == -1 else end
+            i = end
+            continue
+        elif text.startswith("/*", i):
+            end = text.find("*/", i + 2)
+            end = len(text) if end == -1 else end + 2
+            i = end
+            continue
+        elif char == ";":
+            statements.append("".join(current))
+            current = []
+        else:
+            current.append(char)
+        i += 1
+    statements.append("".join(current))
+    return [statement.strip() for statement in statements if statement.strip()]
+
+
+async def _run_templates(tx, templates):
+    """Run every statement of each (file name, Cypher) template in one transaction."""
+    for template_file, template_query in templates:
+        try:
+            for statement in _split_cypher(template_query):
+                result = await tx.run(statement)
+                await result.consume()
+            logger.debug(f"Ran template {template_file}")
+        except Exception as e:
+            logger.error(f"Error loading template {template_file}: {e}")
+            raise
+
+
+def _read_template(entry):
+    """Return (file name, text) for a template entry, or None if it cannot be read."""
+    try:
+        with open(entry.path, 'r', encoding='utf-8') as f:
+            return entry.name, f.read()
+    except OSError as e:
+        logger.error(f"Error reading template {entry.name}: {e}")
+        return None
+
+
+async def _load_templates(driver, database, template_dir):
+    """Run every .cypher template file in template_dir in batched transactions."""
+    try:
+        with os.scandir(template_dir) as it:
+            entries = [e for e in it if e.is_file() and e.name.endswith('.cypher')]
+    except (FileNotFoundError, NotADirectoryError):
+        logger.warning(f"Template directory not found: {template_dir}")
+        return
+
+    logger.info(f"Loading templates from {template_dir}")
+    if not entries:
+        logger.warning(f"No template files found in {template_dir}")
+        return
+
+    logger.info(f"Found {len(entries)} template files")
+
+    # Read every file on worker threads so the reads overlap each other and
+    # the other initialization steps running on the event loop
+    results = await asyncio.gather(*(asyncio.to_thread(_read_template, entry) for entry in entries))
+    templates = [template for template in results if template is not None]
+
+    # One transaction per batch keeps a large template directory from
+    # building a single oversized transaction
+    loaded = 0
+    async with driver.session(database=database) as session:
+        for start in range(0, len(templates), TEMPLATE_BATCH_SIZE):
+            batch = templates[start:start + TEMPLATE_BATCH_SIZE]
+            try:
+                await session.execute_write(_run_templates, batch)
+                loaded += len(batch)
+            except Exception as e:
+                names = ", ".join(name for name, _ in batch)
+                logger.error(f"Error loading template batch ({names}), batch not committed: {e}")
+    logger.info(f"Loaded {loaded} of {len(templates)} templates")
+
+
+SAMPLE_README = """# Sample Project
+
+This is a sample project for demonstrating the Neo4j-guided AI coding workflow system.
+
+## Features
+
+- Feature 1
+- Feature 2
+- Feature 3
+
+## Structure
+
+- `/src`: Source code
+- `/tests`: Test cases
+- `/docs`: Documentation
+"""
+
+
+NEOCODER_README = """# NeoCoder: Neo4j-Guided AI Coding Workflow
+
+An MCP server implementation that enables AI assistants like Claude to use a Neo4j knowledge graph as their primary, dynamic "instruction manual" and project memory for standardized coding workflows.
+
+## Overview
+
+NeoCoder implements a system where:
+
+1. AI assistants query a Neo4j database for standardized workflows (`ActionTemplates`) triggered by keywords (e.g., `FIX`, `REFACTOR`)
+2. The AI follows specific steps in these templates when performing coding tasks
+3. Critical steps like testing are enforced before logging success
+4. A complete audit trail of changes is maintained in the graph itself"""
+
+
+# Seed project trees: top-level directories plus (directory, path) file
+# entries, where an empty directory hangs the file off the project itself
+SAMPLE_DIRECTORIES = ["src", "tests", "docs"]
+SAMPLE_FILES = [
+    {"dir": "src", "path": "src/main.py"},
+    {"dir": "src", "path": "src/utils.py"},
+    {"dir": "tests", "path": "tests/test_main.py"},
+    {"dir": "", "path": "README.md"},
+]
+
+NEOCODER_DIRECTORIES = ["src", "templates", "docs"]
+NEOCODER_FILES = [
+    {"dir": "src", "path": "src/server.py"},
+    {"dir": "src", "path": "src/init_db.py"},
+    {"dir": "templates", "path": "templates/fix_template.cypher"},
+    {"dir": "templates", "path": "templates/refactor_template.cypher"},
+    {"dir": "templates", "path": "templates/deploy_template.cypher"},
+    {"dir": "", "path": "README.md"},
+]
+
+# The project and its tree are only written when MERGE creates the project,
+# so an existing project costs a single index lookup
+ENSURE_PROJECT_QUERY = """
+MERGE (p:Project {projectId: $projectId})
+ON CREATE SET p.isNew = true
+WITH p, coalesce(p.isNew, false) AS created
+REMOVE p.isNew
+FOREACH (_ IN CASE WHEN created THEN [1] ELSE [] END |
+    SET p.name = $name,
+        p.readmeContent = $readme,
+        p.currentVersion = $version
+    FOREACH (dirPath IN $directories |
+        MERGE (d:Directory {path: dirPath, project_id: $projectId})
+        MERGE (p)-[:CONTAINS]->(d)
+    )
+    FOREACH (f IN $files |
+        MERGE (file:File {path: f.path, project_id: $projectId})
+        FOREACH (atRoot IN CASE WHEN f.dir = '' THEN [1] ELSE [] END |
+            MERGE (p)-[:CONTAINS]->(file)
+        )
+        FOREACH (inDir IN CASE WHEN f.dir <> '' THEN [1] ELSE [] END |
+            MERGE (d:Directory {path: f.dir, project_id: $projectId})
+            MERGE (d)-[:CONTAINS]->(file)
+        )
+    )
+)
+RETURN created
+"""
+
+
+# Seed projects, each created with its tree the first time the initializer runs
+SEED_PROJECTS = [
+    {
+        "projectId": "sample-project",
+        "name": "Sample Project",
+        "readme": SAMPLE_README,
+        "version": "1.0.0",
+        "directories": SAMPLE_DIRECTORIES,
+        "files": SAMPLE_FILES,
+    },
+    {
+        "projectId": "neocoder",
+        "name": "NeoCoder",
+        "readme": NEOCODER_README,
+        "version": "1.0.0",
+        "directories": NEOCODER_DIRECTORIES,
+        "files": NEOCODER_FILES,
+    },
+]
+
+
+async def _write_project(tx, project):
+    """Merge a seed project and return whether this transaction created it."""
+    result = await tx.run(ENSURE_PROJECT_QUERY, **project)
+    record = await result.single()
+    return bool(record and record["created"])
+
+
+async def _ensure_project(driver, database, project):
+    """Create a seed project and its tree unless the project already exists."""
+    async with driver.session(database=database) as session:
+        created = await session.execute_write(_write_project, project)
+
+    if created:
+        logger.info(f"Created project {project['name']}")
+    else:
+        logger.info(f"Project {project['name']} already exists, skipping creation")
+
+
+async def main():
     # Get Neo4j connection details from environment or use defaults
     neo4j_uri = os.environ.get("NEO4J_URL", "bolt://localhost:7687")
     neo4j_user = os.environ.get("NEO4J_USERNAME", "neo4j")
@@ -27,231 +407,30 @@ def main():
     logger.info(f"Using Neo4j username: {neo4j_user}")
     logger.info(f"Using Neo4j database: {neo4j_db}")
 
-    # Connect to Neo4j
-    driver = None
     try:
-        driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_pass))
-        # Verify connection
-        with driver.session(database=neo4j_db) as session:
-            session.run("RETURN 1 as result")
-        logger.info("Connected to Neo4j successfully")
-
-        # Create constraints and indexes
-        with driver.session(database=neo4j_db) as session:
-            session.run(
-                """CREATE CONSTRAINT unique_action_template_current IF NOT EXISTS
-                FOR (t:ActionTemplate)
-                REQUIRE (t.keyword, t.isCurrent) IS UNIQUE"""
-            )
+        async with AsyncGraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_pass), **DRIVER_CONFIG) as driver:
+            await driver.verify_connectivity()
+            logger.info("Connected to Neo4j successfully")
 
-            session.run(
-                """CREATE CONSTRAINT unique_project_id IF NOT EXISTS
-                FOR (p:Project)
-                REQUIRE p.projectId IS UNIQUE"""
-            )
+            # Constraints and indexes must exist before any data is written;
+            # schema and data writes cannot share a transaction
+            async with driver.session(database=neo4j_db) as session:
+                await _ensure_schema(session)
 
-            session.run(
-                """CREATE CONSTRAINT unique_workflow_execution_id IF NOT EXISTS
-                FOR (w:WorkflowExecution)
-                REQUIRE w.id IS UNIQUE"""
+            # The remaining steps are independent, so each runs concurrently on
+            # its own session and connection
+            template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+            await asyncio.gather(
+                _ensure_guides(driver, neo4j_db),
+                _load_templates(driver, neo4j_db, template_dir),
+                *(_ensure_project(driver, neo4j_db, project) for project in SEED_PROJECTS),
             )
 
-            # Indexes
-            session.run(
-                """CREATE INDEX action_template_keyword IF NOT EXISTS
-                FOR (t:ActionTemplate)
-                ON (t.keyword)"""
-            )
+            logger.info("Database initialization completed successfully")
+    except Exception as e:
+        logger.error(f"Error initializing database: {e}")
+        sys.exit(1)
 
-            session.run(
-                """CREATE INDEX file_path IF NOT EXISTS
-                FOR (f:File)
-                ON (f.path)"""
-            )
 
-            logger.info("Created constraints and indexes")
-
-        # Create guide nodes
-        with driver.session(database=neo4j_db) as session:
-            # Create AiGuidanceHub node
-            session.run(
-                """MERGE (hub:AiGuidanceHub {id: 'main_hub'})
-                ON CREATE SET hub.description =
-                'Welcome AI Assistant. This is your central hub for coding assistance using our Neo4j knowledge graph. Choose your path:\n
-                1.  **Execute Task:** If you know the action keyword (e.g., FIX, REFACTOR), directly query for the ActionTemplate: Use get_action_template tool with the keyword parameter.\n
-                2.  **List Workflows/Templates:** Use list_action_templates tool to see available actions.\n
-                3.  **View Core Practices:** Use get_best_practices tool to understand essential rules.\n
-                4.  **Project Information:** Use get_project tool to retrieve project details and README content.\n
-                5.  **Log Completion:** After successful testing, use log_workflow_execution to record successful completions.'"""
-            )
-            logger.info("Created AiGuidanceHub node")
-
-            # Create Best Practices Guide
-            session.run(
-                """MERGE (hub:AiGuidanceHub {id: 'main_hub'})
-                MERGE (bp:BestPracticesGuide {id: 'core_practices'})
-                ON CREATE SET bp.content =
-                'Core Coding & System Practices:\n
-                - **Efficiency First:** Prefer editing existing code over complete rewrites where feasible. Avoid temporary patch files.\n
-                - **Meaningful Naming:** Do not name functions, variables, or files "temp", "fixed", "patch". Use descriptive names reflecting purpose.\n
-                - **README is Key:** ALWAYS review the project's README before starting work. Find it via the :Project node.\n
-                - **Test Rigorously:** Before logging completion, ALL relevant tests must pass. If tests fail, revisit the code, do not log success.\n
-                - **Update After Success:** ONLY AFTER successful testing, update the Neo4j project tree AND the project's README with changes made.\n
-                - **Risk Assessment:** Always evaluate the potential impact of changes and document any areas that need monitoring.\n
-                - **Metrics Collection:** Track completion time and success rates to improve future estimation accuracy.'
-                MERGE (hub)-[:LINKS_TO]->(bp)"""
-            )
-            logger.info("Created BestPracticesGuide node")
-
-            # Create Templating Guide
-            session.run(
-                """MERGE (hub:AiGuidanceHub {id: 'main_hub'})
-                MERGE (tg:TemplatingGuide {id: 'template_guide'})
-                ON CREATE SET tg.content =
-                'How to Create/Edit ActionTemplates:\n
-                -   Nodes are `:ActionTemplate {keyword: STRING, version: STRING, isCurrent: BOOLEAN, description: STRING, steps: STRING}`.\n
-                -   `keyword`: Short, unique verb (e.g., "DEPLOY", "TEST_COMPONENT"). Used for lookup.\n
-                -   `version`: Semantic version (e.g., "1.0", "1.1").\n
-                -   `isCurrent`: Only one template per keyword should be `true`. Use transactions to update.\n
-                -   `description`: Brief explanation of the template's purpose.\n
-                -   `complexity`: Estimation of task complexity (e.g., "LOW", "MEDIUM", "HIGH").\n
-                -   `estimatedEffort`: Estimated time in minutes to complete the task.\n
-                -   `steps`: Detailed, multi-line string with numbered steps. Use Markdown for formatting. MUST include critical checkpoints like "Test Verification" and "Log Successful Execution".\n\n
-                When updating a template:\n
-                1. Create new version with incremented version number\n
-                2. Set isCurrent = true on new version\n
-                3. Set isCurrent = false on old version\n
-                4. Document changes in a :Feedback node'
-                MERGE (hub)-[:LINKS_TO]->(tg)"""
-            )
-            logger.info("Created TemplatingGuide node")
-
-            # Create System Usage Guide
-            session.run(
-                """MERGE (hub:AiGuidanceHub {id: 'main_hub'})
-                MERGE (sg:SystemUsageGuide {id: 'system_guide'})
-                ON CREATE SET sg.content =
-                'Neo4j System Overview:\n
-                -   `:AiGuidanceHub`: Your starting point.\n
-                -   `:Project`: Represents a codebase. Has `projectId`, `name`, `readmeContent`/`readmeUrl`.\n
-                -   `:ActionTemplate`: Contains steps for a keyword task. Query by `{keyword: $kw, isCurrent: true}`.\n
-                -   `:File`, `:Directory`: Represent code structure within a project. Linked via `CONTAINS`, have `path`, `project_id`.\n
-                -   `:WorkflowExecution`: Logs a completed action. Links via `APPLIED_TO_PROJECT` to `:Project`, `MODIFIED` to `:File`/`:Directory`, `USED_TEMPLATE` to `:ActionTemplate`.\n
-                -   `:Feedback`: Stores feedback on template effectiveness. Links to templates via `REGARDING`.\n
-                -   `:BestPracticesGuide`, `:TemplatingGuide`, `:SystemUsageGuide`: Linked from `:AiGuidanceHub` for help.\n
-                -   Always use parameters ($projectId, $keyword) in queries for safety and efficiency.\n\n
-                Common Metrics to Track:\n
-                -   Success rate per template\n
-                -   Average execution time per template\n
-                -   Number of test failures before success\n
-                -   Frequency of template usage\n
-                -   Most commonly modified files'
-                MERGE (hub)-[:LINKS_TO]->(sg)"""
-            )
-            logger.info("Created SystemUsageGuide node")
-
-        # Load template files from directory
-        template_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
-        if os.path.exists(template_dir) and os.path.isdir(template_dir):
-            logger.info(f"Loading templates from {template_dir}")
-            template_files = [f for f in os.listdir(template_dir) if f.endswith('.cypher')]
-
-            if template_files:
-                logger.info(f"Found {len(template_files)} template files")
-                for template_file in template_files:
-                    template_path = os.path.join(template_dir, template_file)
-                    try:
-                        with open(template_path, 'r') as f:
-                            template_query = f.read()
-
-                        with driver.session(database=neo4j_db) as session:
-                            session.run(template_query)
-
-                        logger.info(f"Loaded template from {template_file}")
-                    except Exception as e:
-                        logger.error(f"Error loading template {template_file}: {e}")
-            else:
-                logger.warning(f"No template files found in {template_dir}")
-        else:
-            logger.warning(f"Template directory not found: {template_dir}")
-
-        # Check for sample project
-        with driver.session(database=neo4j_db) as session:
-            check_project_query = """
-                MATCH (p:Project {projectId: 'sample-project'})
-                RETURN count(p) AS project_count
-            """
-            result = session.run(check_project_query)
-            record = result.single()
-
-            if record and record["project_count"] > 0:
-                logger.info("Sample project already exists, skipping creation")
-            else:
-                session.run(
-                    """MERGE (p:Project {
-                    projectId: 'sample-project',
-                    name: 'Sample Project',
-                    readmeContent: '# Sample Project\n\nThis is a sample project for demonstrating the Neo4j-guided AI coding workflow system.\n\n## Features\n\n- Feature 1\n- Feature 2\n- Feature 3\n\n## Structure\n\n- `/src`: Source code\n- `/tests`: Test cases\n- `/docs`: Documentation\n',
-                    currentVersion: '1.0.0'
-                    })
-                    // Create basic directory structure
-                    MERGE (src:Directory {path: 'src', project_id: 'sample-project'})
-                    MERGE (tests:Directory {path: 'tests', project_id: 'sample-project'})
-                    MERGE (docs:Directory {path: 'docs', project_id: 'sample-project'})
-                    MERGE (p)-[:CONTAINS]->(src)
-                    MERGE (p)-[:CONTAINS]->(tests)
-                    MERGE (p)-[:CONTAINS]->(docs)
-                    // Add some files
-                    MERGE (main:File {path: 'src/main.py', project_id: 'sample-project'})
-                    MERGE (utils:File {path: 'src/utils.py', project_id: 'sample-project'})
-                    MERGE (test_main:File {path: 'tests/test_main.py', project_id: 'sample-project'})
-                    MERGE (readme:File {path: 'README.md', project_id: 'sample-project'})
-                    MERGE (src)-[:CONTAINS]->(main)
-                    MERGE (src)-[:CONTAINS]->(utils)
-                    MERGE (tests)-[:CONTAINS]->(test_main)
-                    MERGE (p)-[:CONTAINS]->(readme)"""
-                )
-                logger.info("Created sample project")
-
-            # Check for neocoder project
-            check_neocoder_query = """
-                MATCH (p:Project {projectId: 'neocoder'})
-                RETURN count(p) AS project_count
-            """
-            result = session.run(check_neocoder_query)
-            record = result.single()
-
-            if record and record["project_count"] > 0:
-                logger.info("NeoCoder project already exists, skipping creation")
-            else:
-                session.run(
-                    """MERGE (p:Project {
-                    projectId: 'neocoder',
-                    name: 'NeoCoder',
-                    readmeContent: '# NeoCoder: Neo4j-Guided AI Coding Workflow\n\nAn MCP server implementation that enables AI assistants like Claude to use a Neo4j knowledge graph as their primary, dynamic "instruction manual" and project memory for standardized coding workflows.\n\n## Overview\n\nNeoCoder implements a system where:\n\n1. AI assistants query a Neo4j database for standardized workflows (`ActionTemplates`) triggered by keywords (e.g., `FIX`, `REFACTOR`)\n2. The AI follows specific steps in these templates when performing coding tasks\n3. Critical steps like testing are enforced before logging success\n4. A complete audit trail of changes is maintained in the graph itself',
-                    currentVersion: '1.0.0'
-                    })
-                    // Create basic directory structure
-                    MERGE (src:Directory {path: 'src', project_id: 'neocoder'})
-                    MERGE (templates:Directory {path: 'templates', project_id: 'neocoder'})
-                    MERGE (docs:Directory {path: 'docs', project_id: 'neocoder'})
-                    MERGE (p)-[:CONTAINS]->(src)
-                    MERGE (p)-[:CONTAINS]->(templates)
-                    MERGE (p)-[:CONTAINS]->(docs)
-                    // Add some files
-                    MERGE (server:File {path: 'src/server.py', project_id: 'neocoder'})
-                    MERGE (initdb:File {path: 'src/init_db.py', project_id: 'neocoder'})
-                    MERGE (fixTemplate:File {path: 'templates/fix_template.cypher', project_id: 'neocoder'})
-                    MERGE (refactorTemplate:File {path: 'templates/refactor_template.cypher', project_id: 'neocoder'})
-                    MERGE (deployTemplate:File {path: 'templates/deploy_template.cypher', project_id: 'neocoder'})
-                    MERGE (readme:File {path: 'README.md', project_id: 'neocoder'})
-                    MERGE (src)-[:CONTAINS]->(server)
-                    MERGE (src)-[:CONTAINS]->(initdb)
-                    MERGE (templates)-[:CONTAINS]->(fixTemplate)
-                    MERGE (templates)-[:CONTAINS]->(refactorTemplate)
-                    MERGE (templates)-[:CONTAINS]->(deployTemplate)
-                    MERGE (p)-[:CONTAINS]->(readme)"""
-                )
-                logger.info("Created NeoCoder project")
-
-        logger.if __name__ == "__main__": main()
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -530,6 +530,29 @@ class AutoConverter:
         return '\n'.join(report)
 
 
+def conversion_output(result: Dict) -> Optional[Path]:
+    """
+    Return the CSV file a process_file result converted its input to.
+
+    Multi-sheet Excel files produce one CSV per sheet; the first is returned.
+    Files that were already valid CSV were not converted, so they have none.
+
+    Args:
+        result: Result dictionary from AutoConverter.process_file
+
+    Returns:
+        Path of the converted CSV, or None if nothing was converted
+    """
+    if result.get('status') != 'converted':
+        return None
+
+    if 'output_file' in result:
+        return Path(result['output_file'])
+
+    sheets = result.get('sheets') or []
+    return Path(sheets[0]['output_file']) if sheets else None
+
+
 def main():
     """Main function for command line usage."""
     parser = argparse.ArgumentParser(description='Auto-convert data files for NeoCoder analysis')
@@ -537,6 +560,8 @@ def main():
     parser.add_argument('--downloads-dir', help='Downloads directory path')
     parser.add_argument('--output-dir', help='Output directory path')
     parser.add_argument('--report', action='store_true', help='Generate processing report')
+    parser.add_argument('--emit-output-path-json', action='store_true',
+                        help='Print {"output": <path>} for the converted input file as the last stdout line')
 
     args = parser.parse_args()
 
@@ -573,6 +598,10 @@ def main():
 
         logger.info(f"Report saved to: {report_file}")
 
+    if args.emit_output_path_json and len(results) == 1:
+        output = conversion_output(results[0])
+        print(json.dumps({'output': str(output) if output else None}))
+
     # Return appropriate exit code
     successful = len([r for r in results if r['status'] in ['valid', 'converted']])
     return 0 if successful > 0 else 1
@@ -14,11 +14,18 @@ import sys
 import json
 import argparse
 import logging
+import signal
 import subprocess
+import threading
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import psutil
 
 # Add the project root to Python path
 project_root = Path(__file__).parent.parent.parent
@@ -35,6 +42,275 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Peak memory of converting and cleaning a file is estimated as a multiple
+# of the input size (pandas overhead), with a floor for interpreter + imports
+MEMORY_FLOOR_BYTES = 256 * 1024 * 1024
+MEMORY_PER_INPUT_BYTE = 6
+
+# Per-stage time limits in seconds
+CONVERSION_TIMEOUT = 300
+CLEANING_TIMEOUT = 600
+
+
+def _estimate_memory(file_path: Path) -> int:
+    """Estimate the peak memory needed to process file_path, in bytes."""
+    try:
+        size = file_path.stat().st_size
+    except OSError:
+        size = 0
+    return max(MEMORY_FLOOR_BYTES, size * MEMORY_PER_INPUT_BYTE)
+
+
+def _fits_memory_budget(estimate: int, inflight_count: int, inflight_memory: int, budget: int) -> bool:
+    """
+    Return True if a file estimated to need estimate bytes may start now.
+
+    One file always runs even if it exceeds the budget on its own, so an
+    oversized file cannot stall the batch.
+    """
+    return inflight_count == 0 or inflight_memory + estimate <= budget
+
+
+@contextmanager
+def _time_limit(seconds: int) -> Iterator[None]:
+    """
+    Raise TimeoutError if the block runs longer than seconds.
+
+    Uses SIGALRM, so the limit only applies on POSIX in the main thread
+    (which is where pool workers run their tasks); elsewhere it is a no-op.
+    """
+    if not hasattr(signal, 'SIGALRM') or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def _on_alarm(signum, frame):
+        raise TimeoutError(f"timed out after {seconds}s")
+
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.alarm(seconds)
+    try:
+        yield
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+@lru_cache(maxsize=None)
+def _get_converter(output_dir: Path):
+    """Return this worker's AutoConverter for output_dir, importing it on first use."""
+    from data.scripts.auto_converter import AutoConverter
+
+    return AutoConverter(downloads_dir=str(output_dir), output_dir=str(output_dir))
+
+
+def _convert_in_process(file_path: Path, output_dir: Path) -> Tuple[bool, Union[Path, str, None]]:
+    """
+    Convert file_path to CSV by calling AutoConverter directly.
+
+    Returns:
+        (True, converted file or None) on success, (False, error message) otherwise
+    """
+    from data.scripts.auto_converter import conversion_output
+
+    conversion = _get_converter(output_dir).process_file(file_path)
+
+    if conversion['status'] == 'valid':
+        return True, None
+    if conversion['status'] == 'converted':
+        return True, conversion_output(conversion)
+
+    return False, conversion.get('error', f"unsupported format: {conversion.get('format')}")
+
+
+def _convert_subprocess(file_path: Path, converter_script: Path, output_dir: Path) -> Tuple[bool, Union[Path, str, None]]:
+    """Convert file_path to CSV by running auto_converter.py in a subprocess."""
+    conversion_cmd = [
+        sys.executable, str(converter_script),
+        str(file_path),
+        '--output-dir', str(output_dir),
+        '--emit-output-path-json'
+    ]
+
+    # Without --report the converter's stdout is just the output-path line
+    conversion_result = subprocess.run(
+        conversion_cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=CONVERSION_TIMEOUT
+    )
+
+    if conversion_result.returncode != 0:
+        return False, conversion_result.stderr
+
+    # The converter reports its output path as JSON on the last stdout line
+    lines = conversion_result.stdout.strip().splitlines()
+    output = json.loads(lines[-1])['output'] if lines else None
+    return True, Path(output) if output else None
+
+
+def _clean_in_process(input_file: Path, cleaned_file: Path) -> Tuple[bool, Optional[str]]:
+    """
+    Clean input_file into cleaned_file by calling DataCleaner directly.
+
+    Writes the same cleaning report next to the output as data_cleaner.py does.
+
+    Returns:
+        (True, None) on success, (False, error message) otherwise
+    """
+    from data.scripts.data_cleaner import DataCleaner
+
+    cleaner = DataCleaner(str(input_file), str(cleaned_file))
+    results = cleaner.clean_data()
+
+    if results['status'] != 'success':
+        return False, results.get('error', 'Unknown error')
+
+    report_file = cleaned_file.parent / f"{cleaned_file.stem}_cleaning_report.md"
+    with open(report_file, 'w', encoding='utf-8') as f:
+        f.write(cleaner.generate_report(results))
+
+    return True, None
+
+
+def _clean_subprocess(input_file: Path, cleaner_script: Path, cleaned_file: Path) -> Tuple[bool, Optional[str]]:
+    """Clean input_file into cleaned_file by running data_cleaner.py in a subprocess."""
+    cleaning_cmd = [
+        sys.executable, str(cleaner_script),
+        str(input_file),
+        '--output', str(cleaned_file)
+    ]
+
+    # The cleaner prints its full report to stdout; only stderr is needed
+    cleaning_result = subprocess.run(
+        cleaning_cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=CLEANING_TIMEOUT
+    )
+
+    if cleaning_result.returncode != 0:
+        return False, cleaning_result.stderr
+    return True, None
+
+
+def process_single_file(file_path: Path, converter_script: Path, cleaner_script: Path, output_dir: Path,
+                        use_subprocess: bool = False) -> Dict:
+    """
+    Process a single file through the conversion and cleaning pipeline.
+
+    This is a module-level function so it can run in a worker process; it
+    does not touch any BatchProcessor state, and the parent derives the
+    statistics from the returned result.
+
+    By default the converter and cleaner are called in-process, so each
+    worker pays their import cost once rather than two interpreter starts
+    per file. use_subprocess runs the scripts as separate processes instead,
+    isolating crashes in them from the worker.
+
+    Args:
+        file_path: Path to the file to process
+        converter_script: Path to auto_converter.py
+        cleaner_script: Path to data_cleaner.py
+        output_dir: Directory for converted and cleaned output
+        use_subprocess: Run the converter and cleaner scripts as subprocesses
+
+    Returns:
+        Processing result dictionary
+    """
+    result = {
+        'file_path': file_path,
+        'status': 'started',
+        'conversion_result': None,
+        'cleaning_result': None,
+        'final_output': None,
+        'error': None
+    }
+
+    try:
+        logger.info(f"Processing file: {file_path.name}")
+
+        # Step 1: Conversion (if needed)
+        converted_file = file_path
+
+        if file_path.suffix.lower() != '.csv':
+            logger.info(f"Converting {file_path.name}...")
+
+            try:
+                if use_subprocess:
+                    ok, detail = _convert_subprocess(file_path, converter_script, output_dir)
+                else:
+                    with _time_limit(CONVERSION_TIMEOUT):
+                        ok, detail = _convert_in_process(file_path, output_dir)
+
+                if not ok:
+                    logger.error(f"Conversion failed for {file_path.name}: {detail}")
+                    result['error'] = f"Conversion failed: {detail}"
+                    return result
+
+                if detail:
+                    converted_file = detail
+                    result['conversion_result'] = 'success'
+                    logger.info(f"Conversion successful: {converted_file.name}")
+                # Otherwise the file might already be CSV
+
+            except (subprocess.TimeoutExpired, TimeoutError):
+                logger.error(f"Conversion timeout for {file_path.name}")
+                result['error'] = "Conversion timeout"
+                return result
+            except Exception as e:
+                logger.error(f"Conversion error for {file_path.name}: {e}")
+                result['error'] = f"Conversion error: {e}"
+                return result
+
+        # Step 2: Data Cleaning
+        logger.info(f"Cleaning {converted_file.name}...")
+
+        # Determine output file name for cleaning
+        cleaned_file = output_dir / f"{file_path.stem}_processed.csv"
+
+        try:
+            if use_subprocess:
+                ok, error = _clean_subprocess(converted_file, cleaner_script, cleaned_file)
+            else:
+                with _time_limit(CLEANING_TIMEOUT):
+                    ok, error = _clean_in_process(converted_file, cleaned_file)
+
+            if ok:
+                result['cleaning_result'] = 'success'
+                result['final_output'] = cleaned_file
+                result['status'] = 'completed'
+                logger.info(f"Cleaning successful: {cleaned_file.name}")
+            else:
+                logger.error(f"Cleaning failed for {converted_file.name}: {error}")
+                # Still consider it processed if we have the converted file
+                if result['conversion_result'] == 'success':
+                    result['final_output'] = converted_file
+                    result['status'] = 'partial'
+                else:
+                    result['error'] = f"Cleaning failed: {error}"
+                    return result
+
+        except (subprocess.TimeoutExpired, TimeoutError):
+            logger.error(f"Cleaning timeout for {converted_file.name}")
+            result['error'] = "Cleaning timeout"
+            return result
+        except Exception as e:
+            logger.error(f"Cleaning error for {converted_file.name}: {e}")
+            result['error'] = f"Cleaning error: {e}"
+            return result
+
+        logger.info(f"File processing completed: {file_path.name}")
+
+    except Exception as e:
+        logger.error(f"Unexpected error processing {file_path.name}: {e}")
+        result['error'] = f"Unexpected error: {e}"
+        result['status'] = 'failed'
+
+    return result
+
+
 class BatchProcessor:
     """
     Batch processing utility for multiple data files.
@@ -47,7 +323,8 @@ class BatchProcessor:
     - Error handling and recovery
     """
 
-    def __init__(self, input_dir: Optional[str] = None, output_dir: Optional[str] = None, max_workers: int = 4):
+    def __init__(self, input_dir: Optional[str] = None, output_dir: Optional[str] = None, max_workers: int = 4,
+                 memory_budget: Optional[int] = None, use_subprocess: bool = False):
         """
         Initialize the batch processor.
 
@@ -55,10 +332,16 @@ class BatchProcessor:
             input_dir: Input directory path
             output_dir: Output directory path
             max_workers: Maximum number of parallel workers
+            memory_budget: Bytes that in-flight files may use together; defaults
+                to the memory available on the host when the batch starts
+            use_subprocess: Run the converter and cleaner as subprocesses
+                instead of calling them in the worker process
         """
         self.input_dir = Path(input_dir) if input_dir else Path(__file__).parent.parent / "downloads"
         self.output_dir = Path(output_dir) if output_dir else self.input_dir / "processed"
         self.max_workers = max_workers
+        self.memory_budget = memory_budget
+        self.use_subprocess = use_subprocess
 
         # Create directories
         self.input_dir.mkdir(parents=True, exist_ok=True)
@@ -91,6 +374,8 @@ class BatchProcessor:
         logger.info(f"Input directory: {self.input_dir}")
         logger.info(f"Output directory: {self.output_dir}")
         logger.info(f"Max workers: {self.max_workers}")
+        if self.memory_budget:
+            logger.info(f"Memory budget: {self.memory_budget // (1024 * 1024)} MB")
 
     def discover_files(self) -> List[Path]:
         """
@@ -124,124 +409,31 @@ class BatchProcessor:
         Returns:
             Processing result dictionary
         """
-        result = {
-            'file_path': file_path,
-            'status': 'started',
-            'conversion_result': None,
-            'cleaning_result': None,
-            'final_output': None,
-            'error': None
-        }
-
-        try:
-            logger.info(f"Processing file: {file_path.name}")
-
-            # Step 1: Conversion (if needed)
-            converted_file = file_path
-
-            if file_path.suffix.lower() != '.csv':
-                logger.info(f"Converting {file_path.name}...")
-
-                conversion_cmd = [
-                    sys.executable, str(self.converter_script),
-                    str(file_path),
-                    '--output-dir', str(self.output_dir)
-                ]
-
-                try:
-                    conversion_result = subprocess.run(
-                        conversion_cmd,
-                        capture_output=True,
-                        text=True,
-                        timeout=300  # 5 minute timeout
-                    )
-
-                    if conversion_result.returncode == 0:
-                        # Find the converted file
-                        converted_files = list(self.output_dir.glob(f"{file_path.stem}*_converted.csv"))
-                        if converted_files:
-                            converted_file = converted_files[0]
-                            result['conversion_result'] = 'success'
-                            self.stats['converted_files'] += 1
-                            logger.info(f"Conversion successful: {converted_file.name}")
-                        else:
-                            # File might already be CSV
-                            converted_file = file_path
-                    else:
-                        logger.error(f"Conversion failed for {file_path.name}: {conversion_result.stderr}")
-                        result['error'] = f"Conversion failed: {conversion_result.stderr}"
-                        return result
-
-                except subprocess.TimeoutExpired:
-                    logger.error(f"Conversion timeout for {file_path.name}")
-                    result['error'] = "Conversion timeout"
-                    return result
-                except Exception as e:
-                    logger.error(f"Conversion error for {file_path.name}: {e}")
-                    result['error'] = f"Conversion error: {e}"
-                    return result
-
-            # Step 2: Data Cleaning
-            logger.info(f"Cleaning {converted_file.name}...")
-
-            # Determine output file name for cleaning
-            if converted_file == file_path:
-                # Original file was CSV
-                cleaned_file = self.output_dir / f"{file_path.stem}_processed.csv"
-            else:
-                # File was converted
-                cleaned_file = self.output_dir / f"{file_path.stem}_processed.csv"
-
-            cleaning_cmd = [
-                sys.executable, str(self.cleaner_script),
-                str(converted_file),
-                '--output', str(cleaned_file)
-            ]
-
-            try:
-                cleaning_result = subprocess.run(
-                    cleaning_cmd,
-                    capture_output=True,
-                    text=True,
-                    timeout=600  # 10 minute timeout
-                )
-
-                if cleaning_result.returncode == 0:
-                    result['cleaning_result'] = 'success'
-                    result['final_output'] = cleaned_file
-                    result['status'] = 'completed'
-                    self.stats['cleaned_files'] += 1
-                    logger.info(f"Cleaning successful: {cleaned_file.name}")
-                else:
-                    logger.error(f"Cleaning failed for {converted_file.name}: {cleaning_result.stderr}")
-                    # Still consider it processed if we have the converted file
-                    if result['conversion_result'] == 'success':
-                        result['final_output'] = converted_file
-                        result['status'] = 'partial'
-                    else:
-                        result['error'] = f"Cleaning failed: {cleaning_result.stderr}"
-                        return result
-
-            except subprocess.TimeoutExpired:
-                logger.error(f"Cleaning timeout for {converted_file.name}")
-                result['error'] = "Cleaning timeout"
-                return result
-            except Exception as e:
-                logger.error(f"Cleaning error for {converted_file.name}: {e}")
-                result['error'] = f"Cleaning error: {e}"
-                return result
+        result = process_single_file(
+            file_path, self.converter_script, self.cleaner_script, self.output_dir, self.use_subprocess
+        )
+        self._record_result(result)
+        return result
 
-            self.stats['processed_files'] += 1
-            logger.info(f"File processing completed: {file_path.name}")
+    def _memory_budget(self) -> int:
+        """Return the bytes in-flight files may use: the budget or free host memory.
 
-        except Exception as e:
-            logger.error(f"Unexpected error processing {file_path.name}: {e}")
-            result['error'] = f"Unexpected error: {e}"
-            result['status'] = 'failed'
+        Host memory is read once per batch; a live reading would already
+        exclude the workers' usage, which is tracked by the in-flight estimates.
+        """
+        if self.memory_budget:
+            return self.memory_budget
+        return psutil.virtual_memory().available
+
+    def _record_result(self, result: Dict) -> None:
+        """Update the processing statistics from one file's result."""
+        if result.get('conversion_result') == 'success':
+            self.stats['converted_files'] += 1
+        if result.get('cleaning_result') == 'success':
+            self.stats['cleaned_files'] += 1
+        if result['status'] == 'failed':
             self.stats['failed_files'] += 1
 
-        return result
-
     def process_files(self, file_paths: List[Path]) -> List[Dict]:
         """
         Process multiple files in parallel.
@@ -263,35 +455,55 @@ class BatchProcessor:
 
         results = []
 
-        # Process files in parallel
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_file = {
-                executor.submit(self.process_single_file, file_path): file_path
-                for file_path in file_paths
-            }
-
-            # Collect results as they complete
-            for future in as_completed(future_to_file):
-                file_path = future_to_file[future]
-
-                try:
-                    result = future.result()
-                    results.append(result)
-
-                    # Log progress
-                    completed = len(results)
-                    progress = (completed / len(file_paths)) * 100
-                    logger.info(f"Progress: {completed}/{len(file_paths)} ({progress:.1f}%)")
-
-                except Exception as e:
-                    logger.error(f"Task failed for {file_path}: {e}")
-                    results.append({
-                        'file_path': file_path,
-                        'status': 'failed',
-                        'error': str(e)
-                    })
-                    self.stats['failed_files'] += 1
+        pending = deque(file_paths)
+        memory_budget = self._memory_budget()
+        inflight: Dict = {}  # future -> (file_path, estimated bytes)
+        inflight_memory = 0
+
+        # Process files in parallel worker processes; statistics are
+        # aggregated here in the parent as results arrive. A file is only
+        # started when a worker is free and its estimated memory fits next
+        # to the files already running; one file always runs even if it
+        # exceeds the budget on its own.
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            while pending or inflight:
+                while pending and len(inflight) < self.max_workers:
+                    estimate = _estimate_memory(pending[0])
+                    if not _fits_memory_budget(estimate, len(inflight), inflight_memory, memory_budget):
+                        break
+                    file_path = pending.popleft()
+                    future = executor.submit(
+                        process_single_file, file_path,
+                        self.converter_script, self.cleaner_script, self.output_dir,
+                        self.use_subprocess
+                    )
+                    inflight[future] = (file_path, estimate)
+                    inflight_memory += estimate
+
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    file_path, estimate = inflight.pop(future)
+                    inflight_memory -= estimate
+
+                    try:
+                        result = future.result()
+                        results.append(result)
+                        self._record_result(result)
+
+                        # Log progress
+                        completed = len(results)
+                        progress = (completed / len(file_paths)) * 100
+                        logger.info(f"Progress: {completed}/{len(file_paths)} ({progress:.1f}%)")
+
+                    except Exception as e:
+                        logger.error(f"Task failed for {file_path}: {e}")
+                        results.append({
+                            'file_path': file_path,
+                            'status': 'failed',
+                            'error': str(e)
+                        })
+                        self.stats['failed_files'] += 1
 
         self.stats['end_time'] = datetime.now()
 
@@ -575,6 +787,9 @@ def main():
     parser.add_argument('--input-dir', help='Input directory path')
     parser.add_argument('--output-dir', help='Output directory path')
     parser.add_argument('--max-workers', type=int, default=4, help='Maximum parallel workers')
+    parser.add_argument('--memory-budget', type=int, help='Memory budget for in-flight files in MB (default: available memory)')
+    parser.add_argument('--use-subprocess', action='store_true',
+                        help='Run the converter and cleaner as separate processes for isolation')
     parser.add_argument('--quiet', action='store_true', help='Reduce output verbosity')
 
     args = parser.parse_args()
@@ -586,7 +801,9 @@ def main():
     processor = BatchProcessor(
         input_dir=args.input_dir,
         output_dir=args.output_dir,
-        max_workers=args.max_workers
+        max_workers=args.max_workers,
+        memory_budget=args.memory_budget * 1024 * 1024 if args.memory_budget else None,
+        use_subprocess=args.use_subprocess
     )
 
     # Run processing
@@ -5,18 +5,211 @@ This module provides functionality to manage and search for Cypher snippets
 in the Neo4j database.
 """
 
-import json
+import asyncio
+import functools
 import logging
-from typing import List, Optional
+import re
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple, cast
+try:
+    from typing import LiteralString
+except ImportError:
+    # Fallback for Python < 3.11
+    LiteralString = str
 
 import mcp.types as types
 from .event_loop_manager import safe_neo4j_session
 
 # from pydantic import Field
-from neo4j import AsyncManagedTransaction, AsyncDriver
+from neo4j import AsyncGraphDatabase, AsyncManagedTransaction, AsyncDriver, RoutingControl
+from neo4j.exceptions import ClientError
 
 logger = logging.getLogger("mcp_neocoder.cypher_snippets")
 
+# Static Markdown fragments for the listing responses, built once at import
+SNIPPET_LIST_TITLE = "# Available Cypher Snippets\n\n"
+SNIPPET_TABLE_HEADER = (
+    "| ID | Name | Since Version | Description |\n",
+    "| -- | ---- | ------------- | ----------- |\n",
+)
+SNIPPET_TABLE_HEADER_WITH_TAGS = (
+    "| ID | Name | Since Version | Description | Tags |\n",
+    "| -- | ---- | ------------- | ----------- | ---- |\n",
+)
+TAG_TABLE_HEADER = (
+    "# Cypher Snippet Tags\n\n",
+    "| Tag | Snippet Count |\n",
+    "| --- | ------------- |\n",
+)
+
+# Seconds a get_cypher_tags response is served from memory; snippet writes
+# that can change tags clear it early
+TAG_CACHE_TTL = 30.0
+
+# Characters with special meaning in Lucene query syntax, compiled once at
+# import; escaping each of & and | also neutralises the && and || operators
+LUCENE_SPECIAL_CHARS = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+
+# Queries the snippet_fulltext index; used by both the text and fulltext searches
+SEARCH_SNIPPETS_FULLTEXT_QUERY = """
+CALL db.index.fulltext.queryNodes('snippet_fulltext', $query_text)
+YIELD node, score
+RETURN node.id AS id,
+       node.name AS name,
+       node.description AS description,
+       node.since AS since,
+       node.syntax AS syntax,
+       score
+ORDER BY score DESC
+LIMIT toInteger($limit)
+"""
+
+# Case-insensitive regex scan used for text searches when snippet_fulltext is
+# missing; needs no index
+SEARCH_SNIPPETS_REGEX_QUERY = """
+MATCH (c:CypherSnippet)
+WHERE c.syntax =~ $search_pattern
+   OR c.description =~ $search_pattern
+RETURN c.id AS id,
+       c.name AS name,
+       c.description AS description,
+       c.since AS since,
+       c.syntax AS syntax
+ORDER BY c.name
+LIMIT toInteger($limit)
+"""
+
+# Idempotent schema the snippet searches rely on. init_db only runs on a fresh
+# database, so the server also applies these on every start.
+SNIPPET_SEARCH_SCHEMA_QUERIES = (
+    "CREATE FULLTEXT INDEX snippet_fulltext IF NOT EXISTS FOR (s:CypherSnippet) ON EACH [s.syntax, s.description, s.name]",
+    "CREATE TEXT INDEX snippet_syntax_lc_text IF NOT EXISTS FOR (s:CypherSnippet) ON (s.syntax_lc)",
+    "CREATE TEXT INDEX snippet_description_lc_text IF NOT EXISTS FOR (s:CypherSnippet) ON (s.description_lc)",
+    # Backfill the lowercased search copies on snippets written before they existed
+    """
+    MATCH (s:CypherSnippet)
+    WHERE s.syntax_lc IS NULL OR s.description_lc IS NULL
+    SET s.syntax_lc = toLower(s.syntax),
+        s.description_lc = toLower(s.description)
+    """,
+)
+
+# Case-insensitive substring search over the lowercased copies of syntax and
+# description stored on each snippet, served by their TEXT indexes
+SEARCH_SNIPPETS_SUBSTRING_QUERY = """
+MATCH (c:CypherSnippet)
+WHERE c.syntax_lc CONTAINS $query_text OR c.description_lc CONTAINS $query_text
+RETURN c.id AS id,
+       c.name AS name,
+       c.description AS description,
+       c.since AS since,
+       c.syntax AS syntax
+ORDER BY c.name
+LIMIT toInteger($limit)
+"""
+
+
+# Fetches snippets with their tags by id; serves both single and multi-id lookups
+GET_SNIPPETS_QUERY = """
+MATCH (c:CypherSnippet)
+WHERE c.id IN $ids
+OPTIONAL MATCH (c)-[:TAGGED_AS]->(t:Tag)
+WITH c, collect(t.name) AS tags
+RETURN c.id AS id,
+       c.name AS name,
+       c.syntax AS syntax,
+       c.description AS description,
+       c.example AS example,
+       c.since AS since,
+       tags
+"""
+
+# Creates many snippets and their tags in one statement; existing ids are kept
+# as-is, tags included, by flagging the nodes MERGE creates
+CREATE_SNIPPETS_QUERY = """
+UNWIND $rows AS r
+MERGE (c:CypherSnippet {id: r.id})
+ON CREATE SET c.name = r.name,
+              c.syntax = r.syntax,
+              c.syntax_lc = toLower(r.syntax),
+              c.description = r.description,
+              c.description_lc = toLower(r.description),
+              c.since = r.since,
+              c.example = r.example,
+              c.lastUpdated = $ts,
+              c.isNew = true
+WITH r, c, coalesce(c.isNew, false) AS created
+REMOVE c.isNew
+FOREACH (tag IN CASE WHEN created THEN r.tags ELSE [] END |
+    MERGE (t:Tag {name: tag})
+    MERGE (c)-[:TAGGED_AS]->(t)
+)
+RETURN sum(CASE WHEN created THEN 1 ELSE 0 END) AS createdCount,
+       count(c) AS rowCount
+"""
+
+# Rows per UNWIND statement, to bound transaction memory on large imports
+CREATE_SNIPPETS_BATCH_SIZE = 10000
+
+
+# Snippet properties update_cypher_snippet can set, in SET clause order
+UPDATABLE_SNIPPET_FIELDS = ("name", "syntax", "description", "example", "since")
+
+
+@functools.lru_cache(maxsize=128)
+def _build_update_query(fields: FrozenSet[str], update_tags: bool) -> str:
+    """Build the update query for one combination of fields.
+
+    Cached so each shape of update is assembled once and always produces the
+    same text, which lets Neo4j reuse its cached plan.
+    """
+    set_clauses = ["c.lastUpdated = $ts"]
+    set_clauses.extend(f"c.{field} = ${field}" for field in UPDATABLE_SNIPPET_FIELDS if field in fields)
+    # Keep the lowercased search copies in step with the fields they mirror
+    set_clauses.extend(f"c.{field}_lc = toLower(${field})" for field in ("syntax", "description") if field in fields)
+
+    query = f"""
+    MATCH (c:CypherSnippet {{id: $id}})
+    SET {", ".join(set_clauses)}
+    """
+
+    # Replace the tags by diffing against the current ones, so relationships
+    # to tags that stay are left untouched; FOREACH keeps the row even when
+    # there is nothing to add or remove
+    if update_tags:
+        query += """
+    WITH c
+    OPTIONAL MATCH (c)-[r:TAGGED_AS]->(:Tag)
+    WITH c, collect(r) AS oldRels
+    WITH c, oldRels, [rel IN oldRels | endNode(rel).name] AS oldTags
+    FOREACH (rel IN [rel IN oldRels WHERE NOT endNode(rel).name IN $tag_list] | DELETE rel)
+    FOREACH (tag IN [tag IN $tag_list WHERE NOT tag IN oldTags] |
+        MERGE (t:Tag {name: tag})
+        MERGE (c)-[:TAGGED_AS]->(t)
+    )
+    """
+
+    query += """
+    RETURN c.id AS id, c.name AS name
+    """
+    return query
+
+
+def _is_missing_fulltext_index(error: ClientError) -> bool:
+    """Return True if error reports that a fulltext index does not exist."""
+    return "no such fulltext schema index" in str(error).lower()
+
+
+def lucene_escape(text: str) -> str:
+    """Backslash-escape Lucene operators so text is matched literally."""
+    return LUCENE_SPECIAL_CHARS.sub(r"\\\1", text)
+
+
+def to_prefix_query(text: str) -> str:
+    """Turn free text into a Lucene query matching every word as a prefix."""
+    return " AND ".join(f"{lucene_escape(term)}*" for term in text.split())
+
 
 class CypherSnippetMixin:
     """Mixin class providing Cypher snippet functionality for the Neo4jWorkflowServer."""
@@ -32,10 +225,14 @@ class CypherSnippetMixin:
         # Expected instance attributes:
         #   self.driver: AsyncDriver
         #   self.database: Optional[str]
+        #   self.bookmark_manager: AsyncBookmarkManager
         if not hasattr(self, "database"):
             self.database = database
         if not hasattr(self, "driver"):
             self.driver = driver
+        if not hasattr(self, "bookmark_manager"):
+            self.bookmark_manager = AsyncGraphDatabase.bookmark_manager()
+        self._tag_cache: Optional[Tuple[float, str]] = None
 
         super().__init__(*args, **kwargs)
 
@@ -44,134 +241,186 @@ class CypherSnippetMixin:
         raise NotImplementedError("_read_query must be implemented by the parent class")
 
     async def _write(self, tx: AsyncManagedTransaction, query: str, params: dict):
-        """Execute a write query and return results as JSON string."""
+        """Execute a write query and return the result summary (not records)."""
         raise NotImplementedError("_write must be implemented by the parent class")
 
-    async def list_cypher_snippets(self, limit: int = 20, offset: int = 0, tag: Optional[str] = None, since_version: Optional[float] = None) -> List[types.TextContent]:
-        """List all available Cypher snippets with optional filtering."""
+    async def _run_snippet_query(self, query: str, params: Dict[str, Any], routing: RoutingControl = RoutingControl.READ) -> List[Dict[str, Any]]:
+        """Run a snippet query with driver.execute_query and return its records as dicts.
+
+        execute_query borrows a pooled connection for one managed transaction,
+        with retries, so no session is opened per call. The shared bookmark
+        manager makes a read issued after a write see that write.
+        """
+        records, _, _ = await self.driver.execute_query(
+            cast(LiteralString, query), params,  # type: ignore
+            database_=self.database or None,
+            routing_=routing,
+            bookmark_manager_=self.bookmark_manager,
+        )
+        return [record.data() for record in records]
+
+    async def ensure_snippet_search_schema(self) -> None:
+        """Create the indexes used by the snippet searches if they are missing."""
+        for query in SNIPPET_SEARCH_SCHEMA_QUERIES:
+            await self._run_snippet_query(query, {}, RoutingControl.WRITE)
+
+    async def list_cypher_snippets(self, limit: int = 20, offset: int = 0, tag: Optional[str] = None, since_version: Optional[float] = None, include_tags: bool = False) -> List[types.TextContent]:
+        """List all available Cypher snippets with optional filtering.
+
+        With include_tags, each row also lists the snippet's tags, collected in
+        the same query so callers need not fetch every snippet afterwards.
+        """
         # Ensure limit and offset are integers
         limit = int(limit)
         offset = int(offset)
 
-        query = """
-        MATCH (c:CypherSnippet)
-        WHERE 1=1
-        """
-
+        # The name predicate lets the snippet_name index serve the ORDER BY, so
+        # only offset + limit entries are read instead of sorting every snippet
+        clauses = ["c.name IS NOT NULL"]
         params: dict[str, object] = {"limit": limit, "offset": offset}
 
         # Add optional filters
         if tag:
-            query += """
-            AND (c)-[:TAGGED_AS]->(:Tag {name: $tag})
-            """
+            clauses.append("(c)-[:TAGGED_AS]->(:Tag {name: $tag})")
             params["tag"] = tag
 
         if since_version is not None:
+            clauses.append("c.since <= $since_version")
+            params["since_version"] = since_version
+
+        query = f"""
+        MATCH (c:CypherSnippet)
+        USING INDEX c:CypherSnippet(name)
+        WHERE {" AND ".join(clauses)}
+        WITH c
+        ORDER BY c.name
+        SKIP toInteger($offset)
+        LIMIT toInteger($limit)
+        """
+
+        # Tags are only collected for the page of snippets being returned
+        if include_tags:
             query += """
-            AND c.since <= $since_version
+            WITH c, ' ' + reduce(tags = '', name IN [(c)-[:TAGGED_AS]->(t:Tag) | '`' + t.name + '`'] |
+                                  tags + CASE tags WHEN '' THEN '' ELSE ', ' END + name) + ' |' AS tagCell
+            """
+        else:
+            query += """
+            WITH c, '' AS tagCell
             """
-            params["since_version"] = since_version
 
+        # Format the table rows in Cypher so a single row comes back
         query += """
-        RETURN c.id AS id,
-               c.name AS name,
-               c.description AS description,
-               c.since AS since
-        ORDER BY c.name
-        SKIP $offset
-        LIMIT $limit
+        WITH collect('| ' + coalesce(c.id, 'N/A') +
+                     ' | ' + coalesce(c.name, 'N/A') +
+                     ' | ' + coalesce(toString(c.since), 'N/A') +
+                     ' | ' + coalesce(c.description, 'N/A') + ' |' + tagCell) AS rows
+        RETURN size(rows) AS count,
+               reduce(body = '', row IN rows | body + row + '\\n') AS body
         """
 
         try:
-            async with safe_neo4j_session(self.driver, self.database or "") as session:
-                results_json = await session.execute_read(self._read_query, query, params)
-                results = json.loads(results_json)
-
-                if results and len(results) > 0:
-                    text = "# Available Cypher Snippets\n\n"
-
-                    if tag:
-                        text += "Filtered by tag: `{}`\n\n".format(tag)
-                    if since_version is not None:
-                        text += "Compatible with Neo4j version: {} and newer\n\n".format(since_version)
-
-                    text += "| ID | Name | Since Version | Description |\n"
-                    text += "| -- | ---- | ------------- | ----------- |\n"
-
-                    for snippet in results:
-                        text += "| {} | {} | {} | {} |\n".format(
-                            snippet.get("id", "N/A"),
-                            snippet.get("name", "N/A"),
-                            snippet.get("since", "N/A"),
-                            snippet.get("since", "N/A") if isinstance(snippet.get("since", None), (str, float, int)) else "N/A",
-                        )
-
-                    return [types.TextContent(type="text", text=text)]
-                else:
-                    filter_msg = ""
-                    if tag:
-                        filter_msg += " with tag '{}'".format(tag)
-                    if since_version is not None:
-                        if filter_msg:
-                            filter_msg += " and"
-                        filter_msg += " compatible with Neo4j {}".format(since_version)
-
+            results = await self._run_snippet_query(query, params)
+
+            if results and results[0]["count"] > 0:
+                parts = [SNIPPET_LIST_TITLE]
+
+                if tag:
+                    parts.append("Filtered by tag: `{}`\n\n".format(tag))
+                if since_version is not None:
+                    parts.append("Compatible with Neo4j version: {} and newer\n\n".format(since_version))
+
+                parts.extend(SNIPPET_TABLE_HEADER_WITH_TAGS if include_tags else SNIPPET_TABLE_HEADER)
+                parts.append(results[0]["body"])
+
+                text = "".join(parts)
+                return [types.TextContent(type="text", text=text)]
+            else:
+                filter_msg = ""
+                if tag:
+                    filter_msg += " with tag '{}'".format(tag)
+                if since_version is not None:
                     if filter_msg:
-                        return [types.TextContent(type="text", text="No Cypher snippets found{}.".format(filter_msg))]
-                    else:
-                        return [types.TextContent(type="text", text="No Cypher snippets found in the database.")]
+                        filter_msg += " and"
+                    filter_msg += " compatible with Neo4j {}".format(since_version)
+
+                if filter_msg:
+                    return [types.TextContent(type="text", text="No Cypher snippets found{}.".format(filter_msg))]
+                else:
+                    return [types.TextContent(type="text", text="No Cypher snippets found in the database.")]
         except Exception as e:
             logger.error("Error listing Cypher snippets: {}".format(e))
             return [types.TextContent(type="text", text="Error: {}".format(e))]
 
+    def _format_snippet(self, snippet: Dict[str, Any], id: str) -> List[str]:
+        """Render one snippet record as Markdown fragments."""
+        parts = [f"# Cypher Snippet: {snippet.get('name', id)}\n\n"]
+        parts.append(f"**ID:** `{snippet.get('id', id)}`\n")
+        parts.append(f"**Neo4j Version:** {snippet.get('since', 'N/A') if isinstance(snippet.get('since', None), (str, float, int)) else 'N/A'}\n")
+        if snippet.get("tags"):
+            tags = snippet.get("tags", [])
+            tag_links = [f"`{tag}`" for tag in tags]
+            parts.append(f"**Tags:** {', '.join(tag_links)}\n")
+
+        parts.append(f"\n**Description:**\n{snippet.get('description', 'No description available.')}\n")
+
+        parts.append(f"\n**Syntax:**\n```cypher\n{snippet.get('syntax', '')}\n```\n")
+
+        if snippet.get("example"):
+            parts.append(f"\n**Example:**\n```cypher\n{snippet.get('example', '')}\n```\n")
+
+        return parts
+
     async def get_cypher_snippet(self, id: str) -> List[types.TextContent]:
         """Get a specific Cypher snippet by ID."""
-        query = """
-        MATCH (c:CypherSnippet {id: $id})
-        OPTIONAL MATCH (c)-[:TAGGED_AS]->(t:Tag)
-        WITH c, collect(t.name) AS tags
-        RETURN c.id AS id,
-               c.name AS name,
-               c.syntax AS syntax,
-               c.description AS description,
-               c.example AS example,
-               c.since AS since,
-               tags
-        """
-
         try:
-            async with safe_neo4j_session(self.driver, self.database or "") as session:
-                results_json = await session.execute_read(self._read_query, query, {"id": id})
-                results = json.loads(results_json)
+            results = await self._run_snippet_query(GET_SNIPPETS_QUERY, {"ids": [id]})
 
-                if results and len(results) > 0:
-                    snippet = results[0]
-                    text = f"# Cypher Snippet: {snippet.get('name', id)}\n\n"
-                    text += f"**ID:** `{snippet.get('id', id)}`\n"
-                    text += f"**Neo4j Version:** {snippet.get('since', 'N/A')}\n"
-                    text += f"**Neo4j Version:** {snippet.get('since', 'N/A') if isinstance(snippet.get('since', None), (str, float, int)) else 'N/A'}\n"
-                    if snippet.get("tags"):
-                        tags = snippet.get("tags", [])
-                        tag_links = [f"`{tag}`" for tag in tags]
-                        text += f"**Tags:** {', '.join(tag_links)}\n"
-
-                    text += f"\n**Description:**\n{snippet.get('description', 'No description available.')}\n"
+            if results and len(results) > 0:
+                text = "".join(self._format_snippet(results[0], id))
+                return [types.TextContent(type="text", text=text)]
+            else:
+                return [types.TextContent(type="text", text=f"No Cypher snippet found with ID '{id}'")]
+        except Exception as e:
+            logger.error(f"Error retrieving Cypher snippet: {e}")
+            return [types.TextContent(type="text", text=f"Error: {e}")]
 
-                    text += f"\n**Syntax:**\n```cypher\n{snippet.get('syntax', '')}\n```\n"
+    async def get_cypher_snippets(self, ids: List[str]) -> List[types.TextContent]:
+        """Get several Cypher snippets by ID in one query."""
+        if not ids:
+            return [types.TextContent(type="text", text="Error: No snippet IDs provided")]
 
-                    if snippet.get("example"):
-                        text += f"\n**Example:**\n```cypher\n{snippet.get('example', '')}\n```\n"
+        try:
+            results = await self._run_snippet_query(GET_SNIPPETS_QUERY, {"ids": ids})
+            found = {snippet["id"]: snippet for snippet in results}
 
-                    return [types.TextContent(type="text", text=text)]
+            parts: List[str] = []
+            for snippet_id in ids:
+                if snippet_id in found:
+                    parts.extend(self._format_snippet(found[snippet_id], snippet_id))
                 else:
-                    return [types.TextContent(type="text", text=f"No Cypher snippet found with ID '{id}'")]
+                    parts.append(f"# No Cypher snippet found with ID '{snippet_id}'\n")
+                parts.append("\n")
+
+            text = "".join(parts)
+            return [types.TextContent(type="text", text=text)]
         except Exception as e:
-            logger.error(f"Error retrieving Cypher snippet: {e}")
+            logger.error(f"Error retrieving Cypher snippets: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
+    async def snippet_dashboard(self) -> List[types.TextContent]:
+        """Show the snippet listing and tag overview together."""
+        # The two reads are independent, so overlap their round trips
+        listing, tags = await asyncio.gather(self.list_cypher_snippets(), self.get_cypher_tags())
+        text = "\n\n".join(content.text for content in (*listing, *tags))
+        return [types.TextContent(type="text", text=text)]
+
     async def search_cypher_snippets(self, query_text: str, search_type: str = "text", limit: int = 10) -> List[types.TextContent]:
-        """Search for Cypher snippets by keyword, tag, or pattern."""
+        """Search for Cypher snippets by keyword, substring, tag, or pattern.
+
+        The substring search matches literal fragments such as `-[:` that the
+        fulltext analyzer would split apart, ignoring case.
+        """
         # Ensure limit is an integer
         limit = int(limit)
 
@@ -179,34 +428,20 @@ class CypherSnippetMixin:
         params = {"query_text": query_text, "limit": limit}
 
         if search_type.lower() == "text":
-            # Text search using TEXT index
-            params["search_pattern"] = f"(?i).*{query_text}.*"  # Case-insensitive
-            query = """
-            MATCH (c:CypherSnippet)
-            WHERE c.syntax =~ $search_pattern
-               OR c.description =~ $search_pattern
-            RETURN c.id AS id,
-                   c.name AS name,
-                   c.description AS description,
-                   c.since AS since,
-                   c.syntax AS syntax
-            ORDER BY c.name
-            LIMIT $limit
-            """
+            # Plain text: escape it and match each word as a prefix in the FULLTEXT index
+            if not query_text.strip():
+                return [types.TextContent(type="text", text="Error: Search text must not be empty")]
+            params["query_text"] = to_prefix_query(query_text)
+            query = SEARCH_SNIPPETS_FULLTEXT_QUERY
         elif search_type.lower() == "fulltext":
-            # Full-text search using FULLTEXT index
-            query = """
-            CALL db.index.fulltext.queryNodes('snippet_fulltext', $query_text)
-            YIELD node, score
-            RETURN node.id AS id,
-                   node.name AS name,
-                   node.description AS description,
-                   node.since AS since,
-                   node.syntax AS syntax,
-                   score
-            ORDER BY score DESC
-            LIMIT $limit
-            """
+            # Full-text search using FULLTEXT index, with raw Lucene syntax
+            query = SEARCH_SNIPPETS_FULLTEXT_QUERY
+        elif search_type.lower() == "substring":
+            # Literal substring: lowercase once here and match the stored lowercased copies
+            if not query_text:
+                return [types.TextContent(type="text", text="Error: Search text must not be empty")]
+            params["query_text"] = query_text.lower()
+            query = SEARCH_SNIPPETS_SUBSTRING_QUERY
         elif search_type.lower() == "tag":
             # Tag search
             query = """
@@ -218,38 +453,48 @@ class CypherSnippetMixin:
                    c.since AS since,
                    c.syntax AS syntax
             ORDER BY c.name
-            LIMIT $limit
+            LIMIT toInteger($limit)
             """
         else:
-            error_msg = f"Invalid search type: '{search_type}'. Valid options are 'text', 'fulltext', or 'tag'."
+            error_msg = f"Invalid search type: '{search_type}'. Valid options are 'text', 'fulltext', 'substring', or 'tag'."
             return [types.TextContent(type="text", text=error_msg)]
 
         try:
-            async with safe_neo4j_session(self.driver, self.database or "") as session:
-                results_json = await session.execute_read(self._read_query, query, params)
-                results = json.loads(results_json)
-
-                if results and len(results) > 0:
-                    text = "# Cypher Snippet Search Results\n\n"
-                    text += f"Query: '{query_text}' (Search type: {search_type})\n\n"
-
-                    for i, snippet in enumerate(results, 1):
-                        score_text = ""
-                        if "score" in snippet:
-                            score_text = f" (Score: {snippet.get('score', 'N/A')})"
-
-                        text += f"## {i}. {snippet.get('name', 'Unnamed Snippet')}{score_text}\n\n"
-                        text += f"**ID:** `{snippet.get('id', 'unknown')}`\n"
-                        text += f"**Description:** {snippet.get('description', 'No description')}\n"
-                        text += f"**Syntax:** `{snippet.get('syntax', 'No syntax')}`\n\n"
-
-                    view_details_msg = '\nUse `get_cypher_snippet(id="snippet-id")` to view full details of any result.'
-                    text += view_details_msg
-
-                    return [types.TextContent(type="text", text=text)]
-                else:
-                    not_found_msg = f"No Cypher snippets found matching '{query_text}' with search type '{search_type}'."
-                    return [types.TextContent(type="text", text=not_found_msg)]
+            try:
+                results = await self._run_snippet_query(query, params)
+            except ClientError as e:
+                # Databases created before snippet_fulltext existed can still be
+                # searched by plain text, just without the index
+                if search_type.lower() != "text" or not _is_missing_fulltext_index(e):
+                    raise
+                logger.warning("snippet_fulltext index missing, falling back to a regex scan")
+                results = await self._run_snippet_query(
+                    SEARCH_SNIPPETS_REGEX_QUERY,
+                    {"search_pattern": f"(?i).*{re.escape(query_text)}.*", "limit": limit},
+                )
+
+            if results and len(results) > 0:
+                parts = ["# Cypher Snippet Search Results\n\n"]
+                parts.append(f"Query: '{query_text}' (Search type: {search_type})\n\n")
+
+                for i, snippet in enumerate(results, 1):
+                    score_text = ""
+                    if "score" in snippet:
+                        score_text = f" (Score: {snippet.get('score', 'N/A')})"
+
+                    parts.append(f"## {i}. {snippet.get('name', 'Unnamed Snippet')}{score_text}\n\n")
+                    parts.append(f"**ID:** `{snippet.get('id', 'unknown')}`\n")
+                    parts.append(f"**Description:** {snippet.get('description', 'No description')}\n")
+                    parts.append(f"**Syntax:** `{snippet.get('syntax', 'No syntax')}`\n\n")
+
+                view_details_msg = '\nUse `get_cypher_snippet(id="snippet-id")` to view full details of any result.'
+                parts.append(view_details_msg)
+
+                text = "".join(parts)
+                return [types.TextContent(type="text", text=text)]
+            else:
+                not_found_msg = f"No Cypher snippets found matching '{query_text}' with search type '{search_type}'."
+                return [types.TextContent(type="text", text=not_found_msg)]
         except Exception as e:
             logger.error(f"Error searching Cypher snippets: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
@@ -264,9 +509,11 @@ class CypherSnippetMixin:
         MERGE (c:CypherSnippet {id: $id})
         ON CREATE SET c.name = $name,
                       c.syntax = $syntax,
+                      c.syntax_lc = toLower($syntax),
                       c.description = $description,
+                      c.description_lc = toLower($description),
                       c.since = $since,
-                      c.lastUpdated = date()
+                      c.lastUpdated = $ts
         """
 
         params = {
@@ -276,6 +523,7 @@ class CypherSnippetMixin:
             "description": description,
             "since": float(snippet_since),  # Always store as float
             "tags": snippet_tags,
+            "ts": datetime.now(timezone.utc),
         }
         if example:
             query += ", c.example = $example"
@@ -290,133 +538,158 @@ class CypherSnippetMixin:
         """
 
         try:
-            async with safe_neo4j_session(self.driver, self.database or "") as session:
-                results_json = await session.execute_write(self._write, query, params)
-                results = json.loads(results_json)
-
-                if results and len(results) > 0:
-                    success_msg = f"Successfully created Cypher snippet '{name}' with ID: {id}"
-                    return [types.TextContent(type="text", text=success_msg)]
-                else:
-                    return [types.TextContent(type="text", text="Error creating Cypher snippet")]
+            results = await self._run_snippet_query(query, params, RoutingControl.WRITE)
+            self._tag_cache = None
+
+            if results and len(results) > 0:
+                success_msg = f"Successfully created Cypher snippet '{name}' with ID: {id}"
+                return [types.TextContent(type="text", text=success_msg)]
+            else:
+                return [types.TextContent(type="text", text="Error creating Cypher snippet")]
         except Exception as e:
             logger.error(f"Error creating Cypher snippet: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
-    async def update_cypher_snippet(self, id: str, name: Optional[str] = None, syntax: Optional[str] = None, description: Optional[str] = None, example: Optional[str] = None, since: Optional[float] = None, tags: Optional[List[str]] = None) -> List[types.TextContent]:
-        """Update an existing Cypher snippet."""
-        # Build dynamic SET clause based on provided parameters
-        set_clauses = ["c.lastUpdated = date()"]
-        params: dict[str, object] = {"id": id}
-
-        if name is not None:
-            set_clauses.append("c.name = $name")
-            params["name"] = name
-
-        if syntax is not None:
-            set_clauses.append("c.syntax = $syntax")
-            params["syntax"] = syntax
+    async def create_cypher_snippets(self, snippets: List[Dict[str, Any]]) -> List[types.TextContent]:
+        """Add many Cypher snippets to the database in a single transaction.
 
-        if description is not None:
-            set_clauses.append("c.description = $description")
-            params["description"] = description
+        Each snippet takes the same fields as create_cypher_snippet: id, name,
+        syntax and description are required; example, since and tags are optional.
+        """
+        if not snippets:
+            return [types.TextContent(type="text", text="Error: No snippets provided")]
+
+        rows = []
+        for snippet in snippets:
+            missing = [field for field in ("id", "name", "syntax", "description") if not snippet.get(field)]
+            if missing:
+                error_msg = f"Error: Snippet '{snippet.get('id', 'unknown')}' is missing required fields: {', '.join(missing)}"
+                return [types.TextContent(type="text", text=error_msg)]
+
+            rows.append({
+                "id": snippet["id"],
+                "name": snippet["name"],
+                "syntax": snippet["syntax"],
+                "description": snippet["description"],
+                "example": snippet.get("example"),
+                "since": float(snippet.get("since") or 5.0),  # Always store as float
+                "tags": list(snippet.get("tags") or []),
+            })
+
+        # Every snippet in the import shares one timestamp
+        ts = datetime.now(timezone.utc)
+
+        async def create_batches(tx: AsyncManagedTransaction) -> int:
+            created = 0
+            for start in range(0, len(rows), CREATE_SNIPPETS_BATCH_SIZE):
+                result = await tx.run(CREATE_SNIPPETS_QUERY, rows=rows[start:start + CREATE_SNIPPETS_BATCH_SIZE], ts=ts)
+                record = await result.single()
+                created += record["createdCount"] if record else 0
+            return created
 
-        if example is not None:
-            set_clauses.append("c.example = $example")
-            params["example"] = example
+        try:
+            # The shared bookmark manager lets later snippet reads see the import
+            async with safe_neo4j_session(self.driver, self.database or "", bookmark_manager=self.bookmark_manager) as session:
+                created = await session.execute_write(create_batches)
+            self._tag_cache = None
+
+            skipped = len(rows) - created
+            text = f"Successfully created {created} Cypher snippets, skipped {skipped} existing"
+            return [types.TextContent(type="text", text=text)]
+        except Exception as e:
+            logger.error(f"Error creating Cypher snippets: {e}")
+            return [types.TextContent(type="text", text=f"Error: {e}")]
 
-        if since is not None:
-            set_clauses.append("c.since = $since")
-            params["since"] = float(since)  # Always store as float
-        # Build the query
-        query = f"""
-        MATCH (c:CypherSnippet {{id: $id}})
-        SET {", ".join(set_clauses)}
-        """
+    async def update_cypher_snippet(self, id: str, name: Optional[str] = None, syntax: Optional[str] = None, description: Optional[str] = None, example: Optional[str] = None, since: Optional[float] = None, tags: Optional[List[str]] = None) -> List[types.TextContent]:
+        """Update an existing Cypher snippet."""
+        values = {
+            "name": name,
+            "syntax": syntax,
+            "description": description,
+            "example": example,
+            "since": float(since) if since is not None else None,  # Always store as float
+        }
+        present = frozenset(field for field, value in values.items() if value is not None)
 
-        # Handle tag updates if provided
+        params: dict[str, object] = {"id": id, "ts": datetime.now(timezone.utc)}
+        params.update((field, values[field]) for field in present)
         if tags is not None:
-            query += """
-            WITH c
-            OPTIONAL MATCH (c)-[r:TAGGED_AS]->(:Tag)
-            DELETE r
-            WITH c
-            UNWIND $tag_list AS tag
-              MERGE (t:Tag {name: tag})
-              MERGE (c)-[:TAGGED_AS]->(t)
-            """
             params["tag_list"] = tags
 
-        query += """
-        RETURN c.id AS id, c.name AS name
-        """
+        query = _build_update_query(present, tags is not None)
 
         try:
-            async with safe_neo4j_session(self.driver, self.database or "") as session:
-                results_json = await session.execute_write(self._write, query, params)
-                results = json.loads(results_json)
-
-                if results and len(results) > 0:
-                    updated_name = results[0].get("name", id)
-                    success_msg = f"Successfully updated Cypher snippet '{updated_name}' with ID: {id}"
-                    return [types.TextContent(type="text", text=success_msg)]
-                else:
-                    not_found_msg = f"No Cypher snippet found with ID '{id}'"
-                    return [types.TextContent(type="text", text=not_found_msg)]
+            results = await self._run_snippet_query(query, params, RoutingControl.WRITE)
+            if tags is not None:
+                self._tag_cache = None
+
+            if results and len(results) > 0:
+                updated_name = results[0].get("name", id)
+                success_msg = f"Successfully updated Cypher snippet '{updated_name}' with ID: {id}"
+                return [types.TextContent(type="text", text=success_msg)]
+            else:
+                not_found_msg = f"No Cypher snippet found with ID '{id}'"
+                return [types.TextContent(type="text", text=not_found_msg)]
         except Exception as e:
             logger.error(f"Error updating Cypher snippet: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
     async def delete_cypher_snippet(self, id: str) -> List[types.TextContent]:
         """Delete a Cypher snippet from the database."""
+        # Capture the id before DETACH DELETE so the count does not read a deleted node
         query = """
         MATCH (c:CypherSnippet {id: $id})
-        OPTIONAL MATCH (c)-[r]-()
-        DELETE r, c
-        RETURN count(c) AS deleted
+        WITH c, c.id AS deletedId
+        DETACH DELETE c
+        RETURN count(deletedId) AS deleted
         """
 
         try:
-            async with safe_neo4j_session(self.driver, self.database or "") as session:
-                results_json = await session.execute_write(self._write, query, {"id": id})
-                results = json.loads(results_json)
-
-                if results and results[0].get("deleted", 0) > 0:
-                    success_msg = f"Successfully deleted Cypher snippet with ID: {id}"
-                    return [types.TextContent(type="text", text=success_msg)]
-                else:
-                    not_found_msg = f"No Cypher snippet found with ID '{id}'"
-                    return [types.TextContent(type="text", text=not_found_msg)]
+            results = await self._run_snippet_query(query, {"id": id}, RoutingControl.WRITE)
+            self._tag_cache = None
+
+            if results and results[0].get("deleted", 0) > 0:
+                success_msg = f"Successfully deleted Cypher snippet with ID: {id}"
+                return [types.TextContent(type="text", text=success_msg)]
+            else:
+                not_found_msg = f"No Cypher snippet found with ID '{id}'"
+                return [types.TextContent(type="text", text=not_found_msg)]
         except Exception as e:
             logger.error(f"Error deleting Cypher snippet: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
     async def get_cypher_tags(self) -> List[types.TextContent]:
-        """Get all tags used for Cypher snippets."""
+        """Get all tags used for Cypher snippets.
+
+        The table is cached for TAG_CACHE_TTL seconds, since tags only change
+        when snippets are created, retagged or deleted.
+        """
+        cached = self._tag_cache
+        if cached and time.monotonic() - cached[0] < TAG_CACHE_TTL:
+            return [types.TextContent(type="text", text=cached[1])]
+
         query = """
         MATCH (t:Tag)<-[:TAGGED_AS]-(c:CypherSnippet)
         WITH t, count(c) AS snippet_count
-        RETURN t.name AS name, snippet_count
-        ORDER BY snippet_count DESC, name
+        ORDER BY snippet_count DESC, t.name
+        WITH collect('| ' + coalesce(t.name, 'N/A') + ' | ' + toString(snippet_count) + ' |') AS rows
+        RETURN size(rows) AS count,
+               reduce(body = '', row IN rows | body + row + '\\n') AS body
         """
 
         try:
-            async with safe_neo4j_session(self.driver, self.database or "") as session:
-                results_json = await session.execute_read(self._read_query, query, {})
-                results = json.loads(results_json)
-
-                if results and len(results) > 0:
-                    text = "# Cypher Snippet Tags\n\n"
-                    text += "| Tag | Snippet Count |\n"
-                    text += "| --- | ------------- |\n"
-
-                    for tag in results:
-                        text += f"| {tag.get('name', 'N/A')} | {tag.get('snippet_count', 0)} |\n"
-
-                    return [types.TextContent(type="text", text=text)]
-                else:
-                    no_tags_msg = "No tags found for Cypher snippets."
-                    return [types.TextContent(type="text", text=no_tags_msg)]
+            results = await self._run_snippet_query(query, {})
+
+            if results and results[0]["count"] > 0:
+                parts = list(TAG_TABLE_HEADER)
+                parts.append(results[0]["body"])
+
+                text = "".join(parts)
+                self._tag_cache = (time.monotonic(), text)
+                return [types.TextContent(type="text", text=text)]
+            else:
+                no_tags_msg = "No tags found for Cypher snippets."
+                return [types.TextContent(type="text", text=no_tags_msg)]
         except Exception as e:
             logger.error(f"Error retrieving Cypher tags: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
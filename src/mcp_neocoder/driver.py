@@ -0,0 +1,60 @@
+"""
+Shared Neo4j Driver for NeoCoder
+
+This module provides a process-wide AsyncDriver for standalone scripts, so
+repeated calls reuse one warm Bolt connection pool instead of paying
+connection, TLS and routing setup on every call. The server creates and owns
+its own driver.
+"""
+
+import logging
+import os
+from typing import Optional
+
+from neo4j import AsyncDriver, AsyncGraphDatabase
+
+from .process_manager import track_driver, untrack_driver
+
+logger = logging.getLogger("mcp_neocoder")
+
+# Pool settings for the shared driver
+DRIVER_CONFIG = {
+    "max_connection_pool_size": int(os.environ.get("NEO4J_MAX_CONNECTIONS", "100")),
+    "connection_acquisition_timeout": 30.0,
+    "max_connection_lifetime": 3600,
+    "keep_alive": True,
+}
+
+# Process-wide driver instance, created lazily by get_driver()
+_DRIVER: Optional[AsyncDriver] = None
+
+
+def get_driver() -> AsyncDriver:
+    """Return the shared Neo4j driver, creating it on first use.
+
+    Connection details are read from the NEO4J_URL, NEO4J_USERNAME and
+    NEO4J_PASSWORD environment variables.
+    """
+    global _DRIVER
+
+    if _DRIVER is None:
+        uri = os.environ.get("NEO4J_URL", "bolt://localhost:7687")
+        username = os.environ.get("NEO4J_USERNAME", "neo4j")
+        password = os.environ.get("NEO4J_PASSWORD", "password")
+
+        logger.info("Creating shared Neo4j driver for %s", uri)
+        _DRIVER = AsyncGraphDatabase.driver(uri, auth=(username, password), **DRIVER_CONFIG)
+        track_driver(_DRIVER)
+
+    return _DRIVER
+
+
+async def close_driver() -> None:
+    """Close the shared Neo4j driver if it has been created."""
+    global _DRIVER
+
+    if _DRIVER is not None:
+        driver, _DRIVER = _DRIVER, None
+        untrack_driver(driver)
+        await driver.close()
+        logger.info("Shared Neo4j driver closed")
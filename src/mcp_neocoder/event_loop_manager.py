@@ -7,10 +7,17 @@ particularly for Neo4j async operations that need to run in the same event loop
 
 import asyncio
 import logging
+import os
 from contextlib import asynccontextmanager
 from typing import Optional
 from neo4j import AsyncDriver
 
+# uvloop is optional; the stdlib loop is used when it is not installed
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 logger = logging.getLogger("mcp_neocoder")
 
 # Global reference to the main event loop used for Neo4j operations
@@ -45,6 +52,40 @@ def initialize_main_loop() -> asyncio.AbstractEventLoop:
 
     return loop
 
+def install_event_loop_policy() -> None:
+    """Configure how the application's event loops are created.
+
+    New loops use uvloop when it is installed. Setting NEOCODER_EAGER_TASKS=1
+    also opts into the eager task factory (Python 3.12+), so tasks that finish
+    without suspending never wait for a loop iteration; it is off by default
+    because it changes when every task on the loop starts, including the MCP
+    server's and the Neo4j driver's. Without either, the default policy is
+    left untouched. Must be called before the application creates its first
+    loop; loops that already exist are left unchanged.
+    """
+    eager_task_factory = None
+    if os.environ.get("NEOCODER_EAGER_TASKS", "").lower() in ("1", "true", "yes"):
+        eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+    if uvloop is None and eager_task_factory is None:
+        return
+
+    base_policy = uvloop.EventLoopPolicy if uvloop is not None else asyncio.DefaultEventLoopPolicy
+
+    class NeoCoderEventLoopPolicy(base_policy):  # type: ignore[misc, valid-type]
+        def new_event_loop(self) -> asyncio.AbstractEventLoop:
+            loop = super().new_event_loop()
+            if eager_task_factory is not None:
+                loop.set_task_factory(eager_task_factory)
+            return loop
+
+    asyncio.set_event_loop_policy(NeoCoderEventLoopPolicy())
+    logger.info(
+        "Using %s event loops%s",
+        "uvloop" if uvloop is not None else "asyncio",
+        " with eager tasks" if eager_task_factory is not None else "",
+    )
+
 def get_main_loop() -> Optional[asyncio.AbstractEventLoop]:
     """Get the main event loop used for Neo4j operations."""
     global _MAIN_LOOP
@@ -97,12 +138,13 @@ async def _handle_session_creation(driver: AsyncDriver, database: str, **kwargs)
 
 
 @asynccontextmanager
-async def safe_neo4j_session(driver: AsyncDriver, database: str):
+async def safe_neo4j_session(driver: AsyncDriver, database: str, **session_kwargs):
     """
     Create a Neo4j session safely, ensuring event loop consistency and proper tracking.
 
     This context manager helps avoid "attached to different loop" errors
-    by ensuring consistent event loop usage with Neo4j operations.
+    by ensuring consistent event loop usage with Neo4j operations. Extra
+    keyword arguments (e.g. bookmark_manager) are passed to driver.session().
     """
     # Import tracking functions
     from .process_manager import track_session, untrack_session
@@ -110,7 +152,7 @@ async def safe_neo4j_session(driver: AsyncDriver, database: str):
     session_cm = None
     try:
         # Create session using the helper function that handles coroutines/context managers
-        session_cm = await _handle_session_creation(driver, database)
+        session_cm = await _handle_session_creation(driver, database, **session_kwargs)
 
         # Track the session for cleanup
         track_session(session_cm)
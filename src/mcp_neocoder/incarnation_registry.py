@@ -24,6 +24,8 @@ class IncarnationRegistry:
         self.instances: Dict[str, BaseIncarnation] = {}
         self.loaded_modules = set()
         self.dynamic_types = {}  # Still needed for compatibility with existing code
+        # Set once the incarnations directory has been scanned; see invalidate()
+        self._discovered = False
 
     def register(self, incarnation_class: Type[BaseIncarnation]) -> None:
         """Register an incarnation class with the registry.
@@ -174,11 +176,20 @@ class IncarnationRegistry:
         logger.info(f"Discovered incarnation identifiers: {list(identifiers.keys())}")
         return identifiers
 
+    def invalidate(self) -> None:
+        """Make the next discover() call rescan the incarnations directory."""
+        self._discovered = False
+
     def discover(self) -> None:
         """Discover and register all incarnation classes in the package.
 
         This method scans the incarnations directory for classes that inherit from BaseIncarnation.
+        The scan runs once; later calls return immediately until invalidate() is called.
         """
+        if self._discovered:
+            logger.debug("Incarnations already discovered, skipping scan")
+            return
+
         # Discover incarnation identifiers first
         self.discover_incarnation_identifiers()
 
@@ -254,6 +265,8 @@ class IncarnationRegistry:
             except Exception as e:
                 logger.error(f"Error importing incarnation module {module_name}: {e}")
 
+        self._discovered = True
+
     def discover_incarnations(self) -> List[str]:
         """Discover all incarnation types based on module filenames.
 
@@ -455,6 +468,7 @@ Each entity in the system has full tracking and audit capabilities.
             with open(output_path, 'w') as f:
                 f.write(template)
             logger.info(f"Created template incarnation file: {output_path}")
+            self.invalidate()
             return output_path
         except Exception as e:
             logger.error(f"Error creating template incarnation file: {e}")
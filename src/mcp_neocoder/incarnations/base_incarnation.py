@@ -8,9 +8,14 @@ The design follows a plugin architecture where different incarnations can be dyn
 discovered and loaded without requiring central registration of types.
 """
 
+import asyncio
 import json
 import logging
-from typing import List, cast
+import re
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple, cast
 try:
     from typing import LiteralString
 except ImportError:
@@ -18,12 +23,92 @@ except ImportError:
     LiteralString = str
 
 import mcp.types as types
-from neo4j import AsyncDriver, AsyncManagedTransaction
+from neo4j import AsyncDriver, AsyncManagedTransaction, AsyncSession
 
 from ..action_templates import ActionTemplateMixin
 
 logger = logging.getLogger("mcp_neocoder.incarnations.base")
 
+# Hub queries shared by all incarnations. The hub id is always a parameter so
+# Neo4j compiles each query once and reuses the cached plan for every hub.
+ENSURE_HUB_QUERY = """
+MERGE (hub:AiGuidanceHub {id: $hub_id})
+ON CREATE SET hub.description = $description,
+              hub.created_at = datetime(),
+              hub.updated_at = datetime()
+ON MATCH SET hub.updated_at = datetime()
+RETURN hub
+"""
+
+CREATE_HUB_IF_MISSING_QUERY = """
+MERGE (hub:AiGuidanceHub {id: $hub_id})
+ON CREATE SET hub.description = $description
+RETURN hub
+"""
+
+GET_HUB_DESCRIPTION_QUERY = """
+MATCH (hub:AiGuidanceHub {id: $hub_id})
+RETURN hub.description AS description
+LIMIT 1
+"""
+
+# Session bound by BaseIncarnation.use_session for the current task, if any
+_BOUND_SESSION: ContextVar[Optional[AsyncSession]] = ContextVar("neocoder_bound_session", default=None)
+
+# Seconds a loaded hub description is served from memory before re-reading it
+HUB_CACHE_TTL = 60.0
+
+# Bulk MERGE template. Labels and property keys cannot be parameters, so they
+# are formatted in after validation; the rows themselves are always a parameter.
+BULK_MERGE_QUERY_TEMPLATE = """
+UNWIND $rows AS row
+MERGE (n:`{label}` {{`{key}`: row[$key]}})
+ON CREATE SET n.created = datetime()
+SET n += row,
+    n.updated = datetime()
+RETURN count(n) AS merged
+"""
+
+async def run_query(tx: AsyncManagedTransaction, query: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+    """Transaction function that runs one query and returns its records.
+
+    Pass it straight to execute_read/execute_write with the query and params
+    as extra arguments instead of wrapping tx.run in a lambda per call.
+    """
+    result = await tx.run(cast(LiteralString, query), params or {})  # type: ignore
+    return await result.data()
+
+
+async def read_hub_description(tx: AsyncManagedTransaction, hub_id: str) -> Optional[str]:
+    """Transaction function returning a hub's description, or None if it is missing."""
+    result = await tx.run(GET_HUB_DESCRIPTION_QUERY, {"hub_id": hub_id})
+    record = await result.single()
+    return record["description"] if record else None
+
+
+_IDENTIFIER_PATTERN = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+async def bulk_merge(session, label: str, rows: List[Dict[str, Any]], key: str) -> int:
+    """MERGE many nodes of one label in a single write transaction.
+
+    Each row is a property map that must contain ``key``; the node is matched
+    on that property and all row properties are set on it. Returns the number
+    of nodes merged.
+    """
+    for identifier in (label, key):
+        if not _IDENTIFIER_PATTERN.match(identifier):
+            raise ValueError(f"Invalid label or property key: {identifier!r}")
+
+    query = BULK_MERGE_QUERY_TEMPLATE.format(label=label, key=key)
+
+    async def merge_rows(tx: AsyncManagedTransaction) -> int:
+        result = await tx.run(cast(LiteralString, query), {"rows": rows, "key": key})  # type: ignore
+        record = await result.single()
+        return record["merged"] if record else 0
+
+    return await session.execute_write(merge_rows)
+
 
 class BaseIncarnation(ActionTemplateMixin):
     """Base class for all incarnation implementations."""
@@ -137,6 +222,36 @@ Available templates for diversity preservation:
         self.driver = driver
         self.database = database
 
+        # Cached (load time, description) for this incarnation's hub
+        self._hub_cache: Optional[Tuple[float, str]] = None
+        self._hub_lock = asyncio.Lock()
+
+    @contextmanager
+    def use_session(self, session: AsyncSession) -> Iterator[AsyncSession]:
+        """Run session-aware methods on an existing session within this block.
+
+        The binding is held in a ContextVar, so it only applies to the current
+        task and is never exposed through tool signatures.
+        """
+        token = _BOUND_SESSION.set(session)
+        try:
+            yield session
+        finally:
+            _BOUND_SESSION.reset(token)
+
+    @asynccontextmanager
+    async def _session(self) -> AsyncIterator[AsyncSession]:
+        """Yield the session bound by use_session, or open a new one."""
+        from ..event_loop_manager import safe_neo4j_session
+
+        session = _BOUND_SESSION.get()
+        if session is not None:
+            yield session
+            return
+
+        async with safe_neo4j_session(self.driver, self.database) as session:
+            yield session
+
     async def initialize_schema(self):
         """Initialize the Neo4j schema for this incarnation."""
         from ..event_loop_manager import safe_neo4j_session
@@ -147,7 +262,7 @@ Available templates for diversity preservation:
                 async with safe_neo4j_session(self.driver, self.database) as session:
                     # Execute each constraint/index query individually
                     for query in self.schema_queries:
-                        await session.execute_write(lambda tx: tx.run(query).consume())  # type: ignore
+                        await session.execute_write(run_query, query)
 
                 # Create guidance hub if needed
                 await self.ensure_hub_exists()
@@ -169,36 +284,21 @@ Available templates for diversity preservation:
 
         hub_id = f"{self.name}_hub"
 
-        # Also ensure universal base_hub exists for cross-incarnation access
-        base_hub_query = """
-        MERGE (hub:AiGuidanceHub {id: 'base_hub'})
-        ON CREATE SET hub.description = $description,
-                      hub.created_at = datetime(),
-                      hub.updated_at = datetime()
-        ON MATCH SET hub.updated_at = datetime()
-        RETURN hub
-        """
-
-        incarnation_hub_query = """
-        MERGE (hub:AiGuidanceHub {id: $hub_id})
-        ON CREATE SET hub.description = $description,
-                      hub.created_at = datetime(),
-                      hub.updated_at = datetime()
-        ON MATCH SET hub.updated_at = datetime()
-        RETURN hub
-        """
-
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                # Create universal base hub
-                await session.execute_write(lambda tx: tx.run(base_hub_query, {"description": self.hub_content}))
+                # Create universal base hub for cross-incarnation access
+                await session.execute_write(run_query, ENSURE_HUB_QUERY, {
+                    "hub_id": "base_hub",
+                    "description": self.hub_content
+                })
 
                 # Create incarnation-specific hub
-                await session.execute_write(lambda tx: tx.run(incarnation_hub_query, {
+                await session.execute_write(run_query, ENSURE_HUB_QUERY, {
                     "hub_id": hub_id,
                     "description": self.hub_content
-                }))
+                })
 
+                self._hub_cache = None
                 logger.info(f"Ensured base_hub and {self.name}_hub exist")
         except Exception as e:
             logger.error(f"Error creating hubs for {self.name}: {e}")
@@ -210,25 +310,27 @@ Available templates for diversity preservation:
 
         hub_id = f"{self.name}_hub"
 
-        query = """
-        MATCH (hub:AiGuidanceHub {id: $hub_id})
-        RETURN hub.description AS description
-        """
+        cached = self._hub_cache
+        if cached and time.monotonic() - cached[0] < HUB_CACHE_TTL:
+            return [types.TextContent(type="text", text=cached[1])]
 
         try:
-            async with safe_neo4j_session(self.driver, self.database) as session:
-                results = await session.execute_read(
-                    lambda tx: self._read_query(tx, query, {"hub_id": hub_id})
-                )
-                results = json.loads(results)
+            async with self._hub_lock:
+                # Another caller may have loaded the hub while we waited
+                cached = self._hub_cache
+                if cached and time.monotonic() - cached[0] < HUB_CACHE_TTL:
+                    return [types.TextContent(type="text", text=cached[1])]
 
-                if results and len(results) > 0:
-                    return [types.TextContent(type="text", text=results[0]["description"])]
-                else:
-                    # If hub doesn't exist, create it
-                    await self.ensure_hub_exists()
-                    # Try again
-                    return await self.get_guidance_hub()
+                async with safe_neo4j_session(self.driver, self.database) as session:
+                    description = await session.execute_read(read_hub_description, hub_id)
+
+                if description:
+                    self._hub_cache = (time.monotonic(), description)
+                    return [types.TextContent(type="text", text=description)]
+
+            # If hub doesn't exist, create it outside the lock and try again
+            await self.ensure_hub_exists()
+            return await self.get_guidance_hub()
         except Exception as e:
             logger.error(f"Error retrieving guidance hub for {self.name}: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
@@ -237,18 +339,12 @@ Available templates for diversity preservation:
         """Get the universal base guidance hub content available to all incarnations."""
         from ..event_loop_manager import safe_neo4j_session
 
-        query = """
-        MATCH (hub:AiGuidanceHub {id: 'base_hub'})
-        RETURN hub.description AS description
-        """
-
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                results = await session.execute_read(lambda tx: self._read_query(tx, query, {}))
-                results = json.loads(results)
+                description = await session.execute_read(read_hub_description, "base_hub")
 
-                if results and len(results) > 0:
-                    return [types.TextContent(type="text", text=results[0]["description"])]
+                if description:
+                    return [types.TextContent(type="text", text=description)]
                 else:
                     # If base hub doesn't exist, create it
                     await self.ensure_hub_exists()
@@ -293,7 +389,8 @@ Available templates for diversity preservation:
         # Skip these common non-tool methods
         excluded_methods = {
             'initialize_schema', 'get_guidance_hub', 'register_tools',
-            'list_tool_methods', 'ensure_hub_exists', '_read_query', '_write'
+            'list_tool_methods', 'ensure_hub_exists', '_read_query', '_write',
+            'use_session'
         }
 
         for name, method_obj in class_dict.items():
@@ -318,7 +415,7 @@ Available templates for diversity preservation:
                         getattr(return_type, '__args__', [None])[0] == types.TextContent
                     ):
                         is_tool = True
-                        logger.debug(f"Identified tool method via return type annotation: {name}")
+                        logger.debug("Identified tool method via return type annotation: %s", name)
 
                 # Fallback: if it's an async method defined in the class itself (not inherited),
                 # and it has parameters, assume it's a tool
@@ -326,7 +423,7 @@ Available templates for diversity preservation:
                     # Check if it has at least one parameter beyond 'self'
                     if method.__code__.co_argcount > 1:
                         is_tool = True
-                        logger.debug(f"Identified tool method via parameter count: {name}")
+                        logger.debug("Identified tool method via parameter count: %s", name)
 
                 if is_tool:
                     tool_methods.append(name)
@@ -361,7 +458,7 @@ Available templates for diversity preservation:
         if params is None:
             params = {}
         result = await tx.run(cast(LiteralString, query), params)  # type: ignore
-        records = await result.data()
+        records = [record.data() async for record in result]
         return json.dumps(records)
 
     async def _write(self, tx: AsyncManagedTransaction, query: str, params: dict):
@@ -14,7 +14,7 @@ from typing import Dict, Any, List, Optional, Union, Tuple
 import mcp.types as types
 from pydantic import Field
 from neo4j import AsyncTransaction
-from .base_incarnation import BaseIncarnation
+from .base_incarnation import BaseIncarnation, CREATE_HUB_IF_MISSING_QUERY, run_query
 from ..event_loop_manager import safe_neo4j_session
 
 logger = logging.getLogger("mcp_neocoder.incarnations.code_analysis")
@@ -348,8 +348,6 @@ Analysis results are stored in Neo4j with the following structure:
             async with safe_neo4j_session(self.driver, self.database) as session:
                 # Execute each constraint/index query individually
                 for query in self.schema_queries:
-                    async def run_query(tx, query: str):
-                        return await tx.run(query)
                     await session.execute_write(run_query, query)
 
                 # Create base guidance hub for this incarnation if it doesn't exist
@@ -362,12 +360,6 @@ Analysis results are stored in Neo4j with the following structure:
 
     async def ensure_hub_exists(self):
         """Create the guidance hub for this incarnation if it doesn't exist."""
-        query = """
-        MERGE (hub:AiGuidanceHub {id: 'code_analysis_hub'})
-        ON CREATE SET hub.description = $description
-        RETURN hub
-        """
-
         description = """
 # Code Analysis with AST/ASG Tools
 
@@ -477,10 +469,10 @@ Analysis results are stored in Neo4j with the following structure:
 5. Tag analyses with version information for future comparison
         """
 
-        params = {"description": description}
+        params = {"hub_id": "code_analysis_hub", "description": description}
 
         async with safe_neo4j_session(self.driver, self.database) as session:
-            await session.execute_write(lambda tx: tx.run(query, params))
+            await session.execute_write(run_query, CREATE_HUB_IF_MISSING_QUERY, params)
 
     async def _process_ast_data(self, ast_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process AST data into a format suitable for Neo4j storage."""
@@ -5,14 +5,25 @@ This incarnation provides the original NeoCoder functionality for AI-assisted co
 including action templates, project management, workflow tracking, and best practices guidance.
 """
 
+import asyncio
 import logging
 
-from .base_incarnation import BaseIncarnation
+from .base_incarnation import BaseIncarnation, bulk_merge
 from ..action_templates import ActionTemplateMixin
 from ..event_loop_manager import safe_neo4j_session
 
 logger = logging.getLogger("mcp_neocoder.incarnations.coding")
 
+# Setup queries, kept as constants so Neo4j reuses their cached plans
+COUNT_PROJECTS_QUERY = "MATCH (p:Project) RETURN count(p) as count"
+
+SAMPLE_PROJECT = {
+    "id": "neocoder_project",
+    "name": "NeoCoder System",
+    "description": "The NeoCoder MCP server system",
+    "readme": "This is the NeoCoder system for AI-assisted coding workflows.",
+}
+
 
 class CodingIncarnation(BaseIncarnation, ActionTemplateMixin):
     """
@@ -176,11 +187,11 @@ Remember: The key to NeoCoder is following structured workflows that ensure qual
             # Then create the coding-specific action templates
             await self._create_action_templates()
 
-            # Create sample projects if needed
-            await self._create_sample_projects()
-
-            # Create best practices guide
-            await self._create_best_practices()
+            # Sample projects and the best practices guide are independent writes
+            await asyncio.gather(
+                self._create_sample_projects(),
+                self._create_best_practices(),
+            )
 
             logger.info("Coding incarnation schema initialized successfully")
         except Exception as e:
@@ -270,22 +281,12 @@ Remember: The key to NeoCoder is following structured workflows that ensure qual
             }
         ]
 
+        rows = [dict(template, isCurrent=True, version=1) for template in templates]
+
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                for template in templates:
-                    query = """
-                    MERGE (t:ActionTemplate {keyword: $keyword})
-                    SET t.name = $name,
-                        t.description = $description,
-                        t.steps = $steps,
-                        t.isCurrent = true,
-                        t.version = 1,
-                        t.created = datetime(),
-                        t.updated = datetime()
-                    """
-                    from typing import cast, LiteralString
-                    await session.execute_write(lambda tx: tx.run(cast(LiteralString, query), template))
-                    logger.info(f"Created action template: {template['keyword']}")
+                merged = await bulk_merge(session, "ActionTemplate", rows, "keyword")
+            logger.info(f"Created {merged} action templates")
         except Exception as e:
             logger.error(f"Error creating action templates: {e}")
             raise
@@ -295,22 +296,12 @@ Remember: The key to NeoCoder is following structured workflows that ensure qual
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
                 # Check if any projects exist
-                result = await session.run("MATCH (p:Project) RETURN count(p) as count")
+                result = await session.run(COUNT_PROJECTS_QUERY)
                 data = await result.single()
 
                 if data and data["count"] == 0:
                     # Create a sample project
-                    query = """
-                    CREATE (p:Project {
-                        id: 'neocoder_project',
-                        name: 'NeoCoder System',
-                        description: 'The NeoCoder MCP server system',
-                        readme: 'This is the NeoCoder system for AI-assisted coding workflows.',
-                        created: datetime(),
-                        updated: datetime()
-                    })
-                    """
-                    await session.execute_write(lambda tx: tx.run(query))
+                    await bulk_merge(session, "Project", [SAMPLE_PROJECT], "id")
                     logger.info("Created sample project")
         except Exception as e:
             logger.error(f"Error creating sample projects: {e}")
@@ -319,12 +310,6 @@ Remember: The key to NeoCoder is following structured workflows that ensure qual
         """Create the best practices guide."""
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                query = """
-                MERGE (bp:BestPracticesGuide {id: 'main'})
-                SET bp.content = $content,
-                    bp.updated = datetime()
-                """
-
                 content = """# NeoCoder Best Practices
 
 ## Code Quality
@@ -348,7 +333,7 @@ Remember: The key to NeoCoder is following structured workflows that ensure qual
 4. Explain the "why" not just the "what"
 5. Use clear, concise language"""
 
-                await session.execute_write(lambda tx: tx.run(query, {"content": content}))
+                await bulk_merge(session, "BestPracticesGuide", [{"id": "main", "content": content}], "id")
                 logger.info("Created best practices guide")
         except Exception as e:
             logger.error(f"Error creating best practices: {e}")
@@ -4,7 +4,7 @@ Data Analysis incarnation of the NeoCoder framework.
 Provides comprehensive data analysis capabilities including data loading, exploration,
 visualization, transformation, and statistical analysis with results stored in Neo4j.
 """
-from .base_incarnation import BaseIncarnation
+from .base_incarnation import BaseIncarnation, CREATE_HUB_IF_MISSING_QUERY, read_hub_description, run_query
 
 import json
 import logging
@@ -316,7 +316,7 @@ class DataAnalysisIncarnation(BaseIncarnation):
             async with safe_neo4j_session(self.driver, self.database) as session:
                 # Execute each constraint/index query individually
                 for query in self.schema_queries:
-                    await session.execute_write(lambda tx, q=query: tx.run(q))
+                    await session.execute_write(run_query, query)
 
                 # Create base guidance hub for this incarnation if it doesn't exist
                 await self.ensure_guidance_hub_exists()
@@ -328,12 +328,6 @@ class DataAnalysisIncarnation(BaseIncarnation):
 
     async def ensure_guidance_hub_exists(self):
         """Create the guidance hub for this incarnation if it doesn't exist."""
-        query = """
-        MERGE (hub:AiGuidanceHub {id: 'data_analysis_hub'})
-        ON CREATE SET hub.description = $description
-        RETURN hub
-        """
-
         description = """
 # 🚀 Advanced Data Analysis with NeoCoder - 2025 Edition
 
@@ -636,30 +630,19 @@ python /home/ty/Repositories/NeoCoder-neo4j-ai-workflow/data/scripts/data_cleane
 *Ready to transform your data into actionable insights? Start with `generate_insights()` for an AI-powered analysis overview, then dive deep with the specialized tools above!*
         """
 
-        params = {"description": description}
+        params = {"hub_id": "data_analysis_hub", "description": description}
 
         async with safe_neo4j_session(self.driver, self.database) as session:
-            await session.execute_write(lambda tx: tx.run(query, params))
+            await session.execute_write(run_query, CREATE_HUB_IF_MISSING_QUERY, params)
 
     async def get_guidance_hub(self) -> List[types.TextContent]:
         """Get the guidance hub for this incarnation."""
-        query = """
-        MATCH (hub:AiGuidanceHub {id: 'data_analysis_hub'})
-        RETURN hub.description AS description
-        """
-
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                # Use a direct transaction to avoid scope issues
-                async def read_hub_data(tx):
-                    result = await tx.run(query, {})
-                    records = await result.data()
-                    return records
-                    
-                records = await session.execute_read(read_hub_data)
-
-                if records and len(records) > 0:
-                    return [types.TextContent(type="text", text=records[0]["description"])]
+                description = await session.execute_read(read_hub_description, "data_analysis_hub")
+
+                if description:
+                    return [types.TextContent(type="text", text=description)]
                 else:
                     # If hub doesn't exist, create it
                     await self.ensure_guidance_hub_exists()
@@ -14,11 +14,24 @@ import mcp.types as types
 from pydantic import Field
 from neo4j import AsyncDriver, AsyncTransaction, AsyncManagedTransaction
 
-from .base_incarnation import BaseIncarnation
+from .base_incarnation import BaseIncarnation, CREATE_HUB_IF_MISSING_QUERY, run_query
 from ..event_loop_manager import safe_neo4j_session
 
 logger = logging.getLogger("mcp_neocoder.decision_incarnation")
 
+# Constraints and indexes for the decision schema. tx.run() accepts a single
+# statement, so each one is kept separate.
+DECISION_SCHEMA_DDL = (
+    # Create constraints for unique IDs
+    "CREATE CONSTRAINT decision_id IF NOT EXISTS FOR (d:Decision) REQUIRE d.id IS UNIQUE",
+    "CREATE CONSTRAINT alternative_id IF NOT EXISTS FOR (a:Alternative) REQUIRE a.id IS UNIQUE",
+    "CREATE CONSTRAINT metric_id IF NOT EXISTS FOR (m:Metric) REQUIRE m.id IS UNIQUE",
+    "CREATE CONSTRAINT evidence_id IF NOT EXISTS FOR (e:Evidence) REQUIRE e.id IS UNIQUE",
+    # Create indexes for performance
+    "CREATE INDEX decision_status IF NOT EXISTS FOR (d:Decision) ON (d.status)",
+    "CREATE INDEX alternative_name IF NOT EXISTS FOR (a:Alternative) ON (a.name)",
+)
+
 
 class DecisionIncarnation(BaseIncarnation):
     """Decision Support System incarnation of the NeoCoder framework.
@@ -65,22 +78,13 @@ class DecisionIncarnation(BaseIncarnation):
 
     async def initialize_schema(self):
         """Initialize the Neo4j schema for decision support system."""
-        # Define constraints and indexes for decision schema
-        schema_query = """
-        // Create constraints for unique IDs
-        CREATE CONSTRAINT decision_id IF NOT EXISTS FOR (d:Decision) REQUIRE d.id IS UNIQUE;
-        CREATE CONSTRAINT alternative_id IF NOT EXISTS FOR (a:Alternative) REQUIRE a.id IS UNIQUE;
-        CREATE CONSTRAINT metric_id IF NOT EXISTS FOR (m:Metric) REQUIRE m.id IS UNIQUE;
-        CREATE CONSTRAINT evidence_id IF NOT EXISTS FOR (e:Evidence) REQUIRE e.id IS UNIQUE;
-
-        // Create indexes for performance
-        CREATE INDEX decision_status IF NOT EXISTS FOR (d:Decision) ON (d.status);
-        CREATE INDEX alternative_name IF NOT EXISTS FOR (a:Alternative) ON (a.name);
-        """
-
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                await session.execute_write(lambda tx: tx.run(schema_query))
+                async def apply_schema(tx):
+                    for stmt in DECISION_SCHEMA_DDL:
+                        await tx.run(stmt)
+
+                await session.execute_write(apply_schema)
 
                 # Create base guidance hub for decisions if it doesn't exist
                 await self.ensure_decision_hub_exists()
@@ -92,12 +96,6 @@ class DecisionIncarnation(BaseIncarnation):
 
     async def ensure_decision_hub_exists(self):
         """Create the decision guidance hub if it doesn't exist."""
-        query = """
-        MERGE (hub:AiGuidanceHub {id: 'decision_hub'})
-        ON CREATE SET hub.description = $description
-        RETURN hub
-        """
-
         description = """
 # Decision Support System
 
@@ -137,10 +135,10 @@ This Decision Support System helps you make better decisions with the following
 Each decision maintains a complete audit trail of all inputs, evidence, and reasoning.
         """
 
-        params = {"description": description}
+        params = {"hub_id": "decision_hub", "description": description}
 
         async with safe_neo4j_session(self.driver, self.database) as session:
-            await session.execute_write(lambda tx: tx.run(query, params))
+            await session.execute_write(run_query, CREATE_HUB_IF_MISSING_QUERY, params)
 
     async def register_tools(self, server) -> int:
         """Register decision incarnation-specific tools with the server."""
@@ -163,10 +161,7 @@ Each decision maintains a complete audit trail of all inputs, evidence, and reas
 
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                async def run_query(tx):
-                    result = await tx.run(query, {})
-                    return await result.data()
-                results = await session.execute_read(run_query)
+                results = await session.execute_read(run_query, query)
 
                 if results and len(results) > 0:
                     return [types.TextContent(type="text", text=results[0]["description"])]
@@ -224,7 +219,7 @@ Each decision maintains a complete audit trail of all inputs, evidence, and reas
 
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                results_json = await session.execute_write(lambda tx: self._read_query(tx, query, params))
+                results_json = await session.execute_write(self._read_query, query, params)
                 results = json.loads(results_json)
 
                 if results and len(results) > 0:
@@ -291,7 +286,7 @@ Each decision maintains a complete audit trail of all inputs, evidence, and reas
 
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                results_json = await session.execute_read(lambda tx: self._read_query(tx, query, params))
+                results_json = await session.execute_read(self._read_query, query, params)
                 results = json.loads(results_json)
 
                 if results and len(results) > 0:
@@ -9,121 +9,24 @@ import logging
 from typing import Dict, Any, List, Optional
 
 import mcp.types as types
+from neo4j import AsyncDriver
 from pydantic import Field
 
-from .base_incarnation import BaseIncarnation
+from .base_incarnation import BaseIncarnation, CREATE_HUB_IF_MISSING_QUERY, read_hub_description, run_query
 from ..event_loop_manager import safe_neo4j_session
 
 logger = logging.getLogger("mcp_neocoder.incarnations.knowledge_graph")
 
+# Overwrites the hub description on every schema initialization so the hub
+# always carries the current LV guidance
+SET_HUB_DESCRIPTION_QUERY = """
+MERGE (hub:AiGuidanceHub {id: $hub_id})
+SET hub.description = $description
+RETURN hub
+"""
 
-class KnowledgeGraphIncarnation(BaseIncarnation):
-    """
-    Knowledge Graph incarnation of the NeoCoder framework.
-
-    Manage and analyze knowledge graphs
-    """
-
-    # Define the incarnation name as a string value
-    name = "knowledge_graph"
-
-    # Metadata for display in the UI
-    description = "Manage and analyze knowledge graphs"
-    version = "1.0.0"
-
-    # Explicitly define which methods should be registered as tools
-    _tool_methods = ["create_entities", "create_relations", "add_observations", "add_single_observation",
-                     "delete_entities", "delete_observations", "delete_relations",
-                     "read_graph", "search_nodes", "open_nodes"]
-
-    async def _execute_and_return_json(self, tx, query, params):
-        """
-        Execute a query and return results as JSON string within the same transaction.
-        This prevents the "transaction out of scope" error.
-        """
-        result = await tx.run(query, params)
-        records = await result.values()
-
-        # Process records into a format that can be JSON serialized
-        processed_data = []
-        for record in records:
-            # Convert record to dict if it's not already
-            if isinstance(record, (list, tuple)):
-                # For simple list results with defined column names
-                # We'll use field names from the query or generic column names
-                field_names = ['col0', 'col1', 'col2', 'col3', 'col4', 'col5']  # Generic defaults
-                row_data = {}
-
-                for i, value in enumerate(record):
-                    if i < len(field_names):
-                        row_data[field_names[i]] = value
-                    else:
-                        row_data[f'col{i}'] = value
-
-                processed_data.append(row_data)
-            else:
-                # Record is already a dict or another format
-                processed_data.append(record)
-
-        return json.dumps(processed_data, default=str)
-
-    async def _safe_read_query(self, session, query, params=None):
-        """Execute a read query safely, handling all errors internally.
-
-        This approach completely prevents transaction scope errors from reaching the user.
-        """
-        if params is None:
-            params = {}
-
-        try:
-            # Define a function that captures and processes everything within the transaction
-            async def execute_and_process_in_tx(tx):
-                try:
-                    # Run the query
-                    result = await tx.run(query, params)
-
-                    # Use .data() to get records with proper column names
-                    records = await result.data()
-
-                    # Convert to JSON string inside the transaction
-                    return json.dumps(records, default=str)
-                except Exception as inner_e:
-                    # Catch any errors inside the transaction
-                    logger.error(f"Error inside transaction: {inner_e}")
-                    return json.dumps([])
-
-            # Execute the query within transaction boundaries
-            result_json = await session.execute_read(execute_and_process_in_tx)
-
-            # Parse the JSON result (which should always be valid)
-            try:
-                return json.loads(result_json)
-            except json.JSONDecodeError as json_error:
-                logger.error(f"Error parsing JSON result: {json_error}")
-                return []
-
-        except Exception as e:
-            # Log error but suppress it from the user
-            logger.error(f"Error executing read query: {e}")
-            return []
-
-
-    async def initialize_schema(self):
-        """Initialize the Neo4j schema for Knowledge Graph."""
-        # Define constraints and indexes for the schema
-        schema_queries = [
-            # Entity constraints
-            "CREATE CONSTRAINT knowledge_entity_name IF NOT EXISTS FOR (e:Entity) REQUIRE e.name IS UNIQUE",
-
-            # Indexes for efficient querying
-            "CREATE INDEX knowledge_entity_type IF NOT EXISTS FOR (e:Entity) ON (e.entityType)",
-            "CREATE FULLTEXT INDEX entity_observation_fulltext IF NOT EXISTS FOR (o:Observation) ON EACH [o.content]",
-            "CREATE FULLTEXT INDEX entity_name_fulltext IF NOT EXISTS FOR (e:Entity) ON EACH [e.name]",
-
-            # LV-Enhanced Knowledge Graph Guidance Hub Creation
-            """
-            MERGE (hub:AiGuidanceHub {id: 'knowledge_graph_hub'})
-            SET hub.description = "
+# LV-Enhanced Knowledge Graph Guidance Hub content
+LV_HUB_DESCRIPTION = """
 # Knowledge Graph Management System with LV Ecosystem Intelligence
 
 Welcome to the Knowledge Graph Management System powered by the NeoCoder framework with Lotka-Volterra Ecosystem Intelligence integration.
@@ -219,16 +122,231 @@ diversity_score = results['diversity_metrics']['semantic_diversity']
 - **Diversity metrics** computed using real semantic analysis
 
 Remember: This system uses **actual Lotka-Volterra mathematical dynamics**, not simulations. All diversity scores and ecosystem metrics are computed using real mathematical models.
-"
-            RETURN hub
-            """
-        ]
+"""
+
+# Entities are sent to Neo4j as a single $batch parameter so one round-trip
+# creates the whole list. Keeping the query text constant lets the server-side
+# plan cache reuse the compiled plan on every call.
+CREATE_ENTITIES_QUERY = """
+UNWIND $batch AS entity
+MERGE (e:Entity {name: entity.name})
+ON CREATE SET e.entityType = entity.entityType
+WITH e, entity
+FOREACH (obs IN entity.observations |
+    CREATE (o:Observation {content: obs, timestamp: datetime()})
+    CREATE (e)-[:HAS_OBSERVATION]->(o)
+)
+RETURN count(e) AS entityCount
+"""
+
+# Upper bound on entities sent per UNWIND statement; larger lists are split
+# into several statements that still share one transaction.
+CREATE_ENTITIES_BATCH_SIZE = 1000
+
+# Constraints and indexes for the knowledge graph. The unique constraint on
+# :Entity(name) also provides the index used by every name lookup.
+SCHEMA_DDL = (
+    "CREATE CONSTRAINT knowledge_entity_name IF NOT EXISTS FOR (e:Entity) REQUIRE e.name IS UNIQUE",
+    "CREATE INDEX knowledge_entity_type IF NOT EXISTS FOR (e:Entity) ON (e.entityType)",
+    "CREATE FULLTEXT INDEX entity_observation_fulltext IF NOT EXISTS FOR (o:Observation) ON EACH [o.content]",
+    "CREATE FULLTEXT INDEX entity_name_fulltext IF NOT EXISTS FOR (e:Entity) ON EACH [e.name]",
+)
+
+# Names of the indexes created (or backed) by SCHEMA_DDL
+SCHEMA_INDEX_NAMES = (
+    "knowledge_entity_name",
+    "knowledge_entity_type",
+    "entity_observation_fulltext",
+    "entity_name_fulltext",
+)
+
+COUNT_SCHEMA_INDEXES_QUERY = """
+SHOW INDEXES YIELD name
+WHERE name IN $names
+RETURN count(*) AS indexCount
+"""
 
+# Deletes every named entity and its observations in a single statement
+DELETE_ENTITIES_QUERY = """
+UNWIND $names AS name
+MATCH (e:Entity {name: name})
+OPTIONAL MATCH (e)-[:HAS_OBSERVATION]->(o:Observation)
+DETACH DELETE e, o
+RETURN count(DISTINCT e) AS deleted
+"""
+
+# Returns one compact row per entity; observations and relations are
+# collected with pattern comprehensions, which avoids the row explosion of
+# chained OPTIONAL MATCHes and drops missing values on the server.
+OPEN_NODES_QUERY = """
+UNWIND $names AS name
+MATCH (e:Entity {name: name})
+RETURN
+    e.name AS name,
+    coalesce(e.entityType, 'Unknown') AS type,
+    [(e)-[:HAS_OBSERVATION]->(o:Observation) WHERE o.content IS NOT NULL | o.content] AS observations,
+    [(e)-[r:RELATES_TO]->(target:Entity) WHERE r.type IS NOT NULL | {type: r.type, target: target.name}] AS outRelations,
+    [(source:Entity)-[r:RELATES_TO]->(e) WHERE r.type IS NOT NULL | {type: r.type, source: source.name}] AS inRelations
+"""
+
+# Entity lookups pinned to the knowledge_entity_name index. The hint makes
+# the query fail if the index is missing, so these variants are only used
+# once ENTITY_NAME_INDEX_ONLINE_QUERY has confirmed the index is online.
+ENTITY_NAME_MATCH = "MATCH (e:Entity {name: name})"
+ENTITY_NAME_INDEX_HINT = "USING INDEX e:Entity(name)"
+
+DELETE_ENTITIES_HINTED_QUERY = DELETE_ENTITIES_QUERY.replace(
+    ENTITY_NAME_MATCH, f"{ENTITY_NAME_MATCH}\n{ENTITY_NAME_INDEX_HINT}"
+)
+
+OPEN_NODES_HINTED_QUERY = OPEN_NODES_QUERY.replace(
+    ENTITY_NAME_MATCH, f"{ENTITY_NAME_MATCH}\n{ENTITY_NAME_INDEX_HINT}"
+)
+
+ENTITY_NAME_INDEX_ONLINE_QUERY = """
+SHOW INDEXES YIELD name, state
+WHERE name = 'knowledge_entity_name' AND state = 'ONLINE'
+RETURN count(*) > 0 AS online
+"""
+
+# Deletes the named entities and reports, per name, whether anything was
+# removed, so callers do not need a separate read to verify the deletion
+DELETE_AND_VERIFY_QUERY = """
+UNWIND $names AS name
+OPTIONAL MATCH (e:Entity {name: name})
+OPTIONAL MATCH (e)-[:HAS_OBSERVATION]->(o:Observation)
+WITH name, e, collect(o) AS observations
+FOREACH (obs IN observations | DETACH DELETE obs)
+WITH name, e, e IS NOT NULL AS found
+DETACH DELETE e
+RETURN collect({name: name, deleted: found}) AS report
+"""
+
+
+class KnowledgeGraphIncarnation(BaseIncarnation):
+    """
+    Knowledge Graph incarnation of the NeoCoder framework.
+
+    Manage and analyze knowledge graphs
+    """
+
+    # Define the incarnation name as a string value
+    name = "knowledge_graph"
+
+    # Metadata for display in the UI
+    description = "Manage and analyze knowledge graphs"
+    version = "1.0.0"
+
+    # Explicitly define which methods should be registered as tools
+    _tool_methods = ["create_entities", "create_relations", "add_observations", "add_single_observation",
+                     "delete_entities", "delete_observations", "delete_relations",
+                     "read_graph", "search_nodes", "open_nodes"]
+
+    def __init__(self, driver: AsyncDriver, database: str = "neo4j"):
+        """Initialize the incarnation with database connection."""
+        super().__init__(driver, database)
+
+        # Whether the entity name index is online; None until first checked
+        self._entity_name_index_online: Optional[bool] = None
+
+    async def _execute_and_return_json(self, tx, query, params):
+        """
+        Execute a query and return results as JSON string within the same transaction.
+        This prevents the "transaction out of scope" error.
+        """
+        result = await tx.run(query, params)
+        records = await result.values()
+
+        # Process records into a format that can be JSON serialized
+        processed_data = []
+        for record in records:
+            # Convert record to dict if it's not already
+            if isinstance(record, (list, tuple)):
+                # For simple list results with defined column names
+                # We'll use field names from the query or generic column names
+                field_names = ['col0', 'col1', 'col2', 'col3', 'col4', 'col5']  # Generic defaults
+                row_data = {}
+
+                for i, value in enumerate(record):
+                    if i < len(field_names):
+                        row_data[field_names[i]] = value
+                    else:
+                        row_data[f'col{i}'] = value
+
+                processed_data.append(row_data)
+            else:
+                # Record is already a dict or another format
+                processed_data.append(record)
+
+        return json.dumps(processed_data, default=str)
+
+    async def _safe_read_query(self, session, query, params=None):
+        """Execute a read query safely, handling all errors internally.
+
+        This approach completely prevents transaction scope errors from reaching the user.
+        """
+        if params is None:
+            params = {}
+
+        try:
+            # Define a function that captures and processes everything within the transaction
+            async def execute_and_process_in_tx(tx):
+                try:
+                    # Run the query
+                    result = await tx.run(query, params)
+
+                    # Use .data() to get records with proper column names
+                    records = await result.data()
+
+                    # Convert to JSON string inside the transaction
+                    return json.dumps(records, default=str)
+                except Exception as inner_e:
+                    # Catch any errors inside the transaction
+                    logger.error(f"Error inside transaction: {inner_e}")
+                    return json.dumps([])
+
+            # Execute the query within transaction boundaries
+            result_json = await session.execute_read(execute_and_process_in_tx)
+
+            # Parse the JSON result (which should always be valid)
+            try:
+                return json.loads(result_json)
+            except json.JSONDecodeError as json_error:
+                logger.error(f"Error parsing JSON result: {json_error}")
+                return []
+
+        except Exception as e:
+            # Log error but suppress it from the user
+            logger.error(f"Error executing read query: {e}")
+            return []
+
+
+    async def initialize_schema(self):
+        """Initialize the Neo4j schema for Knowledge Graph."""
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                # Execute each constraint/index query individually
-                for query in schema_queries:
-                    await session.execute_write(lambda tx: tx.run(query))  # type: ignore[arg-type]
+                # Apply all constraints/indexes in one transaction
+                async def apply_schema(tx):
+                    for stmt in SCHEMA_DDL:
+                        await tx.run(stmt)
+
+                await session.execute_write(apply_schema)
+                self._entity_name_index_online = None
+
+                # Verify the indexes exist; SHOW cannot share the schema transaction
+                async def count_indexes(tx):
+                    result = await tx.run(COUNT_SCHEMA_INDEXES_QUERY, names=list(SCHEMA_INDEX_NAMES))
+                    record = await result.single()
+                    return record["indexCount"] if record else 0
+
+                index_count = await session.execute_read(count_indexes)
+                logger.info(f"Knowledge Graph schema has {index_count}/{len(SCHEMA_INDEX_NAMES)} indexes in place")
+
+                # Hub content is data, so it is written in its own transaction
+                await session.execute_write(run_query, SET_HUB_DESCRIPTION_QUERY, {
+                    "hub_id": "knowledge_graph_hub",
+                    "description": LV_HUB_DESCRIPTION
+                })
 
                 # Create base guidance hub for this incarnation if it doesn't exist
                 await self.ensure_guidance_hub_exists()
@@ -240,12 +358,6 @@ Remember: This system uses **actual Lotka-Volterra mathematical dynamics**, not
 
     async def ensure_guidance_hub_exists(self):
         """Create the guidance hub for this incarnation if it doesn't exist."""
-        query = """
-        MERGE (hub:AiGuidanceHub {id: 'knowledge_graph_hub'})
-        ON CREATE SET hub.description = $description
-        RETURN hub
-        """
-
         description = """
 # Knowledge Graph
 
@@ -279,30 +391,19 @@ This system helps you manage and analyze knowledge graphs with the following cap
 Each entity in the system has proper Neo4j labels for efficient querying and visualization.
         """
 
-        params = {"description": description}
+        params = {"hub_id": "knowledge_graph_hub", "description": description}
 
         async with safe_neo4j_session(self.driver, self.database) as session:
-            await session.execute_write(lambda tx: tx.run(query, params))
+            await session.execute_write(run_query, CREATE_HUB_IF_MISSING_QUERY, params)
 
     async def get_guidance_hub(self):
         """Get the guidance hub for this incarnation."""
-        query = """
-        MATCH (hub:AiGuidanceHub {id: 'knowledge_graph_hub'})
-        RETURN hub.description AS description
-        """
-
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                # Use direct transaction execution like other methods
-                async def execute_query(tx):
-                    result = await tx.run(query)
-                    records = await result.data()
-                    return records
-
-                results = await session.execute_read(execute_query)
+                description = await session.execute_read(read_hub_description, "knowledge_graph_hub")
 
-                if results and len(results) > 0:
-                    return [types.TextContent(type="text", text=results[0]["description"])]
+                if description:
+                    return [types.TextContent(type="text", text=description)]
                 else:
                     # If hub doesn't exist, create it
                     await self.ensure_guidance_hub_exists()
@@ -373,6 +474,46 @@ Each entity in the system has proper Neo4j labels for efficient querying and vis
             logger.error(f"Error executing read query: {e}")
             return None
 
+    # Transaction functions shared by the managed tools and run_lifecycle.
+    # Each one reads its results before returning, inside the transaction scope.
+    async def _create_entities_in_tx(self, tx, entities):
+        """Create entities in UNWIND batches and return how many were merged."""
+        created = 0
+        for start in range(0, len(entities), CREATE_ENTITIES_BATCH_SIZE):
+            batch = entities[start:start + CREATE_ENTITIES_BATCH_SIZE]
+            result = await tx.run(CREATE_ENTITIES_QUERY, batch=batch)
+            records = await result.data()
+            if records:
+                created += records[0].get("entityCount", 0)
+        return created
+
+    async def _delete_and_verify_in_tx(self, tx, names):
+        """Delete entities by name and return the per-name deletion report."""
+        result = await tx.run(DELETE_AND_VERIFY_QUERY, names=names)
+        record = await result.single()
+        return record["report"] if record else []
+
+    async def _open_nodes_in_tx(self, tx, names, query=OPEN_NODES_QUERY):
+        """Return one aggregated row per named entity."""
+        result = await tx.run(query, names=names)
+        return await result.data()
+
+    async def _use_entity_index_hints(self, session) -> bool:
+        """Return True once the entity name index is online, checking the server once."""
+        if self._entity_name_index_online is None:
+            async def check_index(tx):
+                result = await tx.run(ENTITY_NAME_INDEX_ONLINE_QUERY)
+                record = await result.single()
+                return bool(record and record["online"])
+
+            try:
+                self._entity_name_index_online = await session.execute_read(check_index)
+            except Exception as e:
+                logger.warning(f"Could not check entity name index, skipping planner hints: {e}")
+                return False
+
+        return self._entity_name_index_online
+
     async def create_entities(
         self,
         entities: List[Dict[str, Any]] = Field(
@@ -504,35 +645,22 @@ Each entity in the system has proper Neo4j labels for efficient querying and vis
 
                 cleaned_entities.append(cleaned_entity)
 
-            # Build the Cypher query for creating entities with proper labels
-            # Use FOREACH to handle empty observations arrays gracefully
-            query = """
-            UNWIND $entities AS entity
-            MERGE (e:Entity {name: entity.name})
-            ON CREATE SET e.entityType = entity.entityType
-            WITH e, entity
-            FOREACH (obs IN entity.observations |
-                CREATE (o:Observation {content: obs, timestamp: datetime()})
-                CREATE (e)-[:HAS_OBSERVATION]->(o)
-            )
-            RETURN count(e) AS entityCount
-            """
-
             # Get counts for the response message (use cleaned entities)
             entity_count = len(cleaned_entities)
             observation_count = sum(len(entity.get('observations', [])) for entity in cleaned_entities)
 
-            # Execute the query using our safe execution method
-            async with safe_neo4j_session(self.driver, self.database) as session:
-                success = await self._safe_execute_write(session, query, {"entities": cleaned_entities})
-
-                if success:
-                    # Give feedback based on the intended operation, not the actual results
-                    response = f"Successfully created {entity_count} entities with {observation_count} observations."
-                    return [types.TextContent(type="text", text=response)]
-                else:
+            # Send the whole list in one managed transaction instead of one round-trip per entity
+            async with self._session() as session:
+                try:
+                    await session.execute_write(self._create_entities_in_tx, cleaned_entities)
+                except Exception as e:
+                    logger.error(f"Error executing write query: {e}")
                     return [types.TextContent(type="text", text="Error creating entities. Please check server logs.")]
 
+                # Give feedback based on the intended operation, not the actual results
+                response = f"Successfully created {entity_count} entities with {observation_count} observations."
+                return [types.TextContent(type="text", text=response)]
+
         except Exception as e:
             logger.error(f"Error in create_entities: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
@@ -816,25 +944,18 @@ Each entity in the system has proper Neo4j labels for efficient querying and vis
             if not entityNames:
                 return [types.TextContent(type="text", text="Error: No entity names provided")]
 
-            # Build the Cypher query
-            query = """
-            UNWIND $entityNames AS name
-            MATCH (e:Entity {name: name})
-            OPTIONAL MATCH (e)-[:HAS_OBSERVATION]->(o:Observation)
-            DETACH DELETE e, o
-            RETURN count(DISTINCT e) as deletedEntities
-            """
+            async with self._session() as session:
+                if await self._use_entity_index_hints(session):
+                    query = DELETE_ENTITIES_HINTED_QUERY
+                else:
+                    query = DELETE_ENTITIES_QUERY
 
-            async with safe_neo4j_session(self.driver, self.database) as session:
                 # Use a direct transaction to avoid scope issues
                 async def execute_delete(tx):
-                    result = await tx.run(query, {"entityNames": entityNames})
+                    result = await tx.run(query, names=entityNames)
                     # Get the data within the transaction scope
-                    records = await result.data()
-
-                    if records and len(records) > 0:
-                        return records[0].get("deletedEntities", 0)
-                    return 0
+                    record = await result.single()
+                    return record["deleted"] if record else 0
 
                 deleted_count = await session.execute_write(execute_delete)
 
@@ -848,6 +969,31 @@ Each entity in the system has proper Neo4j labels for efficient querying and vis
             logger.error(f"Error in delete_entities: {e}")
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
+    async def run_lifecycle(
+        self,
+        tx,
+        entities: List[Dict[str, Any]],
+        names_to_delete: List[str]
+    ) -> Dict[str, Any]:
+        """Create, delete and re-read entities inside a caller-owned transaction.
+
+        The caller opens the transaction (e.g. ``session.begin_transaction()``)
+        and commits it once, so the whole sequence is atomic.
+
+        Args:
+            tx: Open Neo4j transaction
+            entities: Already-validated entities, as accepted by create_entities
+            names_to_delete: Entity names to delete afterwards
+
+        Returns:
+            Dict with the created count, the deletion report and any entities
+            that are still readable after the deletion
+        """
+        created = await self._create_entities_in_tx(tx, entities)
+        report = await self._delete_and_verify_in_tx(tx, names_to_delete)
+        remaining = await self._open_nodes_in_tx(tx, names_to_delete)
+        return {"created": created, "report": report, "remaining": remaining}
+
     async def delete_observations(
         self,
         deletions: List[Dict[str, Any]] = Field(..., description="An array of specifications for observations to delete")
@@ -1121,43 +1267,14 @@ Each entity in the system has proper Neo4j labels for efficient querying and vis
             if not names:
                 return [types.TextContent(type="text", text="Error: No entity names provided")]
 
-            # Use a single comprehensive query to get all needed information
-            query = """
-            UNWIND $names AS name
-            MATCH (e:Entity {name: name})
-            OPTIONAL MATCH (e)-[:HAS_OBSERVATION]->(o:Observation)
-            OPTIONAL MATCH (e)-[outRel:RELATES_TO]->(target:Entity)
-            OPTIONAL MATCH (source:Entity)-[inRel:RELATES_TO]->(e)
-            RETURN
-                e.name AS name,
-                e.entityType AS type,
-                collect(DISTINCT o.content) AS observations,
-                collect(DISTINCT {type: outRel.type, target: target.name}) AS outRelations,
-                collect(DISTINCT {type: inRel.type, source: source.name}) AS inRelations
-            """
-
-            async with safe_neo4j_session(self.driver, self.database) as session:
-                # Use a direct transaction to avoid scope issues
-                async def execute_query(tx):
-                    result = await tx.run(query, {"names": names})
-                    records = await result.data()  # Fixed: use .data() instead of .records()
-                    entity_details = []
-
-                    for record in records:
-                        entity = {
-                            "name": record.get("name"),
-                            "type": record.get("type", "Unknown"),
-                            "observations": [obs for obs in record.get("observations", []) if obs is not None],
-                            "outRelations": [rel for rel in record.get("outRelations", [])
-                                           if rel is not None and rel.get("type") is not None and rel.get("target") is not None],
-                            "inRelations": [rel for rel in record.get("inRelations", [])
-                                          if rel is not None and rel.get("type") is not None and rel.get("source") is not None]
-                        }
-                        entity_details.append(entity)
-
-                    return entity_details
+            async with self._session() as session:
+                if await self._use_entity_index_hints(session):
+                    query = OPEN_NODES_HINTED_QUERY
+                else:
+                    query = OPEN_NODES_QUERY
 
-                entity_details = await session.execute_read(execute_query)
+                # Rows come back already grouped and filtered by the query
+                entity_details = await session.execute_read(self._open_nodes_in_tx, names, query)
 
                 if not entity_details:
                     return [types.TextContent(type="text", text="No entities found with the specified names.")]
@@ -16,7 +16,7 @@ import mcp.types as types
 from pydantic import Field
 from neo4j import AsyncDriver, AsyncTransaction, AsyncManagedTransaction
 
-from .base_incarnation import BaseIncarnation
+from .base_incarnation import BaseIncarnation, CREATE_HUB_IF_MISSING_QUERY, run_query
 from ..event_loop_manager import safe_neo4j_session
 
 logger = logging.getLogger("mcp_neocoder.research_incarnation")
@@ -96,7 +96,7 @@ class ResearchIncarnation(BaseIncarnation):
             async with safe_neo4j_session(self.driver, self.database) as session:
                 # Execute each constraint/index query individually
                 for query in schema_queries:
-                    await session.execute_write(lambda tx, query: tx.run(query), query)
+                    await session.execute_write(run_query, query)
 
                 # Create base guidance hub for research if it doesn't exist
                 await self.ensure_research_hub_exists()
@@ -108,12 +108,6 @@ class ResearchIncarnation(BaseIncarnation):
 
     async def ensure_research_hub_exists(self):
         """Create the research guidance hub if it doesn't exist."""
-        query = """
-        MERGE (hub:AiGuidanceHub {id: 'research_hub'})
-        ON CREATE SET hub.description = $description
-        RETURN hub
-        """
-
         description = """
 # Research Orchestration Platform
 
@@ -152,10 +146,10 @@ This system helps you manage scientific workflows with the following capabilitie
 Each entity in the system has provenance tracking, ensuring reproducibility and transparency.
         """
 
-        params = {"description": description}
+        params = {"hub_id": "research_hub", "description": description}
 
         async with safe_neo4j_session(self.driver, self.database) as session:
-            await session.execute_write(lambda tx: tx.run(query, params))
+            await session.execute_write(run_query, CREATE_HUB_IF_MISSING_QUERY, params)
 
     async def get_guidance_hub(self):
         """Get the guidance hub for research incarnation."""
@@ -226,7 +220,7 @@ Each entity in the system has provenance tracking, ensuring reproducibility and
 
         try:
             async with safe_neo4j_session(self.driver, self.database) as session:
-                results_json = await session.execute_write(lambda tx: self._read_query(tx, query, params))
+                results_json = await session.execute_write(self._read_query, query, params)
                 results = json.loads(results_json)
 
                 if results and len(results) > 0:
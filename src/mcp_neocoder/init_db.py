@@ -5,12 +5,20 @@ This script initializes the Neo4j database with the necessary schemas for each i
 It creates the base nodes and relationships needed for the system to function properly.
 """
 
+import asyncio
 import logging
 import os
+import re
 import sys
+from .driver import DRIVER_CONFIG
 from .event_loop_manager import safe_neo4j_session
-from typing import List, Optional
-from neo4j import AsyncGraphDatabase, AsyncDriver
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
+try:
+    from typing import LiteralString
+except ImportError:
+    # Fallback for Python < 3.11
+    LiteralString = str
+from neo4j import AsyncGraphDatabase, AsyncDriver, AsyncManagedTransaction, AsyncSession, Record
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -18,17 +26,84 @@ logger = logging.getLogger("mcp_neocoder_init")
 
 # No hardcoded types - they're discovered dynamically
 
+# Initialization fans out to one session per schema and hub, so a small pool
+# is plenty; the other settings match the shared server driver
+INIT_DRIVER_CONFIG = {**DRIVER_CONFIG, "max_connection_pool_size": 16}
+
+# Matches CREATE CONSTRAINT / CREATE [TEXT|FULLTEXT|...] INDEX statements,
+# capturing the constraint or index name
+SCHEMA_QUERY_PATTERN = re.compile(r"^\s*CREATE\s+(?:\w+\s+)?(?:CONSTRAINT|INDEX)\s+(\w+)", re.IGNORECASE)
+
+
+async def _existing_schema_names(session: AsyncSession) -> Set[str]:
+    """Return the names of the constraints and indexes already in the database."""
+    names: Set[str] = set()
+    for query in ("SHOW CONSTRAINTS YIELD name", "SHOW INDEXES YIELD name"):
+        result = await session.run(query)
+        names.update([record["name"] async for record in result])
+    return names
+
+
+async def _apply_queries(tx: AsyncManagedTransaction, queries: List[Tuple[str, Dict[str, Any]]]) -> None:
+    """Transaction function running each (statement, parameters) pair in turn."""
+    for query, params in queries:
+        result = await tx.run(cast(LiteralString, query), params)  # type: ignore
+        await result.consume()
+
+
+async def _write_single(tx: AsyncManagedTransaction, query: str, params: Dict[str, Any]) -> Optional[Record]:
+    """Transaction function running one statement and returning its single row."""
+    result = await tx.run(cast(LiteralString, query), params)  # type: ignore
+    return await result.single()
+
+
+async def _run_ddl_batch(session: AsyncSession, queries: Iterable[Tuple[str, Dict[str, Any]]]) -> None:
+    """Run a schema's statements in as few transactions as Neo4j allows.
+
+    Constraints and indexes that already exist are skipped, so a rerun does
+    not take the schema lock for no-op DDL. Neo4j rejects schema and data
+    writes in the same transaction, so the missing constraint and index
+    statements commit together in one transaction and the remaining
+    statements (hub MERGEs, backfills) in a second one. Both are managed
+    transactions, so transient errors such as deadlocks on the schema lock
+    are retried; every statement is idempotent.
+    """
+    schema_queries: List[Tuple[str, Dict[str, Any]]] = []
+    data_queries: List[Tuple[str, Dict[str, Any]]] = []
+    for entry in queries:
+        (schema_queries if SCHEMA_QUERY_PATTERN.match(entry[0]) else data_queries).append(entry)
+
+    if schema_queries:
+        existing = await _existing_schema_names(session)
+        schema_queries = [q for q in schema_queries if SCHEMA_QUERY_PATTERN.match(q[0]).group(1) not in existing]  # type: ignore[union-attr]
+
+    for batch in (schema_queries, data_queries):
+        if batch:
+            await session.execute_write(_apply_queries, batch)
+
+async def _warm_connection_pool(driver: AsyncDriver, database: str, size: int) -> None:
+    """Open `size` pooled connections at once before concurrent work starts.
+
+    Each probe holds its own session while it runs, so the handshakes happen
+    in parallel here instead of on the critical path of the first queries.
+    """
+    async def probe() -> None:
+        async with safe_neo4j_session(driver, database) as session:
+            result = await session.run("RETURN 1 AS ok")
+            await result.single()
+
+    await asyncio.gather(*(probe() for _ in range(size)))
+
+
 # Dynamically discover available incarnation names
 def discover_incarnation_types():
     """Discover available incarnation names from the filesystem."""
-    import os
-
     incarnation_names = []
     current_dir = os.path.dirname(os.path.abspath(__file__))
     incarnations_dir = os.path.join(current_dir, "incarnations")
 
     if not os.path.exists(incarnations_dir):
-        logger.warning(f"Incarnations directory not found: {incarnations_dir}")
+        logger.warning("Incarnations directory not found: %s", incarnations_dir)
         return []  # Return empty list if directory doesn't exist
 
     # Simple discovery approach: scan for *_incarnation.py files
@@ -47,7 +122,7 @@ def discover_incarnation_types():
             if incarnation_name.endswith('_'):
                 incarnation_name = incarnation_name[:-1]
             incarnation_names.append(incarnation_name)
-            logger.info(f"Discovered incarnation name: {incarnation_name} from {entry}")
+            logger.info("Discovered incarnation name: %s from %s", incarnation_name, entry)
 
     return incarnation_names
 
@@ -55,199 +130,183 @@ def discover_incarnation_types():
 async def init_neo4j_connection(uri: str, user: str, password: str) -> AsyncDriver:
     """Initialize Neo4j connection."""
     try:
-        driver = AsyncGraphDatabase.driver(uri, auth=(user, password))
-        # Test the connection
-        async with safe_neo4j_session(driver, "neo4j") as session:
-            await session.run("RETURN 1")
+        driver = AsyncGraphDatabase.driver(uri, auth=(user, password), **INIT_DRIVER_CONFIG)
+        # Test the connection with a handshake; no session or transaction needed
+        await driver.verify_connectivity()
         logger.info("Successfully connected to Neo4j")
         return driver
-    except Exception as e:
-        logger.error(f"Failed to connect to Neo4j: {e}")
+    except Exception:
+        logger.exception("Failed to connect to Neo4j")
         sys.exit(1)
 
 
-async def init_base_schema(driver: AsyncDriver, database: str = "neo4j"):
-    """Initialize the base schema that is common to all incarnations."""
-    logger.info("Initializing base schema...")
+# Declarative schema specs. Constraints and indexes are (name, label, property)
+# tuples; "statements" holds DDL and data writes that do not fit that shape.
+SCHEMA_SPECS: Dict[str, Dict[str, Any]] = {
+    "base": {
+        "constraints": [
+            ("hub_id", "AiGuidanceHub", "id"),
+            ("proposal_id", "ToolProposal", "id"),
+            ("request_id", "ToolRequest", "id"),
+            ("snippet_id", "CypherSnippet", "id"),
+            ("tag_name", "Tag", "name"),
+        ],
+        "indexes": [
+            ("hub_type", "AiGuidanceHub", "type"),
+            ("proposal_status", "ToolProposal", "status"),
+            ("request_status", "ToolRequest", "status"),
+            ("snippet_name", "CypherSnippet", "name"),
+        ],
+        "statements": [
+            "CREATE TEXT INDEX snippet_syntax_text IF NOT EXISTS FOR (s:CypherSnippet) ON (s.syntax)",
+            "CREATE FULLTEXT INDEX snippet_fulltext IF NOT EXISTS FOR (s:CypherSnippet) ON EACH [s.syntax, s.description, s.name]",
+            "CREATE TEXT INDEX snippet_syntax_lc_text IF NOT EXISTS FOR (s:CypherSnippet) ON (s.syntax_lc)",
+            "CREATE TEXT INDEX snippet_description_lc_text IF NOT EXISTS FOR (s:CypherSnippet) ON (s.description_lc)",
+
+            # Backfill the lowercased search copies on snippets written before they existed
+            """
+            MATCH (s:CypherSnippet)
+            WHERE s.syntax_lc IS NULL OR s.description_lc IS NULL
+            SET s.syntax_lc = toLower(s.syntax),
+                s.description_lc = toLower(s.description)
+            """,
+        ],
+    },
+    "research": {
+        "hub_id": "research_hub",
+        "description": "Research Orchestration Platform - A system for managing scientific workflows, hypotheses, experiments, and observations.",
+        "constraints": [
+            ("research_hypothesis_id", "Hypothesis", "id"),
+            ("research_experiment_id", "Experiment", "id"),
+            ("research_protocol_id", "Protocol", "id"),
+            ("research_observation_id", "Observation", "id"),
+            ("research_run_id", "Run", "id"),
+        ],
+        "indexes": [
+            ("research_hypothesis_status", "Hypothesis", "status"),
+            ("research_experiment_status", "Experiment", "status"),
+            ("research_protocol_name", "Protocol", "name"),
+        ],
+    },
+    "decision": {
+        "hub_id": "decision_hub",
+        "description": "Decision Support System - A system for tracking decisions, alternatives, metrics, and evidence to support transparent, data-driven decision-making.",
+        "constraints": [
+            ("decision_id", "Decision", "id"),
+            ("alternative_id", "Alternative", "id"),
+            ("metric_id", "Metric", "id"),
+            ("evidence_id", "Evidence", "id"),
+        ],
+        "indexes": [
+            ("decision_status", "Decision", "status"),
+            ("alternative_name", "Alternative", "name"),
+        ],
+    },
+    "learning": {
+        "hub_id": "learning_hub",
+        "description": "Continuous Learning Environment - A system for adaptive learning and personalized content delivery based on knowledge spaces and mastery tracking.",
+        "constraints": [
+            ("learning_user_id", "User", "id"),
+            ("learning_concept_id", "Concept", "id"),
+            ("learning_problem_id", "Problem", "id"),
+            ("learning_attempt_id", "Attempt", "id"),
+        ],
+        "indexes": [
+            ("learning_user_name", "User", "name"),
+            ("learning_concept_name", "Concept", "name"),
+            ("learning_problem_difficulty", "Problem", "difficulty"),
+        ],
+    },
+    "simulation": {
+        "hub_id": "simulation_hub",
+        "description": "Complex System Simulation - A system for modeling and simulating complex systems with multiple interacting components and emergent behavior.",
+        "constraints": [
+            ("simulation_entity_id", "Entity", "id"),
+            ("simulation_model_id", "Model", "id"),
+            ("simulation_run_id", "SimulationRun", "id"),
+            ("simulation_state_id", "State", "id"),
+        ],
+        "indexes": [
+            ("simulation_entity_type", "Entity", "type"),
+            ("simulation_model_name", "Model", "name"),
+            ("simulation_run_timestamp", "SimulationRun", "timestamp"),
+        ],
+    },
+}
+
+# Incarnation names (and their aliases) that have a dedicated schema
+SCHEMA_ALIASES = {
+    "research_orchestration": "research",
+    "research": "research",
+    "decision_support": "decision",
+    "decision": "decision",
+    "continuous_learning": "learning",
+    "learning": "learning",
+    "complex_system": "simulation",
+    "simulation": "simulation",
+}
+
+
+# Creates a schema's guidance hub; existing hubs keep their description
+SCHEMA_HUB_QUERY = """
+MERGE (hub:AiGuidanceHub {id: $hub_id})
+ON CREATE SET hub.description = $description
+"""
 
-    # Base constraints and indexes
-    base_schema_queries = [
-        # Guidance Hub
-        "CREATE CONSTRAINT hub_id IF NOT EXISTS FOR (hub:AiGuidanceHub) REQUIRE hub.id IS UNIQUE",
 
-        # Tool proposals
-        "CREATE CONSTRAINT proposal_id IF NOT EXISTS FOR (p:ToolProposal) REQUIRE p.id IS UNIQUE",
-        "CREATE CONSTRAINT request_id IF NOT EXISTS FOR (r:ToolRequest) REQUIRE r.id IS UNIQUE",
+def build_schema_queries(spec: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+    """Generate the (statement, parameters) pairs for one schema spec."""
+    queries: List[Tuple[str, Dict[str, Any]]] = [
+        (f"CREATE CONSTRAINT {name} IF NOT EXISTS FOR (n:{label}) REQUIRE n.{prop} IS UNIQUE", {})
+        for name, label, prop in spec.get("constraints", [])
+    ]
+    queries.extend(
+        (f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.{prop})", {})
+        for name, label, prop in spec.get("indexes", [])
+    )
+    queries.extend((statement, {}) for statement in spec.get("statements", []))
 
-        # Cypher snippets
-        "CREATE CONSTRAINT snippet_id IF NOT EXISTS FOR (s:CypherSnippet) REQUIRE s.id IS UNIQUE",
-        "CREATE CONSTRAINT tag_name IF NOT EXISTS FOR (t:Tag) REQUIRE t.name IS UNIQUE",
+    if "hub_id" in spec:
+        queries.append((SCHEMA_HUB_QUERY, {"hub_id": spec["hub_id"], "description": spec["description"]}))
 
-        # Indexes
-        "CREATE INDEX hub_type IF NOT EXISTS FOR (hub:AiGuidanceHub) ON (hub.type)",
-        "CREATE INDEX proposal_status IF NOT EXISTS FOR (p:ToolProposal) ON (p.status)",
-        "CREATE INDEX request_status IF NOT EXISTS FOR (r:ToolRequest) ON (r.status)",
-        "CREATE INDEX snippet_name IF NOT EXISTS FOR (s:CypherSnippet) ON (s.name)"
-    ]
+    return queries
 
-    try:
-        async with safe_neo4j_session(driver, database) as session:
-            for query in base_schema_queries:
-                from typing import cast, LiteralString
-                await session.run(cast(LiteralString, query))
-        logger.info("Base schema initialized successfully")
-    except Exception as e:
-        logger.error(f"Error initializing base schema: {e}")
-        raise
-
-
-async def init_research_schema(driver: AsyncDriver, database: str = "neo4j"):
-    """Initialize the schema for the Research Orchestration Platform incarnation."""
-    logger.info("Initializing research schema...")
-
-    research_schema_queries = [
-        # Constraints
-        "CREATE CONSTRAINT research_hypothesis_id IF NOT EXISTS FOR (h:Hypothesis) REQUIRE h.id IS UNIQUE",
-        "CREATE CONSTRAINT research_experiment_id IF NOT EXISTS FOR (e:Experiment) REQUIRE e.id IS UNIQUE",
-        "CREATE CONSTRAINT research_protocol_id IF NOT EXISTS FOR (p:Protocol) REQUIRE p.id IS UNIQUE",
-        "CREATE CONSTRAINT research_observation_id IF NOT EXISTS FOR (o:Observation) REQUIRE o.id IS UNIQUE",
-        "CREATE CONSTRAINT research_run_id IF NOT EXISTS FOR (r:Run) REQUIRE r.id IS UNIQUE",
-
-        # Indexes
-        "CREATE INDEX research_hypothesis_status IF NOT EXISTS FOR (h:Hypothesis) ON (h.status)",
-        "CREATE INDEX research_experiment_status IF NOT EXISTS FOR (e:Experiment) ON (e.status)",
-        "CREATE INDEX research_protocol_name IF NOT EXISTS FOR (p:Protocol) ON (p.name)",
-
-        # Create research hub
-        """
-        MERGE (hub:AiGuidanceHub {id: 'research_hub'})
-        ON CREATE SET
-            hub.description = 'Research Orchestration Platform - A system for managing scientific workflows, hypotheses, experiments, and observations.'
-        RETURN hub
-        """
-    ]
 
-    try:
-        async with safe_neo4j_session(driver, database) as session:
-            for query in research_schema_queries:
-                await session.run(query)  # type: ignore[arg-type]
-        logger.info("Research schema initialized successfully")
-    except Exception as e:
-        logger.error(f"Error initializing research schema: {e}")
-        raise
-
-
-async def init_decision_schema(driver: AsyncDriver, database: str = "neo4j"):
-    """Initialize the schema for the Decision Support System incarnation."""
-    logger.info("Initializing decision support schema...")
-
-    decision_schema_queries = [
-        # Constraints
-        "CREATE CONSTRAINT decision_id IF NOT EXISTS FOR (d:Decision) REQUIRE d.id IS UNIQUE",
-        "CREATE CONSTRAINT alternative_id IF NOT EXISTS FOR (a:Alternative) REQUIRE a.id IS UNIQUE",
-        "CREATE CONSTRAINT metric_id IF NOT EXISTS FOR (m:Metric) REQUIRE m.id IS UNIQUE",
-        "CREATE CONSTRAINT evidence_id IF NOT EXISTS FOR (e:Evidence) REQUIRE e.id IS UNIQUE",
-
-        # Indexes
-        "CREATE INDEX decision_status IF NOT EXISTS FOR (d:Decision) ON (d.status)",
-        "CREATE INDEX alternative_name IF NOT EXISTS FOR (a:Alternative) ON (a.name)",
-
-        # Create decision hub
-        """
-        MERGE (hub:AiGuidanceHub {id: 'decision_hub'})
-        ON CREATE SET
-            hub.description = 'Decision Support System - A system for tracking decisions, alternatives, metrics, and evidence to support transparent, data-driven decision-making.'
-        RETURN hub
-        """
-    ]
+# Cypher for every schema, generated once at import
+SCHEMA_DDL = {name: build_schema_queries(spec) for name, spec in SCHEMA_SPECS.items()}
 
-    try:
-        async with safe_neo4j_session(driver, database) as session:
-            for query in decision_schema_queries:
-                await session.run(query)  # type: ignore[arg-type]
-        logger.info("Decision schema initialized successfully")
-    except Exception as e:
-        logger.error(f"Error initializing decision schema: {e}")
-        raise
-
-
-async def init_learning_schema(driver: AsyncDriver, database: str = "neo4j"):
-    """Initialize the schema for the Continuous Learning Environment incarnation."""
-    logger.info("Initializing learning schema...")
-
-    learning_schema_queries = [
-        # Constraints
-        "CREATE CONSTRAINT learning_user_id IF NOT EXISTS FOR (u:User) REQUIRE u.id IS UNIQUE",
-        "CREATE CONSTRAINT learning_concept_id IF NOT EXISTS FOR (c:Concept) REQUIRE c.id IS UNIQUE",
-        "CREATE CONSTRAINT learning_problem_id IF NOT EXISTS FOR (p:Problem) REQUIRE p.id IS UNIQUE",
-        "CREATE CONSTRAINT learning_attempt_id IF NOT EXISTS FOR (a:Attempt) REQUIRE a.id IS UNIQUE",
-
-        # Indexes
-        "CREATE INDEX learning_user_name IF NOT EXISTS FOR (u:User) ON (u.name)",
-        "CREATE INDEX learning_concept_name IF NOT EXISTS FOR (c:Concept) ON (c.name)",
-        "CREATE INDEX learning_problem_difficulty IF NOT EXISTS FOR (p:Problem) ON (p.difficulty)",
-
-        # Create learning hub
-        """
-        MERGE (hub:AiGuidanceHub {id: 'learning_hub'})
-        ON CREATE SET
-            hub.description = 'Continuous Learning Environment - A system for adaptive learning and personalized content delivery based on knowledge spaces and mastery tracking.'
-        RETURN hub
-        """
-    ]
 
-    try:
-        async with safe_neo4j_session(driver, database) as session:
-            from typing import cast, LiteralString
-            for query in learning_schema_queries:
-                await session.run(cast(LiteralString, query))
-        logger.info("Learning schema initialized successfully")
-    except Exception as e:
-        logger.error(f"Error initializing learning schema: {e}")
-        raise
-
-
-async def init_simulation_schema(driver: AsyncDriver, database: str = "neo4j"):
-    """Initialize the schema for the Complex System Simulation incarnation."""
-    logger.info("Initializing simulation schema...")
-
-    simulation_schema_queries = [
-        # Constraints
-        "CREATE CONSTRAINT simulation_entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.id IS UNIQUE",
-        "CREATE CONSTRAINT simulation_model_id IF NOT EXISTS FOR (m:Model) REQUIRE m.id IS UNIQUE",
-        "CREATE CONSTRAINT simulation_run_id IF NOT EXISTS FOR (r:SimulationRun) REQUIRE r.id IS UNIQUE",
-        "CREATE CONSTRAINT simulation_state_id IF NOT EXISTS FOR (s:State) REQUIRE s.id IS UNIQUE",
-
-        # Indexes
-        "CREATE INDEX simulation_entity_type IF NOT EXISTS FOR (e:Entity) ON (e.type)",
-        "CREATE INDEX simulation_model_name IF NOT EXISTS FOR (m:Model) ON (m.name)",
-        "CREATE INDEX simulation_run_timestamp IF NOT EXISTS FOR (r:SimulationRun) ON (r.timestamp)",
-
-        # Create simulation hub
-        """
-        MERGE (hub:AiGuidanceHub {id: 'simulation_hub'})
-        ON CREATE SET
-            hub.description = 'Complex System Simulation - A system for modeling and simulating complex systems with multiple interacting components and emergent behavior.'
-        RETURN hub
-        """
-    ]
+async def init_all_schemas(driver: AsyncDriver, database: str, incarnations: List[str]):
+    """Initialize the base schema and the schemas of the given incarnations.
 
-    try:
-        async with safe_neo4j_session(driver, database) as session:
-            for query in simulation_schema_queries:
-                from typing import cast, LiteralString
-                await session.run(cast(LiteralString, query))
-        logger.info("Simulation schema initialized successfully")
-    except Exception as e:
-        logger.error(f"Error initializing simulation schema: {e}")
-        raise
+    All the DDL goes over one session, so the constraints and indexes of every
+    schema commit in a single transaction and the hub writes in a second.
+    """
+    logger.info("Initializing schemas...")
 
+    # Both names of an aliased incarnation map to the same schema
+    schemas = ["base"]
+    for inc_type in incarnations:
+        schema = SCHEMA_ALIASES.get(inc_type)
+        if schema is not None and schema not in schemas:
+            schemas.append(schema)
 
-async def create_main_guidance_hub(driver: AsyncDriver, database: str = "neo4j"):
-    """Create the main guidance hub that lists all available incarnations."""
-    logger.info("Creating main guidance hub...")
+    queries = [query for schema in schemas for query in SCHEMA_DDL[schema]]
 
-    main_hub_description = """
+    async with safe_neo4j_session(driver, database) as session:
+        await _run_ddl_batch(session, queries)
+    logger.info("Schemas initialized successfully: %s", ", ".join(schemas))
+
+
+# Hub descriptions for incarnations without a dedicated schema
+INCARNATION_HUB_DESCRIPTIONS = {
+    "knowledge_graph": "Knowledge Graph Management - Create and analyze semantic knowledge graphs with entities, observations, and relationships.",
+    "code_analysis": "Code Analysis - Parse, analyze, and document code structure, patterns, and metrics.",
+    "data_analysis": "Data Analysis - Analyze datasets, create visualizations, and extract insights from data.",
+}
+
+# Description of the main guidance hub, listing the available incarnations
+MAIN_HUB_DESCRIPTION = """
 # NeoCoder Polymorphic Framework
 
 Welcome to the NeoCoder Polymorphic Framework. This system can transform between multiple incarnations to support different use cases:
@@ -267,63 +326,68 @@ Welcome to the NeoCoder Polymorphic Framework. This system can transform between
 - Once activated, use `get_guidance_hub()` again to see incarnation-specific guidance
 
 Each incarnation provides its own set of specialized tools while maintaining core Neo4j integration.
-    """
+"""
 
-    query = """
-    MERGE (hub:AiGuidanceHub {id: 'main_hub'})
-    ON CREATE SET hub.description = $description
-    RETURN hub
-    """
 
-    try:
-        async with safe_neo4j_session(driver, database) as session:
-            await session.run(query, {"description": main_hub_description})
-        logger.info("Main guidance hub created successfully")
-    except Exception as e:
-        logger.error(f"Error creating main guidance hub: {e}")
-        raise
-
-async def create_dynamic_links_between_hubs(driver: AsyncDriver, database: str = "neo4j", incarnations: Optional[List[str]] = None):
-    """Create relationships between the main hub and all incarnation-specific hubs."""
-    logger.info("Creating dynamic links between hubs...")
-
-    # Get all AiGuidanceHub nodes
-    query = """
-    MATCH (hub:AiGuidanceHub)
-    WHERE hub.id <> 'main_hub' AND hub.id ENDS WITH '_hub'
-    RETURN hub.id AS id
+async def create_incarnation_hub(driver: AsyncDriver, database: str, inc_type: str):
+    """Create the guidance hub for an incarnation without a dedicated schema."""
+    logger.info("Creating basic schema for incarnation: %s", inc_type)
+    hub_id = f"{inc_type}_hub"
+
+    # Use the more informative description where there is one, else a generic one
+    hub_description = INCARNATION_HUB_DESCRIPTIONS.get(inc_type) or (
+        f"This is the {inc_type.replace('_', ' ').title()} incarnation of the NeoCoder framework."
+    )
+
+    # Use parameterized query for safety and to avoid quoting issues
+    hub_query = """
+    MERGE (hub:AiGuidanceHub {id: $hub_id})
+    ON CREATE SET hub.description = $hub_description
     """
 
     try:
         async with safe_neo4j_session(driver, database) as session:
-            # Get all hub IDs using to_eager_result() instead
-            result = await session.run(query)
-            eager_result = await result.to_eager_result()
-
-            # Create links for each hub
-            main_hub_query = """
-            MATCH (main:AiGuidanceHub {id: 'main_hub'})
-            MATCH (inc:AiGuidanceHub {id: $hub_id})
-            MERGE (main)-[:HAS_INCARNATION {type: $inc_type}]->(inc)
-            """
+            await session.execute_write(_write_single, hub_query, {"hub_id": hub_id, "hub_description": hub_description})
+            logger.info("Created hub for %s", inc_type)
+    except Exception:
+        logger.exception("Error creating hub for %s", inc_type)
+
+
+# Creates the main hub and links every incarnation hub to it; the type is the
+# hub id without its _hub suffix (e.g., research_hub -> research)
+MAIN_HUB_WITH_LINKS_QUERY = """
+MERGE (main:AiGuidanceHub {id: 'main_hub'})
+ON CREATE SET main.description = $description
+WITH main
+OPTIONAL MATCH (inc:AiGuidanceHub)
+WHERE inc.id <> 'main_hub' AND inc.id ENDS WITH '_hub'
+WITH main, collect(inc) AS hubs
+FOREACH (inc IN hubs |
+    MERGE (main)-[:HAS_INCARNATION {type: replace(inc.id, '_hub', '')}]->(inc)
+)
+RETURN [inc IN hubs | replace(inc.id, '_hub', '')] AS linked
+"""
+
+
+async def create_main_hub_with_links(driver: AsyncDriver, database: str = "neo4j"):
+    """Create the main guidance hub and link it to all incarnation-specific hubs.
+
+    Runs once every incarnation hub exists, as a single statement.
+    """
+    logger.info("Creating main guidance hub and hub links...")
 
-            for record in eager_result.records:
-                hub_id = record.get("id")
-                if hub_id:
-                    # Extract incarnation type from hub ID (e.g., research_hub -> research)
-                    inc_type = hub_id.replace("_hub", "")
+    async with safe_neo4j_session(driver, database) as session:
+        record = await session.execute_write(_write_single, MAIN_HUB_WITH_LINKS_QUERY, {"description": MAIN_HUB_DESCRIPTION})
+        linked = record["linked"] if record else []
+    logger.info("Main guidance hub linked to incarnations: %s", ', '.join(linked))
 
-                    # Create link
-                    await session.run(main_hub_query, {"hub_id": hub_id, "inc_type": inc_type})
-                    logger.info(f"Created link for incarnation: {inc_type}")
 
-        logger.info("Hub links created successfully")
-    except Exception as e:
-        logger.error(f"Error creating hub links: {e}")
-        raise
+async def init_db(incarnations: Optional[List[str]] = None, driver: Optional[AsyncDriver] = None):
+    """Initialize the database with the schemas for the specified incarnations.
 
-async def init_db(incarnations: Optional[List[str]] = None):
-    """Initialize the database with the schemas for the specified incarnations."""
+    Pass an existing driver to reuse its warm connection pool; it is left open.
+    Without one, a driver is created for the run and closed afterwards.
+    """
     # Get Neo4j connection info from environment variables
     neo4j_uri = os.environ.get("NEO4J_URL", "bolt://localhost:7687")
     neo4j_user = os.environ.get("NEO4J_USERNAME", "neo4j")
@@ -332,89 +396,45 @@ async def init_db(incarnations: Optional[List[str]] = None):
 
     # Discover available incarnation types
     available_incarnations = discover_incarnation_types()
-    logger.info(f"Discovered incarnation types: {available_incarnations}")
+    logger.info("Discovered incarnation types: %s", available_incarnations)
 
     # If no incarnations specified, initialize all discovered
     incarnations = incarnations or available_incarnations
 
-    # Connect to Neo4j
-    try:
-        driver = await init_neo4j_connection(neo4j_uri, neo4j_user, neo4j_password)
-    except Exception as e:
-        logger.error(f"Failed to connect to Neo4j: {e}")
-        # Return instead of sys.exit to allow recovery
-        return
+    # Connect to Neo4j unless the caller supplied a driver
+    owns_driver = driver is None
+    if driver is None:
+        try:
+            driver = await init_neo4j_connection(neo4j_uri, neo4j_user, neo4j_password)
+        except Exception:
+            logger.exception("Failed to connect to Neo4j")
+            # Return instead of sys.exit to allow recovery
+            return
 
     success = False
     try:
-        # Initialize base schema
-        await init_base_schema(driver, neo4j_database)
-
-        # Initialize incarnation-specific schemas
-        if "research_orchestration" in incarnations or "research" in incarnations:
-            await init_research_schema(driver, neo4j_database)
+        # Schemas and incarnation hubs do not depend on each other, so they are
+        # created concurrently; only the main hub links need every hub in place
+        tasks = [init_all_schemas(driver, neo4j_database, incarnations)]
 
-        if "decision_support" in incarnations or "decision" in incarnations:
-            await init_decision_schema(driver, neo4j_database)
-
-        if "continuous_learning" in incarnations or "learning" in incarnations:
-            await init_learning_schema(driver, neo4j_database)
+        # Create hubs for discovered incarnations without a dedicated schema
+        for inc_type in incarnations:
+            if inc_type not in SCHEMA_ALIASES:
+                tasks.append(create_incarnation_hub(driver, neo4j_database, inc_type))
 
-        if "complex_system" in incarnations or "simulation" in incarnations:
-            await init_simulation_schema(driver, neo4j_database)
+        await _warm_connection_pool(driver, neo4j_database, len(tasks))
+        await asyncio.gather(*tasks)
 
-        # Create incarnation-specific schemas for other discovered incarnations
-        for inc_type in incarnations:
-            # Skip already handled incarnations
-            if inc_type in ["research_orchestration", "research", "decision_support",
-                           "decision", "continuous_learning", "learning",
-                           "complex_system", "simulation"]:
-                continue
-
-            logger.info(f"Creating basic schema for incarnation: {inc_type}")
-            hub_id = f"{inc_type}_hub"
-
-            # Create a more informative hub description based on the incarnation type
-            if inc_type == "knowledge_graph":
-                hub_description = "Knowledge Graph Management - Create and analyze semantic knowledge graphs with entities, observations, and relationships."
-            elif inc_type == "code_analysis":
-                hub_description = "Code Analysis - Parse, analyze, and document code structure, patterns, and metrics."
-            elif inc_type == "data_analysis":
-                hub_description = "Data Analysis - Analyze datasets, create visualizations, and extract insights from data."
-            else:
-                # Generic description for any other incarnation
-                hub_description = f"This is the {inc_type.replace('_', ' ').title()} incarnation of the NeoCoder framework."
-
-            try:
-                # Use parameterized query for safety and to avoid quoting issues
-                hub_query = """
-                MERGE (hub:AiGuidanceHub {id: $hub_id})
-                ON CREATE SET hub.description = $hub_description
-                RETURN hub
-                """
-
-                async with safe_neo4j_session(driver, neo4j_database) as session:
-                    await session.run(hub_query, {"hub_id": hub_id, "hub_description": hub_description})
-                    logger.info(f"Created hub for {inc_type}")
-
-            except Exception as e:
-                logger.error(f"Error creating hub for {inc_type}: {e}")
-
-        # Create main guidance hub
-        await create_main_guidance_hub(driver, neo4j_database)
-
-        # Create links between hubs for all discovered incarnations
-        await create_dynamic_links_between_hubs(driver, neo4j_database, incarnations)
+        # Create the main hub and its links to all incarnation hubs
+        await create_main_hub_with_links(driver, neo4j_database)
 
         logger.info("Database initialization complete!")
         success = True
-    except Exception as e:
-        logger.error(f"Error during database initialization: {e}")
-        import traceback
-        logger.error(f"Initialization stack trace: {traceback.format_exc()}")
+    except Exception:
+        logger.exception("Error during database initialization")
     finally:
-        # Only close the driver if it was successfully created
-        if 'driver' in locals():
+        # Only close the driver if this run created it
+        if owns_driver:
             await driver.close()
 
         # Return success status instead of exiting
@@ -428,18 +448,18 @@ def main():
 
     # Discover available incarnation types for validation
     available_types = discover_incarnation_types()
+    available_type_set = frozenset(available_types)
 
     if incarnations_to_init and available_types:
         # Validate incarnation types against discovered types
         for inc in incarnations_to_init:
-            if inc not in available_types:
-                logger.error(f"Invalid incarnation type: {inc}")
-                logger.error(f"Valid types are: {', '.join(available_types)}")
+            if inc not in available_type_set:
+                logger.error("Invalid incarnation type: %s", inc)
+                logger.error("Valid types are: %s", ', '.join(available_types))
                 sys.exit(1)
 
     # Robust event loop handling for asyncio (fixes 'Future attached to a different loop' errors)
     try:
-        import asyncio
         try:
             loop = asyncio.get_running_loop()
         except RuntimeError:
@@ -452,17 +472,17 @@ def main():
             def _log_result(fut):
                 try:
                     result = fut.result()
-                    logger.info(f"Database initialization result: {result}")
+                    logger.info("Database initialization result: %s", result)
                 except Exception as e:
-                    logger.error(f"Database initialization failed: {e}")
+                    logger.error("Database initialization failed: %s", e)
             task.add_done_callback(_log_result)
             # If possible, run until complete (only if not in a REPL)
             if hasattr(loop, 'run_until_complete'):
                 loop.run_until_complete(task)
         else:
             asyncio.run(init_db(incarnations_to_init))
-    except Exception as e:
-        logger.error(f"Error running database initialization: {e}")
+    except Exception:
+        logger.exception("Error running database initialization")
         sys.exit(1)
 
 
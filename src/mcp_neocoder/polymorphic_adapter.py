@@ -7,11 +7,13 @@ multiple incarnations using string-based identifiers.
 Enhanced with async context preservation for robust operation across incarnation transitions.
 """
 
+import difflib
 import logging
 import asyncio
-from typing import Dict, Any, List, Optional, Type, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple, Type, TYPE_CHECKING
 
-import mcp.types as types
+from .process_manager import TIMEOUTS, is_shutdown_in_progress
 
 if TYPE_CHECKING:
     from neo4j import AsyncDriver
@@ -19,6 +21,20 @@ if TYPE_CHECKING:
 logger = logging.getLogger("mcp_neocoder.polymorphic_adapter")
 
 
+def _incarnation_alias(name: str) -> str:
+    """Reduce an incarnation name to its lookup alias.
+
+    Case and '_', '-' or ' ' separators are ignored, so 'Knowledge Graph',
+    'knowledge-graph' and 'knowledge_graph' all share one alias.
+    """
+    return "".join(_incarnation_words(name))
+
+
+def _incarnation_words(name: str) -> List[str]:
+    """Split an incarnation name into lowercase words."""
+    return name.lower().replace("-", " ").replace("_", " ").split()
+
+
 class PolymorphicAdapterMixin:
     """Mixin to add polymorphic incarnation capabilities to the Neo4jWorkflowServer.
 
@@ -41,10 +57,11 @@ class PolymorphicAdapterMixin:
     database: str
 
     def __init__(self, *args, **kwargs) -> None:
-        """Initialize the polymorphic adapter with event loop tracking.
+        """Initialize the polymorphic adapter.
 
-        Sets up incarnation registry and async context management for robust
-        operation across different event loop contexts.
+        Sets up the incarnation registry and the current incarnation slot.
+        Incarnation switches always run on the caller's loop, which is the
+        loop the Neo4j driver was created on.
         """
         # Initialize incarnation registry if not present
         if not hasattr(self, 'incarnation_registry'):
@@ -52,7 +69,19 @@ class PolymorphicAdapterMixin:
         if not hasattr(self, 'current_incarnation'):
             self.current_incarnation: Optional[Any] = None
 
-        self._event_loop_context: Optional[asyncio.AbstractEventLoop] = None
+        # Flat alias -> registry key table, maintained by register_incarnation
+        self._incarnation_lookup: Dict[str, str] = {}
+        for registered in self.incarnation_registry:
+            self._add_incarnation_alias(registered)
+
+        # Frozen list_available_incarnations() result; register_incarnation
+        # clears it and bumps the version so derived caches can tell too
+        self._incarnation_list_cache: Optional[Tuple[Mapping[str, Any], ...]] = None
+        self._incarnation_list_version = 0
+
+        # Incarnation types whose schema has been initialized in this process
+        self._initialized_schemas: Set[str] = set()
+
         super().__init__(*args, **kwargs)
 
     async def set_incarnation(self, incarnation_type: str) -> Any:
@@ -72,21 +101,17 @@ class PolymorphicAdapterMixin:
             ValueError: If the incarnation type is not registered
             RuntimeError: If async context conflicts cannot be resolved
         """
-        if incarnation_type not in self.incarnation_registry:
+        resolved = self.resolve_incarnation_type(incarnation_type)
+        if resolved is None:
             available = list(self.incarnation_registry.keys())
             raise ValueError(f"Unknown incarnation type: '{incarnation_type}'. Available: {available}")
+        incarnation_type = resolved
 
-        # Preserve event loop context for consistency across async operations
-        try:
-            current_loop = asyncio.get_running_loop()
-            if self._event_loop_context is None:
-                self._event_loop_context = current_loop
-            elif self._event_loop_context != current_loop:
-                logger.warning("Event loop context changed, updating reference")
-                self._event_loop_context = current_loop
-        except RuntimeError:
-            # No running loop - acceptable for some initialization contexts
-            pass
+        # Switching to the active incarnation is a no-op; current_incarnation
+        # is only set once schema init and tool registration have succeeded
+        if type(self.current_incarnation) is self.incarnation_registry[incarnation_type]:
+            logger.info("Incarnation %s is already active", incarnation_type)
+            return self.current_incarnation
 
         # Get instance from global registry or create new one
         from mcp_neocoder.incarnation_registry import registry as global_registry
@@ -100,43 +125,104 @@ class PolymorphicAdapterMixin:
             incarnation_class = self.incarnation_registry[incarnation_type]
             incarnation_instance = incarnation_class(driver, database)
 
-        self.current_incarnation = incarnation_instance
+        if incarnation_instance is None:
+            raise RuntimeError("No incarnation instance available; cannot initialize schema.")
+        incarnation = incarnation_instance
+
+        logger.info("Registering tools for incarnation: %s", incarnation_type)
+        register = self._run_incarnation_step("Tool registration", lambda: incarnation.register_tools(self))
+
+        # The schema DDL is idempotent, so it only needs to run on first
+        # activation. Tool registration is in-process and does not depend on
+        # it, so the two run together and the registration hides behind the
+        # Neo4j round trips. The task group cancels registration if schema
+        # init fails, and tools it already registered are removed again.
+        if incarnation_type not in self._initialized_schemas:
+            from .tool_registry import registry as tool_registry
+
+            was_registered = tool_registry.is_class_registered(incarnation)
+            try:
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(self._run_incarnation_step("Schema initialization", incarnation.initialize_schema))
+                    registration = group.create_task(register)
+            except BaseException as e:
+                # Covers a cancelled switch as well as a failed step
+                if not was_registered:
+                    tool_registry.unregister_class_tools(incarnation)
+                if isinstance(e, BaseExceptionGroup):
+                    raise e.exceptions[0]
+                raise
+            tool_count = registration.result()
+            self._initialized_schemas.add(incarnation_type)
+        else:
+            tool_count = await register
+        logger.info("Registered %s tools for %s", tool_count, incarnation_type)
+
+        self.current_incarnation = incarnation
+        logger.info("Successfully switched to incarnation: %s", incarnation_type)
+        return incarnation
+
+    async def set_incarnation_with_timeout(self, incarnation_type: str, timeout: Optional[float] = None) -> Any:
+        """Run set_incarnation with a bounded wait that gives up on shutdown.
+
+        The switch is polled in short slices so that a server shutdown
+        cancels it promptly instead of leaving the caller waiting for the
+        full timeout.
+
+        Args:
+            incarnation_type: String identifier for the incarnation type
+            timeout: Seconds to wait; defaults to TIMEOUTS["incarnation_switch"]
+
+        Returns:
+            The incarnation instance that was activated
+
+        Raises:
+            TimeoutError: If the switch does not finish within the timeout
+            RuntimeError: If shutdown starts while the switch is running
+        """
+        timeout = TIMEOUTS["incarnation_switch"] if timeout is None else timeout
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        task = asyncio.ensure_future(self.set_incarnation(incarnation_type))
 
-        # Initialize schema with async context error recovery
-        if self.current_incarnation is None:
-            raise RuntimeError("No current incarnation is set; cannot initialize schema.")
         try:
-            await self.current_incarnation.initialize_schema()
-        except RuntimeError as e:
-            if "different loop" in str(e).lower():
-                logger.warning("Async loop conflict during schema initialization, attempting recovery")
-                try:
-                    await asyncio.create_task(self.current_incarnation.initialize_schema())
-                except Exception as recovery_err:
-                    logger.error(f"Failed to recover from async loop conflict: {recovery_err}")
-                    raise RuntimeError(f"Schema initialization failed: {recovery_err}") from recovery_err
-            else:
-                raise
+            while True:
+                remaining = deadline - loop.time()
+                done, _ = await asyncio.wait({task}, timeout=max(0.0, min(TIMEOUTS["shutdown_poll"], remaining)))
+                if done:
+                    return task.result()
+                if is_shutdown_in_progress():
+                    raise RuntimeError(f"Switch to '{incarnation_type}' abandoned: server is shutting down")
+                if loop.time() >= deadline:
+                    raise TimeoutError(f"Switch to '{incarnation_type}' did not finish within {timeout:g}s")
+        finally:
+            if not task.done():
+                task.cancel()
+
+    async def _run_incarnation_step(self, step: str, coro_factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Await one incarnation activation step, retrying once on a loop conflict.
 
-        # Register incarnation-specific tools with async error recovery
-        logger.info(f"Registering tools for incarnation: {incarnation_type}")
+        Args:
+            step: Human-readable step name used in log and error messages
+            coro_factory: Zero-argument callable returning a fresh coroutine for the step
+
+        Returns:
+            Whatever the step's coroutine returns
+
+        Raises:
+            RuntimeError: If the step still fails after the loop-conflict retry
+        """
         try:
-            tool_count = await self.current_incarnation.register_tools(self)
-            logger.info(f"Registered {tool_count} tools for {incarnation_type}")
+            return await coro_factory()
         except RuntimeError as e:
-            if "different loop" in str(e).lower():
-                logger.warning("Tool registration async loop conflict, attempting recovery")
-                try:
-                    tool_count = await asyncio.create_task(self.current_incarnation.register_tools(self))
-                    logger.info(f"Registered {tool_count} tools for {incarnation_type} (recovered)")
-                except Exception as recovery_err:
-                    logger.error(f"Failed to recover from tool registration conflict: {recovery_err}")
-                    raise RuntimeError(f"Tool registration failed: {recovery_err}") from recovery_err
-            else:
+            if "different loop" not in str(e).lower():
                 raise
-
-        logger.info(f"Successfully switched to incarnation: {incarnation_type}")
-        return self.current_incarnation
+            logger.warning("%s hit an async loop conflict, attempting recovery", step)
+            try:
+                return await asyncio.create_task(coro_factory())
+            except Exception as recovery_err:
+                logger.error("Failed to recover from async loop conflict: %s", recovery_err)
+                raise RuntimeError(f"{step} failed: {recovery_err}") from recovery_err
 
     async def get_current_incarnation_type(self) -> Optional[str]:
         """Get the currently active incarnation identifier.
@@ -149,12 +235,18 @@ class PolymorphicAdapterMixin:
         return getattr(self.current_incarnation, 'name', None) or \
                getattr(self.current_incarnation, 'incarnation_type', None)
 
-    async def list_available_incarnations(self) -> List[Dict[str, Any]]:
+    async def list_available_incarnations(self) -> Sequence[Mapping[str, Any]]:
         """List all available incarnations with their metadata.
 
+        The result is built once per registry change and shared between
+        callers, so the entries are read-only mappings.
+
         Returns:
-            List of dictionaries containing incarnation type and description information
+            Sequence of mappings containing incarnation type and description information
         """
+        if self._incarnation_list_cache is not None:
+            return self._incarnation_list_cache
+
         incarnations = []
         for inc_type, inc_class in self.incarnation_registry.items():
             # Handle both string and enum-like type values
@@ -162,20 +254,74 @@ class PolymorphicAdapterMixin:
             if hasattr(inc_type, 'value') and not isinstance(inc_type, str):
                 type_value = inc_type.value
 
-            incarnations.append({
+            incarnations.append(MappingProxyType({
                 "type": type_value,
                 "description": getattr(inc_class, 'description', None) or
                               getattr(inc_class, '__doc__', None) or
                               "No description available",
-            })
-        return incarnations
+            }))
+
+        self._incarnation_list_cache = tuple(incarnations)
+        return self._incarnation_list_cache
+
+    def resolve_incarnation_type(self, incarnation_type: str) -> Optional[str]:
+        """Map a user-supplied incarnation name to its registry key.
+
+        Args:
+            incarnation_type: Incarnation name in any case, with '_', '-' or ' ' separators
+
+        Returns:
+            The registered incarnation key, or None if nothing matches even
+            approximately
+        """
+        if incarnation_type in self.incarnation_registry:
+            return incarnation_type
+
+        alias = _incarnation_alias(incarnation_type)
+        resolved = self._incarnation_lookup.get(alias)
+        if resolved is not None or not alias:
+            return resolved
+
+        # Tolerate typos by picking the closest known alias
+        matches = difflib.get_close_matches(alias, self._incarnation_lookup.keys(), n=1, cutoff=0.6)
+        if not matches:
+            return None
+        resolved = self._incarnation_lookup[matches[0]]
+        logger.info("Resolved incarnation '%s' to closest match '%s'", incarnation_type, resolved)
+        return resolved
+
+    def _add_incarnation_alias(self, incarnation_type: str) -> None:
+        """Point the aliases of a registered incarnation at its registry key.
+
+        Besides the full alias, the first word is an alias too (e.g. 'research'
+        for 'research_orchestration'); earlier registrations keep any alias
+        they already claimed.
+        """
+        name = str(incarnation_type)
+        self._incarnation_lookup[_incarnation_alias(name)] = incarnation_type
+        words = _incarnation_words(name)
+        if words:
+            self._incarnation_lookup.setdefault(words[0], incarnation_type)
 
     def register_incarnation(self, incarnation_type: str, incarnation_class: Type) -> None:
         """Register a new incarnation type with its implementation class.
 
+        Registering the class already held for a type does nothing; replacing
+        it with a different class is logged as a warning.
+
         Args:
             incarnation_type: String identifier for the incarnation (e.g., 'knowledge_graph')
             incarnation_class: Class that implements the incarnation functionality
         """
+        existing = self.incarnation_registry.get(incarnation_type)
+        if existing is incarnation_class:
+            # Re-registering the same class is a no-op and keeps the list cache
+            return
+        if existing is not None:
+            logger.warning("Replacing incarnation %s: %s -> %s", incarnation_type, existing.__name__, incarnation_class.__name__)
+
         self.incarnation_registry[incarnation_type] = incarnation_class
-        logger.info(f"Registered incarnation: {incarnation_type} -> {incarnation_class.__name__}")
+        self._add_incarnation_alias(incarnation_type)
+        self._incarnation_list_cache = None
+        self._incarnation_list_version += 1
+        logger.info("Registered incarnation: %s -> %s", incarnation_type, incarnation_class.__name__)
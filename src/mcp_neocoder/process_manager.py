@@ -27,6 +27,8 @@ TIMEOUTS = {
     "shutdown_process_kill": 5.0,  # 5 seconds after SIGKILL
     "shutdown_cleanup_total": 30.0,  # 30 seconds total for full cleanup
     "subprocess_default": 600.0,  # 10 minutes default for subprocesses
+    "incarnation_switch": 30.0,  # 30 seconds for schema setup and tool registration
+    "shutdown_poll": 1.0,  # 1 second between shutdown checks while waiting
 }
 
 # Global tracking dictionaries for cleanup
@@ -40,6 +42,11 @@ _cleanup_registered = False
 _shutdown_in_progress = False
 
 
+def is_shutdown_in_progress() -> bool:
+    """Return True once process cleanup has started."""
+    return _shutdown_in_progress
+
+
 def track_tool_operation(task: asyncio.Task) -> None:
     """Track a tool operation task separately from background tasks.
 
@@ -18,12 +18,11 @@ import logging
 import os
 import sys
 import traceback
-from typing import Any, Dict, List, Optional, TypeVar, Awaitable
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Awaitable
 
 import mcp.types as types
 from mcp.server.fastmcp import FastMCP
 from neo4j import AsyncDriver, AsyncGraphDatabase, AsyncTransaction, AsyncManagedTransaction
-import neo4j
 from pydantic import Field
 
 # Import mixins and core functionality
@@ -53,11 +52,30 @@ logger = logging.getLogger("mcp_neocoder")
 # Type definitions for function return handling
 T = TypeVar("T")
 
+# Creates the main guidance hub; the description is always passed as a parameter
+CREATE_MAIN_HUB_QUERY = """
+CREATE (hub:AiGuidanceHub {id: 'main_hub', description: $description, created: datetime()})
+RETURN hub.description AS description
+"""
+
 
 def async_to_sync(func: Awaitable[T]) -> T:
-    """Run an async function in a synchronous context."""
-    loop = asyncio.get_event_loop()
-    return loop.run_until_complete(func)
+    """Run an async function in a synchronous context.
+
+    Uses asyncio.run, so the temporary loop is closed afterwards instead of
+    leaking. Must not be called while an event loop is running in this thread.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        async def _await() -> T:
+            return await func
+
+        return asyncio.run(_await())
+
+    if asyncio.iscoroutine(func):
+        func.close()
+    raise RuntimeError("async_to_sync() called from a running event loop; await the coroutine instead")
 
 
 class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolProposalMixin, ActionTemplateMixin):
@@ -79,6 +97,10 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
         self.database = database if database is not None else "neo4j"
         self.connection_details = connection_details
 
+        # One bookmark manager for the server's lifetime, so reads follow the last
+        # write causally even when _ensure_driver replaces the driver
+        self.bookmark_manager = AsyncGraphDatabase.bookmark_manager()
+
         if driver:
             # Track the driver for cleanup
             track_driver(driver)
@@ -94,6 +116,9 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
         self.incarnation_registry: Dict[str, Any] = {}
         self.current_incarnation: Optional[Any] = None
 
+        # (registry version, rendered table) for list_incarnations
+        self._incarnation_table_cache: Optional[Tuple[int, str]] = None
+
         # Add initialization event for synchronization
         self.initialized_event: asyncio.Event = asyncio.Event()
 
@@ -182,9 +207,9 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
 
             # Verify connection
             async with safe_neo4j_session(self.driver, self.database) as session:
-                result = await session.run("RETURN 1 as n")
-                data = await result.data()
-                if not data or data[0]["n"] != 1:
+                result = await session.run("RETURN 1 AS ok")
+                record = await result.single()
+                if not record or record["ok"] != 1:
                     raise RuntimeError("Driver verification failed: unexpected response")
 
             logger.info("Neo4j driver initialized and verified successfully")
@@ -215,6 +240,13 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
             else:
                 logger.info("Database initialization completed successfully")
 
+            # 2. Apply schema that was added after existing databases were
+            # initialized; every statement is idempotent
+            try:
+                await self.ensure_snippet_search_schema()
+            except Exception as e:
+                logger.warning("Could not ensure snippet search indexes: %s", e)
+
             # 3. Register core tools that don't depend on incarnations
             self._register_core_tools()
             logger.info("Core tools registered")
@@ -255,7 +287,7 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
 
             if not initialized:
                 logger.info("Database needs initialization, running setup")
-                await init_db()
+                await init_db(driver=self.driver)
                 logger.info("Database initialization completed")
                 return True
             else:
@@ -269,7 +301,7 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
             # Attempt recovery by running initialization anyway
             try:
                 logger.info("Attempting database initialization after error")
-                await init_db()
+                await init_db(driver=self.driver)
                 logger.info("Database initialization successful after error recovery")
                 return True
             except Exception as recovery_err:
@@ -324,7 +356,7 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
             bool: Whether the component exists
         """
         try:
-            result = await session.execute_read(lambda tx: self._execute_boolean_query(tx, query, {}))
+            result = await session.execute_read(self._execute_boolean_query, query, {})
             return result
         except Exception as e:
             logger.debug(f"Component check failed: {str(e)}")
@@ -344,12 +376,12 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
         from typing import cast, LiteralString
 
         result = await tx.run(cast(LiteralString, query), params)
-        records = await result.values()
+        record = await result.single()
 
-        if not records or not records[0]:
+        if not record:
             return False
 
-        return bool(records[0][0])
+        return bool(record[0])
 
     def _register_core_tools(self):
         """Register all core tools with the ToolRegistry.
@@ -382,7 +414,7 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
             tool_registry.register_tool(tool, "query")
 
         # Cypher toolkit tools
-        cypher_tools = [self.list_cypher_snippets, self.get_cypher_snippet, self.search_cypher_snippets, self.create_cypher_snippet, self.update_cypher_snippet, self.delete_cypher_snippet, self.get_cypher_tags]
+        cypher_tools = [self.list_cypher_snippets, self.get_cypher_snippet, self.get_cypher_snippets, self.snippet_dashboard, self.search_cypher_snippets, self.create_cypher_snippet, self.create_cypher_snippets, self.update_cypher_snippet, self.delete_cypher_snippet, self.get_cypher_tags]
         for tool in cypher_tools:
             tool_registry.register_tool(tool, "cypher")
 
@@ -410,7 +442,7 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
         import importlib
         import inspect
 
-        # Force a re-discovery to ensure we get all classes
+        # Discovery scans the incarnations directory only once per process
         logger.info("Discovering available incarnation classes")
         global_registry.discover()
 
@@ -448,8 +480,7 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
                         except ImportError as ie:
                             logger.error(f"Could not import module {full_module_path}: {ie}")
                     except Exception as e:
-                        logger.error(f"Error manually loading {inc_type} incarnation: {e}")
-                        logger.error(traceback.format_exc())
+                        logger.exception(f"Error manually loading {inc_type} incarnation: {e}")
 
         # Register discovered incarnations with this server
         incarnation_count = 0
@@ -482,8 +513,7 @@ class Neo4jWorkflowServer(PolymorphicAdapterMixin, CypherSnippetMixin, ToolPropo
                 except Exception as inst_err:
                     logger.error(f"Failed to create instance of {inc_class.__name__}: {inst_err}")
             except Exception as e:
-                logger.error(f"Failed to register incarnation {name}: {str(e)}")
-                logger.error(traceback.format_exc())
+                logger.exception(f"Failed to register incarnation {name}: {str(e)}")
 
         logger.info(f"Loaded {incarnation_count} incarnations successfully")
 
@@ -628,8 +658,7 @@ Please wait a moment for full initialization to complete or check connection sta
                     logger.error(f"No instance available for {incarnation_type}")
 
             except Exception as e:
-                logger.error(f"Error processing incarnation {incarnation_type}: {e}")
-                logger.error(traceback.format_exc())
+                logger.exception(f"Error processing incarnation {incarnation_type}: {e}")
 
         # Log final summary
         total_registered = core_count + total_incarnation_tools
@@ -648,45 +677,41 @@ Please wait a moment for full initialization to complete or check connection sta
             else:
                 return [types.TextContent(type="text", text="No incarnation is currently active. Use `switch_incarnation()` to set one.")]
         except Exception as e:
-            logger.error(f"Error getting current incarnation: {e}")
+            logger.exception("Error getting current incarnation: %s", e)
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
     async def list_incarnations(self) -> List[types.TextContent]:
         """List all available incarnations."""
         try:
-            incarnations = []
-            for inc_type, inc_class in self.incarnation_registry.items():
-                # Get the type value - handle both string and enum cases
-                type_value = inc_type
-                if hasattr(inc_type, "value") and not isinstance(inc_type, str):
-                    type_value = inc_type.value
-
-                incarnations.append(
-                    {
-                        "type": type_value,
-                        "description": inc_class.description if hasattr(inc_class, "description") else "No description available",
-                    }
-                )
-
-            if incarnations:
-                text = "# Available Incarnations\n\n"
-                text += "| Type | Description |\n"
-                text += "| ---- | ----------- |\n"
+            # The table only changes when an incarnation is registered
+            version = self._incarnation_list_version
+            if self._incarnation_table_cache is None or self._incarnation_table_cache[0] != version:
+                parts = []
+                for inc_type, inc_class in self.incarnation_registry.items():
+                    # Get the type value - handle both string and enum cases
+                    type_value = inc_type
+                    if hasattr(inc_type, "value") and not isinstance(inc_type, str):
+                        type_value = inc_type.value
+                    description = inc_class.description if hasattr(inc_class, "description") else "No description available"
+                    parts.append(f"| {type_value} | {description} |\n")
 
-                for inc in incarnations:
-                    text += f"| {inc['type']} | {inc['description']} |\n"
+                if parts:
+                    parts[:0] = ["# Available Incarnations\n\n", "| Type | Description |\n", "| ---- | ----------- |\n"]
+                self._incarnation_table_cache = (version, "".join(parts))
 
-                current = await self.get_current_incarnation_type()
-                if current:
-                    text += f"\nCurrently using: **{current}**"
-                else:
-                    text += "\nNo incarnation is currently active. Use `switch_incarnation()` to activate one."
+            table = self._incarnation_table_cache[1]
+            if not table:
+                return [types.TextContent(type="text", text="No incarnations are registered")]
 
-                return [types.TextContent(type="text", text=text)]
+            current = await self.get_current_incarnation_type()
+            if current:
+                footer = f"\nCurrently using: **{current}**"
             else:
-                return [types.TextContent(type="text", text="No incarnations are registered")]
+                footer = "\nNo incarnation is currently active. Use `switch_incarnation()` to activate one."
+
+            return [types.TextContent(type="text", text=table + footer)]
         except Exception as e:
-            logger.error(f"Error listing incarnations: {e}")
+            logger.exception("Error listing incarnations: %s", e)
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
     async def switch_incarnation(
@@ -695,18 +720,16 @@ Please wait a moment for full initialization to complete or check connection sta
     ) -> List[types.TextContent]:
         """Switch the server to a different incarnation."""
         try:
-            # Check if the incarnation type exists in the registry
-            available_types = list(self.incarnation_registry.keys())
-
-            if incarnation_type not in available_types:
-                available_types_str = ", ".join(available_types)
+            resolved_type = self.resolve_incarnation_type(incarnation_type)
+            if resolved_type is None:
+                # Only the failure message needs the list of registered types
+                available_types_str = ", ".join(self.incarnation_registry)
                 return [types.TextContent(type="text", text=f"Unknown incarnation type: '{incarnation_type}'. Available types: {available_types_str}")]
 
-            # Set the incarnation using the string directly
-            await self.set_incarnation(incarnation_type)
-            return [types.TextContent(type="text", text=f"Successfully switched to '{incarnation_type}' incarnation")]
+            await self.set_incarnation_with_timeout(resolved_type)
+            return [types.TextContent(type="text", text=f"Successfully switched to '{resolved_type}' incarnation")]
         except Exception as e:
-            logger.error(f"Error switching incarnation: {e}")
+            logger.exception("Error switching incarnation: %s", e)
             return [types.TextContent(type="text", text=f"Error: {e}")]
 
     def get_tool_descriptions(self) -> dict:
@@ -725,10 +748,13 @@ Please wait a moment for full initialization to complete or check connection sta
             "write_neo4j_cypher": "Execute a WRITE Cypher query (for creating/updating data)",
             "check_connection": "Check database connection status and permissions",
             # Cypher snippet toolkit
-            "list_cypher_snippets": "List all available Cypher snippets with optional filtering",
+            "list_cypher_snippets": "List all available Cypher snippets with optional filtering and tags",
             "get_cypher_snippet": "Get a specific Cypher snippet by ID",
-            "search_cypher_snippets": "Search for Cypher snippets by keyword, tag, or pattern",
+            "get_cypher_snippets": "Get several Cypher snippets by ID in one query",
+            "snippet_dashboard": "Show the Cypher snippet listing and tag overview together",
+            "search_cypher_snippets": "Search for Cypher snippets by keyword, substring, tag, or pattern",
             "create_cypher_snippet": "Add a new Cypher snippet to the database",
+            "create_cypher_snippets": "Add many Cypher snippets to the database in one transaction",
             "update_cypher_snippet": "Update an existing Cypher snippet",
             "delete_cypher_snippet": "Delete a Cypher snippet from the database",
             "get_cypher_tags": "Get all tags used for Cypher snippets",
@@ -773,8 +799,11 @@ Please wait a moment for full initialization to complete or check connection sta
             # Cypher snippet toolkit patterns
             "list_cypher_snippets": ["list cypher", "show snippets", "available cypher", "cypher commands"],
             "get_cypher_snippet": ["get cypher", "show cypher snippet", "display cypher", "view snippet"],
+            "get_cypher_snippets": ["get several snippets", "view snippets", "multiple cypher snippets"],
+            "snippet_dashboard": ["snippet overview", "snippet dashboard", "cypher overview"],
             "search_cypher_snippets": ["search cypher", "find cypher", "lookup cypher", "cypher syntax"],
             "create_cypher_snippet": ["add cypher", "new cypher", "create snippet", "add snippet"],
+            "create_cypher_snippets": ["import snippets", "bulk cypher", "add many snippets", "load snippets"],
             "update_cypher_snippet": ["update cypher", "modify cypher", "change snippet", "edit cypher"],
             "delete_cypher_snippet": ["delete cypher", "remove cypher", "drop snippet"],
             "get_cypher_tags": ["cypher tags", "snippet categories", "snippet tags"],
@@ -926,19 +955,19 @@ This is the default guidance hub. Use the commands above to explore the system's
                 query = """
                 MATCH (hub:AiGuidanceHub {id: 'main_hub'})
                 RETURN hub.description AS description
+                LIMIT 1
                 """
 
                 # Use a direct transaction to avoid scope issues
                 async def read_hub_description(tx):
                     result = await tx.run(query)
-                    values = await result.values()
-                    return values
+                    record = await result.single()
+                    return record["description"] if record else None
 
-                values = await session.execute_read(read_hub_description)
+                hub_content = await session.execute_read(read_hub_description)
 
-                if values and len(values) > 0 and values[0][0]:
+                if hub_content:
                     # Hub exists, get its content
-                    hub_content = values[0][0]
 
                     # Enhance with incarnation information
                     try:
@@ -1087,8 +1116,8 @@ This is the default guidance hub. Use the commands above to explore the system's
                 try:
                     # Test read access
                     read_result = await session.run("RETURN 'Connection works' as status")
-                    read_data = await read_result.data()
-                    if read_data and read_data[0]["status"] == "Connection works":
+                    read_record = await read_result.single()
+                    if read_record and read_record["status"] == "Connection works":
                         result["read_access"] = True
                         logger.info("Read access verified")
                     else:
@@ -1100,8 +1129,8 @@ This is the default guidance hub. Use the commands above to explore the system's
                 try:
                     # Test write access with a harmless write operation
                     write_result = await session.run("CREATE (t:TestNode {id: 'temp_test'}) WITH t DETACH DELETE t RETURN count(t) as deleted")
-                    write_data = await write_result.data()
-                    if write_data and write_data[0]["deleted"] == 1:
+                    write_record = await write_result.single()
+                    if write_record and write_record["deleted"] == 1:
                         result["write_access"] = True
                         logger.info("Write access verified")
                     else:
@@ -1114,7 +1143,7 @@ This is the default guidance hub. Use the commands above to explore the system's
                 # Get server info
                 try:
                     info_result = await session.run("CALL dbms.components() YIELD name, versions RETURN name, versions[0] as version")
-                    info_data = await info_result.data()
+                    info_data = [record.data() async for record in info_result]
                     if info_data:
                         result["server_info"] = info_data
                         logger.info(f"Server info retrieved: {len(info_data)} components")
@@ -1238,15 +1267,35 @@ This is the default guidance hub. Use the commands above to explore the system's
         try:
             from typing import cast, LiteralString
 
-            raw_results = await tx.run(cast(LiteralString, query), params or {})
-            eager_results = await raw_results.to_eager_result()
-            return json.dumps([r.data() for r in eager_results.records], default=str)
+            result = await tx.run(cast(LiteralString, query), params or {})
+            # Stream records straight into the output list instead of
+            # buffering an EagerResult first
+            return json.dumps([record.data() async for record in result], default=str)
         except Exception as e:
             logger.error(f"Error executing read query: {str(e)}")
             logger.debug(f"Failed query: {query}")
             logger.debug(f"Parameters: {params}")
             raise
 
+    async def _read_records(self, tx: AsyncManagedTransaction, query: str, params: dict) -> List[Dict[str, Any]]:
+        """Execute a read query and return its records as dictionaries.
+
+        Unlike _read_query, the records are streamed straight into dicts with no
+        JSON encode/decode round trip.
+
+        Args:
+            tx: Neo4j transaction
+            query: Cypher query to execute
+            params: Query parameters
+
+        Returns:
+            List of records as dictionaries
+        """
+        from typing import cast, LiteralString
+
+        result = await tx.run(cast(LiteralString, query), params or {})
+        return [record.data() async for record in result]
+
     async def _write(self, tx: AsyncManagedTransaction, query: str, params: dict):
         """Execute a write query and return result summary.
 
@@ -1288,16 +1337,7 @@ This is the default guidance hub. Use the commands above to explore the system's
         try:
             async with safe_neo4j_session(self.driver, self.database or "neo4j") as session:
                 # Execute inside a read transaction
-                result_json = await session.execute_read(
-                    lambda tx: self._read_query(tx, query, params)  # type: ignore
-                )
-
-                # Parse the result safely
-                try:
-                    return json.loads(result_json)
-                except json.JSONDecodeError:
-                    logger.error("Failed to decode JSON result")
-                    return []
+                return await session.execute_read(self._read_records, query, params)
         except Exception as e:
             logger.error(f"Error in safe read execution: {str(e)}")
             return []
@@ -1321,11 +1361,7 @@ This is the default guidance hub. Use the commands above to explore the system's
         try:
             async with safe_neo4j_session(self.driver, self.database or "neo4j") as session:
                 # Execute inside a write transaction
-                from typing import Callable
-
-                await session.execute_write(
-                    Callable[[neo4j.AsyncManagedTransaction], Awaitable[Any]](lambda tx: self._write(tx, query, params))  # type: ignore
-                )
+                await session.execute_write(self._write, query, params)
                 return True
         except Exception as e:
             logger.error(f"Error in safe write execution: {str(e)}")
@@ -1396,8 +1432,7 @@ This is the default guidance hub. Use the commands above to explore the system's
 
         try:
             async with safe_neo4j_session(self.driver, self.database or "neo4j") as session:
-                # Fixed: Use lambda directly without wrapping in Callable
-                results_json = await session.execute_read(lambda tx: self._read_query(tx, query, params))
+                results_json = await session.execute_read(self._read_query, query, params)
                 return [types.TextContent(type="text", text=results_json)]
         except Exception as e:
             logger.error(f"Error executing custom query: {e}")
@@ -1420,8 +1455,7 @@ This is the default guidance hub. Use the commands above to explore the system's
 
         try:
             async with safe_neo4j_session(self.driver, self.database or "neo4j") as session:
-                # Fixed: Use lambda directly without wrapping in Callable
-                result = await session.execute_write(lambda tx: self._write(tx, query, params))
+                result = await session.execute_write(self._write, query, params)
 
                 # Format a summary of what happened
                 response = "Query executed successfully.\n\n"
@@ -1493,14 +1527,10 @@ Each incarnation has its own set of specialized tools alongside the core Neo4j i
         try:
             # Try to create the hub node using safe session manager
             async with safe_neo4j_session(self.driver, self.database or "neo4j") as session:
-                query = """
-                CREATE (hub:AiGuidanceHub {id: 'main_hub', description: $description, created: datetime()})
-                RETURN hub.description AS description
-                """
 
                 # Use a direct transaction to avoid scope issues
                 async def create_hub(tx):
-                    result = await tx.run(query, {"description": default_description})
+                    result = await tx.run(CREATE_MAIN_HUB_QUERY, {"description": default_description})
                     values = await result.values()
                     return values
 
@@ -1575,10 +1605,7 @@ Each incarnation has its own set of specialized tools alongside the core Neo4j i
 
             return True
         except Exception as e:
-            logger.error(f"Error during initialization: {e}")
-            import traceback
-
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error during initialization: {e}")
             logger.info("Basic MCP handlers are still registered, so the server will respond to protocol requests")
             return False
 
@@ -1713,6 +1740,11 @@ def main():
         logger.info("Starting NeoCoder Neo4j Workflow Server")
         cleanup_zombie_instances()
 
+        # Select the loop implementation before any event loop is created
+        from .event_loop_manager import install_event_loop_policy
+
+        install_event_loop_policy()
+
         # 2. Load configuration from .env file if available
         try:
             from dotenv import load_dotenv
@@ -1821,9 +1853,9 @@ async def test_server_initialization(db_url: str, username: str, password: str,
         # Test connection
         logger.info("Testing Neo4j connection")
         async with safe_neo4j_session(driver, database) as session:
-            result = await session.run("RETURN 1 as success")
-            data = await result.data()
-            if not data or data[0]["success"] != 1:
+            result = await session.run("RETURN 1 AS ok")
+            record = await result.single()
+            if not record or record["ok"] != 1:
                 logger.error("Basic Neo4j connectivity test failed")
                 return False
 
@@ -281,6 +281,32 @@ class ToolRegistry:
         """Get the full docstring for a tool."""
         return self.tool_full_docs.get(tool_name, "No description available.")
 
+    def is_class_registered(self, obj: Any) -> bool:
+        """Return True if register_class_tools has registered tools from obj."""
+        return f"{obj.__class__.__name__}@{id(obj)}" in self.registered_classes
+
+    def unregister_class_tools(self, obj: Any) -> None:
+        """Remove the tools that register_class_tools registered from obj.
+
+        Args:
+            obj: The class instance whose tool methods should be removed.
+        """
+        class_id = f"{obj.__class__.__name__}@{id(obj)}"
+        if class_id not in self.registered_classes:
+            return
+
+        for tool_name, tool_func in list(self.tools.items()):
+            if getattr(tool_func, "__self__", None) is not obj:
+                continue
+            del self.tools[tool_name]
+            self.tool_descriptions.pop(tool_name, None)
+            self.tool_full_docs.pop(tool_name, None)
+            for names in self.tool_categories.values():
+                names.discard(tool_name)
+
+        self.registered_classes.discard(class_id)
+        logger.info(f"Unregistered tools from class {obj.__class__.__name__}")
+
     def clear_category(self, category: str) -> None:
         """Remove all tools in a category.
 
@@ -0,0 +1,58 @@
+"""
+Tests for the memory-aware scheduling helpers in data/scripts/batch_processor.py.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "data" / "scripts" / "batch_processor.py"
+MB = 1024 * 1024
+
+
+@pytest.fixture(scope="module")
+def batch_processor(tmp_path_factory):
+    """Load the batch processor script, keeping its log file out of the repo."""
+    monkeypatch = pytest.MonkeyPatch()
+    monkeypatch.chdir(tmp_path_factory.mktemp("batch_processor"))
+    try:
+        spec = importlib.util.spec_from_file_location("batch_processor_script", SCRIPT)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        monkeypatch.undo()
+    return module
+
+
+def test_estimate_memory_floor(batch_processor, tmp_path):
+    """Small and missing files are estimated at the memory floor."""
+    small = tmp_path / "small.csv"
+    small.write_text("a,b\n1,2\n")
+    assert batch_processor._estimate_memory(small) == batch_processor.MEMORY_FLOOR_BYTES
+    assert batch_processor._estimate_memory(tmp_path / "missing.csv") == batch_processor.MEMORY_FLOOR_BYTES
+
+
+def test_estimate_memory_scales_with_size(batch_processor, tmp_path):
+    """Large files are estimated as a multiple of their size."""
+    large = tmp_path / "large.csv"
+    size = 100 * MB
+    with open(large, "wb") as f:
+        f.truncate(size)
+    assert batch_processor._estimate_memory(large) == size * batch_processor.MEMORY_PER_INPUT_BYTE
+
+
+def test_first_file_always_fits(batch_processor):
+    """With nothing in flight, a file starts even if it exceeds the budget."""
+    assert batch_processor._fits_memory_budget(2048 * MB, 0, 0, 1024 * MB)
+
+
+def test_file_fits_next_to_inflight(batch_processor):
+    """A file starts when its estimate fits next to the in-flight files."""
+    assert batch_processor._fits_memory_budget(256 * MB, 2, 512 * MB, 1024 * MB)
+    assert batch_processor._fits_memory_budget(512 * MB, 2, 512 * MB, 1024 * MB)
+
+
+def test_file_waits_when_budget_exhausted(batch_processor):
+    """A file waits when it would push the in-flight total over the budget."""
+    assert not batch_processor._fits_memory_budget(513 * MB, 2, 512 * MB, 1024 * MB)
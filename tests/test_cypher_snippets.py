@@ -0,0 +1,65 @@
+"""
+Tests for the query-building helpers in the Cypher snippet toolkit.
+"""
+
+from mcp_neocoder.cypher_snippets import _build_update_query, lucene_escape, to_prefix_query
+
+
+def test_lucene_escape_plain_text_unchanged():
+    """Text without Lucene operators is passed through as-is."""
+    assert lucene_escape("match node") == "match node"
+
+
+def test_lucene_escape_special_characters():
+    """Every Lucene operator character is backslash-escaped."""
+    assert lucene_escape("a+b") == "a\\+b"
+    assert lucene_escape("(n)-[:R]->(m)") == "\\(n\\)\\-\\[\\:R\\]\\->\\(m\\)"
+    assert lucene_escape('"quoted" ~fuzzy^2') == '\\"quoted\\" \\~fuzzy\\^2'
+    assert lucene_escape("a && b || !c") == "a \\&\\& b \\|\\| \\!c"
+    assert lucene_escape("path/to\\file") == "path\\/to\\\\file"
+
+
+def test_to_prefix_query_joins_words():
+    """Each word becomes an escaped prefix term, all of them required."""
+    assert to_prefix_query("merge node") == "merge* AND node*"
+    assert to_prefix_query("  shortest   path ") == "shortest* AND path*"
+    assert to_prefix_query("a:b") == "a\\:b*"
+
+
+def test_to_prefix_query_empty():
+    """Blank input produces an empty query."""
+    assert to_prefix_query("   ") == ""
+
+
+def test_build_update_query_sets_only_given_fields():
+    """Only the fields being updated appear in the SET clause."""
+    query = _build_update_query(frozenset({"name"}), False)
+    assert "c.lastUpdated = $ts" in query
+    assert "c.name = $name" in query
+    assert "c.syntax" not in query
+    assert "TAGGED_AS" not in query
+
+
+def test_build_update_query_keeps_lowercase_copies_in_step():
+    """Updating syntax or description also refreshes the lowercased search copies."""
+    query = _build_update_query(frozenset({"syntax", "description"}), False)
+    assert "c.syntax = $syntax" in query
+    assert "c.syntax_lc = toLower($syntax)" in query
+    assert "c.description_lc = toLower($description)" in query
+
+
+def test_build_update_query_field_order_is_stable():
+    """The same fields always produce the same query text."""
+    first = _build_update_query(frozenset({"since", "name", "example"}), False)
+    second = _build_update_query(frozenset({"example", "since", "name"}), False)
+    assert first == second
+    assert first.index("c.name") < first.index("c.example") < first.index("c.since")
+
+
+def test_build_update_query_with_tags():
+    """Tag updates diff against the existing tags."""
+    query = _build_update_query(frozenset(), True)
+    assert "$tag_list" in query
+    assert "DELETE rel" in query
+    assert "MERGE (c)-[:TAGGED_AS]->(t)" in query
+    assert query.rstrip().endswith("RETURN c.id AS id, c.name AS name")
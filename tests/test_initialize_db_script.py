@@ -0,0 +1,54 @@
+"""
+Tests for the Cypher script splitter in archive/initialize_db.py.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parent.parent / "archive" / "initialize_db.py"
+
+
+@pytest.fixture(scope="module")
+def split_cypher():
+    """Load _split_cypher from the standalone initializer script."""
+    spec = importlib.util.spec_from_file_location("initialize_db_script", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module._split_cypher
+
+
+def test_split_on_top_level_semicolons(split_cypher):
+    """Statements are split on semicolons and stripped."""
+    assert split_cypher("RETURN 1;\nRETURN 2;") == ["RETURN 1", "RETURN 2"]
+
+
+def test_split_without_trailing_semicolon(split_cypher):
+    """A final statement without a semicolon is kept."""
+    assert split_cypher("RETURN 1; RETURN 2") == ["RETURN 1", "RETURN 2"]
+
+
+def test_split_ignores_semicolons_in_strings(split_cypher):
+    """Semicolons inside quotes and backticks do not split."""
+    text = "CREATE (n {a: 'x;y', b: \"p;q\"}); MATCH (`we;ird`) RETURN 1"
+    assert split_cypher(text) == [
+        "CREATE (n {a: 'x;y', b: \"p;q\"})",
+        "MATCH (`we;ird`) RETURN 1",
+    ]
+
+
+def test_split_handles_escaped_quotes(split_cypher):
+    """An escaped quote does not end the string."""
+    assert split_cypher("RETURN 'it\\'s; fine'; RETURN 2") == ["RETURN 'it\\'s; fine'", "RETURN 2"]
+
+
+def test_split_drops_comments(split_cypher):
+    """Line and block comments are removed, including semicolons inside them."""
+    text = "// header; comment\nRETURN 1; /* block; comment */ RETURN 2;\n// trailing comment"
+    assert split_cypher(text) == ["RETURN 1", "RETURN 2"]
+
+
+def test_split_drops_blank_statements(split_cypher):
+    """Empty statements between semicolons are skipped."""
+    assert split_cypher(";;  ;\n") == []
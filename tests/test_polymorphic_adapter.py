@@ -0,0 +1,58 @@
+"""
+Tests for incarnation name resolution in the polymorphic adapter.
+"""
+
+import pytest
+
+from mcp_neocoder.polymorphic_adapter import PolymorphicAdapterMixin
+
+
+class KnowledgeGraph:
+    pass
+
+
+class ResearchOrchestration:
+    pass
+
+
+class DataAnalysis:
+    pass
+
+
+@pytest.fixture
+def adapter():
+    """Create an adapter with a few registered incarnations."""
+    adapter = PolymorphicAdapterMixin()
+    adapter.register_incarnation("knowledge_graph", KnowledgeGraph)
+    adapter.register_incarnation("research_orchestration", ResearchOrchestration)
+    adapter.register_incarnation("data_analysis", DataAnalysis)
+    return adapter
+
+
+def test_resolve_exact_key(adapter):
+    """A registered key resolves to itself."""
+    assert adapter.resolve_incarnation_type("knowledge_graph") == "knowledge_graph"
+
+
+@pytest.mark.parametrize("name", ["Knowledge Graph", "knowledge-graph", "KNOWLEDGE_GRAPH", "knowledgegraph"])
+def test_resolve_ignores_case_and_separators(adapter, name):
+    """Case and '_', '-' or ' ' separators do not matter."""
+    assert adapter.resolve_incarnation_type(name) == "knowledge_graph"
+
+
+def test_resolve_first_word_alias(adapter):
+    """The first word of an incarnation name is an alias for it."""
+    assert adapter.resolve_incarnation_type("research") == "research_orchestration"
+    assert adapter.resolve_incarnation_type("Data") == "data_analysis"
+
+
+def test_resolve_typo_uses_closest_match(adapter):
+    """Misspelled names fall back to the closest alias."""
+    assert adapter.resolve_incarnation_type("knowlege_graph") == "knowledge_graph"
+    assert adapter.resolve_incarnation_type("reserch") == "research_orchestration"
+
+
+def test_resolve_unknown_returns_none(adapter):
+    """Names that are not close to any alias do not resolve."""
+    assert adapter.resolve_incarnation_type("spreadsheet") is None
+    assert adapter.resolve_incarnation_type("") is None